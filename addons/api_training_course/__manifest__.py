@@ -1,6 +1,6 @@
 {
     'name': 'API Training Course - Backend Development',
-    'version': '18.0.1.0.0',
+    'version': '18.0.1.1.0',
     'category': 'Education/Training',
     'summary': 'Complete Backend API Development Training Course',
     'description': """
@@ -47,10 +47,11 @@
     """,
     'author': 'API Training Team',
     'website': 'https://github.com/yourusername/api-training',
-    'depends': ['base', 'web', 'mail'],
+    'depends': ['base', 'web', 'bus', 'mail'],
     'data': [
         'security/ir.model.access.csv',
         'views/api_training_menu.xml',
+        'data/ir_cron_data.xml',
         'data/demo_data.xml',
     ],
     'demo': [
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+Avatar Images - Training Example
+
+This module demonstrates:
+- Copying an upload in chunks with a hard size limit
+- Detecting the image format from magic bytes instead of the file name
+- Deriving fixed-size thumbnails once, at upload time
+
+By the time a controller sees an upload, werkzeug has already parsed the
+multipart body and spooled the file (to a temporary file beyond 500KB);
+only Odoo's global max_content_length bounds that. A declared
+Content-Length over MAX_UPLOAD_SIZE is refused before parsing (see
+ir.http); a chunked body is not. read_upload then copies at most
+MAX_AVATAR_SIZE bytes of the spooled file into memory, rejecting larger
+files as soon as the limit is passed, and requires the file to start with
+a known image signature. The image is cropped to a square and stored as
+WebP variants of AVATAR_SIZES pixels, so serving an avatar never resizes
+or re-encodes anything.
+
+This module has no Odoo imports; Pillow is a dependency of Odoo itself.
+"""
+
+import hashlib
+import io
+
+from PIL import Image, ImageOps
+
+# Largest accepted image file
+MAX_AVATAR_SIZE = 2 * 1024 * 1024
+
+# Largest declared request body: the image plus multipart framing
+MAX_UPLOAD_SIZE = MAX_AVATAR_SIZE + 64 * 1024
+
+READ_CHUNK_SIZE = 64 * 1024
+
+# Decompression bomb guard (a small file can decode to a huge bitmap)
+MAX_AVATAR_PIXELS = 25 * 1000 * 1000
+
+# Square thumbnail sizes in pixels, largest first
+AVATAR_SIZES = (512, 128, 64)
+
+AVATAR_MIMETYPE = 'image/webp'
+WEBP_QUALITY = 80
+
+# Bytes needed to recognize any supported format (WebP: RIFF....WEBP)
+SIGNATURE_SIZE = 12
+
+_SIGNATURES = [
+    (b'\x89PNG\r\n\x1a\n', 'png'),
+    (b'\xff\xd8\xff', 'jpeg'),
+    (b'GIF87a', 'gif'),
+    (b'GIF89a', 'gif'),
+]
+
+
+class AvatarTooLarge(ValueError):
+    """The upload exceeds MAX_AVATAR_SIZE"""
+
+
+def detect_format(head):
+    """Image format ('png', 'jpeg', 'gif', 'webp') of the first bytes, or None"""
+    for signature, image_format in _SIGNATURES:
+        if head.startswith(signature):
+            return image_format
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'webp'
+    return None
+
+
+def read_upload(stream, max_size=MAX_AVATAR_SIZE, chunk_size=READ_CHUNK_SIZE):
+    """
+    Copy an uploaded image stream into memory, chunk by chunk
+
+    The signature is checked once SIGNATURE_SIZE bytes are in, however
+    short the stream's reads are. Raises ValueError when the file is not a
+    supported image and AvatarTooLarge as soon as more than max_size bytes
+    have been read.
+    """
+    chunks = []
+    size = 0
+    head = b''
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        if len(head) < SIGNATURE_SIZE:
+            head += chunk[:SIGNATURE_SIZE - len(head)]
+            if len(head) == SIGNATURE_SIZE and detect_format(head) is None:
+                raise ValueError('Invalid file type. Allowed: JPG, PNG, GIF, WebP')
+        size += len(chunk)
+        if size > max_size:
+            raise AvatarTooLarge(f'File too large. Maximum size: {max_size // (1024 * 1024)}MB')
+        chunks.append(chunk)
+    if not chunks:
+        raise ValueError('Empty file')
+    if len(head) < SIGNATURE_SIZE and detect_format(head) is None:
+        raise ValueError('Invalid file type. Allowed: JPG, PNG, GIF, WebP')
+    return b''.join(chunks)
+
+
+def content_hash(data):
+    """Short content hash, used in immutable avatar URLs"""
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def make_variants(data):
+    """
+    Square WebP thumbnails of an image: {size: bytes} for AVATAR_SIZES
+
+    Images are center-cropped and only ever scaled down; an image smaller
+    than a size is stored at its own resolution. Raises ValueError for
+    unsupported, corrupt or oversized images.
+    """
+    if detect_format(data[:SIGNATURE_SIZE]) is None:
+        raise ValueError('Invalid file type. Allowed: JPG, PNG, GIF, WebP')
+    try:
+        image = Image.open(io.BytesIO(data))
+        if image.width * image.height > MAX_AVATAR_PIXELS:
+            raise ValueError('Image resolution too large')
+        # JPEG: let the decoder downscale by up to 8x while decoding
+        image.draft('RGB', (AVATAR_SIZES[0], AVATAR_SIZES[0]))
+        image = ImageOps.exif_transpose(image)
+        image = image.convert('RGBA' if 'A' in image.getbands() or 'transparency' in image.info else 'RGB')
+    except (OSError, Image.DecompressionBombError) as e:
+        raise ValueError(f'Invalid image: {e}')
+
+    side = min(image.size)
+    image = ImageOps.fit(image, (side, side), Image.LANCZOS)
+
+    variants = {}
+    for size in AVATAR_SIZES:
+        if image.width > size:
+            image = image.resize((size, size), Image.LANCZOS)
+        output = io.BytesIO()
+        image.save(output, 'WEBP', quality=WEBP_QUALITY)
+        variants[size] = output.getvalue()
+    return variants
@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks of the API Training Course addon
+
+Not imported by the addon itself. Scripts that need the ORM expose a
+run(env) function for odoo shell, e.g.:
+
+    >>> from odoo.addons.api_training_course.benchmarks import bench_fast_write
+    >>> bench_fast_write.run(env)
+"""
@@ -0,0 +1,371 @@
+# -*- coding: utf-8 -*-
+"""
+Endpoint Benchmark and Regression Suite - Training Example
+
+Drives every /api/training/* route of a running Odoo server over HTTP and
+records, per route:
+
+- latency percentiles (p50/p95/p99) and throughput at a given concurrency
+- error rate (HTTP status >= 400 or a JSON-RPC error)
+- SQL statements per request (X-Query-Count, sent to admins asking with
+  X-Api-Profile: 1)
+- bytes per response
+
+Measured requests are sent the way real clients send them: anonymously
+for public routes, with the session cookie otherwise, and without asking
+for profiling headers. Query counts come from a few extra profiled
+requests sent as the logged-in user after the measured ones.
+
+GET requests carry Cache-Control: no-cache by default, which makes the
+public blog routes bypass their response cache (see
+BlogApiController._cached_response): the measurements cover the real
+query path, not the cache. Use --cache to measure cached responses.
+
+Routes are discovered from /api/training/openapi.json, so new endpoints
+are benchmarked without changing this script. Path parameters are filled
+with ids found through the API itself. Write routes only run with
+--writes; they add data, so use a throwaway database.
+
+With --sizes, the database is seeded through odoo shell with the
+scale_data presets (ascending, e.g. small,medium) and every route is
+measured at each size. The JSON report can be compared with a stored
+baseline: the script exits with status 1 when a route's p95 latency,
+queries or response size grew beyond --threshold, or when its error rate
+grew at all.
+
+It only needs the Python standard library.
+
+Usage:
+    python3 benchmarks/bench_endpoints.py --url http://localhost:8069 --db odoo \\
+        --login admin --password admin --concurrency 4 --requests 200 \\
+        --output report.json [--baseline baseline.json --threshold 0.2] \\
+        [--sizes small,medium --odoo-bin odoo-bin --odoo-config /etc/odoo/odoo.conf]
+"""
+
+import argparse
+import concurrent.futures
+import datetime
+import json
+import math
+import re
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+# Query parameters a route needs to do representative work
+ROUTE_PARAMS = {
+    '/api/training/blog/posts/search': {'q': 'api'},
+    '/api/training/users/search': {'q': 'a'},
+}
+
+# JSON-RPC params of the write routes run with --writes
+WRITE_PARAMS = {
+    ('POST', '/api/training/blog/posts'): {'title': 'Benchmark post', 'content': '<p>Benchmark content</p>'},
+    ('PUT', '/api/training/blog/posts/{post_id}'): {'tags': 'benchmark'},
+    ('POST', '/api/training/blog/posts/{post_id}/like'): {},
+    ('POST', '/api/training/tasks'): {'name': 'Benchmark task'},
+    ('PUT', '/api/training/tasks/{task_id}'): {'progress': 50},
+    ('POST', '/api/training/tasks/{task_id}/start'): {},
+    ('POST', '/api/training/tasks/{task_id}/complete'): {},
+    ('POST', '/api/training/tasks/{task_id}/cancel'): {},
+    ('PUT', '/api/training/users/profile'): {'bio': 'Benchmark bio'},
+}
+
+# Routes returning whole tables: fewer requests each
+HEAVY_ROUTES = {'/api/training/blog/posts/export', '/api/training/tasks/export'}
+
+# Regression checks: metric -> smallest absolute increase that counts
+REGRESSION_METRICS = {'p95_ms': 2.0, 'queries_per_request': 1.0, 'bytes_per_response': 1024}
+
+# Profiled requests per route giving the query count
+QUERY_SAMPLES = 3
+
+SEED_SCRIPT = """
+from odoo.addons.api_training_course.benchmarks import scale_data
+target = scale_data.SIZES[{size!r}]
+previous = scale_data.SIZES.get({previous!r}, dict(users=0, posts=0, tasks=0))
+scale_data.generate(env, users=target['users'], posts=target['posts'] - previous['posts'],
+                    tasks=target['tasks'] - previous['tasks'], seed={seed!r})
+env.cr.commit()
+"""
+
+
+# ========== HTTP Client ==========
+
+class Client:
+    """Minimal HTTP client keeping an Odoo session cookie"""
+
+    def __init__(self, base_url, timeout=60):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.cookie = None
+        self.uid = None
+
+    def request(self, method, path, query=None, json_params=None, anonymous=False, profile=False, no_cache=False):
+        """(status, body, headers, seconds) of one request"""
+        url = self.base_url + path
+        if query:
+            url += '?' + urllib.parse.urlencode(query)
+        headers = {}
+        if profile:
+            headers['X-Api-Profile'] = '1'
+        if no_cache:
+            headers['Cache-Control'] = 'no-cache'
+        if self.cookie and not anonymous:
+            headers['Cookie'] = self.cookie
+        data = None
+        if json_params is not None:
+            data = json.dumps({'jsonrpc': '2.0', 'method': 'call', 'params': json_params}).encode()
+            headers['Content-Type'] = 'application/json'
+
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, data, headers, method=method), timeout=self.timeout) as response:
+                status, body, response_headers = response.status, response.read(), response.headers
+        except urllib.error.HTTPError as e:
+            status, body, response_headers = e.code, e.read(), e.headers
+        return status, body, response_headers, time.perf_counter() - started
+
+    def get_json(self, path, query=None):
+        status, body, _headers, _seconds = self.request('GET', path, query)
+        return json.loads(body) if status == 200 else None
+
+    def login(self, db, login, password):
+        status, body, headers, _seconds = self.request(
+            'POST', '/web/session/authenticate', json_params={'db': db, 'login': login, 'password': password},
+        )
+        result = json.loads(body).get('result') if status == 200 else None
+        cookie = re.search(r'session_id=([^;]+)', headers.get('Set-Cookie', ''))
+        if not result or not result.get('uid') or not cookie:
+            raise SystemExit(f'Login failed for {login}')
+        self.cookie = f'session_id={cookie.group(1)}'
+        self.uid = result['uid']
+
+
+# ========== Routes ==========
+
+def _first_id(payload, key):
+    items = ((payload or {}).get('data') or {}).get(key) or []
+    return items[0]['id'] if items else None
+
+
+def discover_fixtures(client):
+    """Values of the path parameters, found through the API"""
+    fixtures = {
+        'user_id': client.uid,
+        'post_id': _first_id(client.get_json('/api/training/blog/posts', {'limit': 1, 'fields': 'id'}), 'posts'),
+        'task_id': _first_id(client.get_json('/api/training/tasks', {'limit': 1, 'fields': 'id'}), 'tasks'),
+    }
+    profile = client.get_json('/api/training/users/profile', {'fields': 'id,avatars'})
+    avatars = (((profile or {}).get('data') or {}).get('profile') or {}).get('avatars')
+    if avatars:
+        size, url = next(iter(avatars.items()))
+        fixtures.update(size=size, unique=url.rsplit('/', 1)[1])
+    return {name: value for name, value in fixtures.items() if value is not None}
+
+
+def discover_routes(client, fixtures, writes=False, only=None, exclude=None):
+    """(operations, skipped) from the server's OpenAPI document"""
+    document = client.get_json('/api/training/openapi.json')
+    if not document:
+        raise SystemExit('Cannot load /api/training/openapi.json')
+
+    operations, skipped = [], {}
+    for template, methods in sorted(document['paths'].items()):
+        for method, operation in sorted(methods.items()):
+            method = method.upper()
+            key = f'{method} {template}'
+            if (only and not re.search(only, key)) or (exclude and re.search(exclude, key)):
+                continue
+            is_json = 'requestBody' in operation
+            is_public = not operation.get('security')
+            if method != 'GET' or is_json:
+                if not writes:
+                    skipped[key] = 'write route (use --writes)'
+                    continue
+                if (method, template) not in WRITE_PARAMS:
+                    skipped[key] = 'no benchmark payload'
+                    continue
+            try:
+                path = template.format(**fixtures)
+            except KeyError as e:
+                skipped[key] = f'no value for path parameter {e}'
+                continue
+            operations.append({
+                'key': key,
+                'method': method,
+                'path': path,
+                'query': ROUTE_PARAMS.get(template),
+                'json_params': WRITE_PARAMS.get((method, template), {}) if is_json else None,
+                'heavy': template in HEAVY_ROUTES,
+                'public': is_public,
+            })
+    return operations, skipped
+
+
+# ========== Measurement ==========
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an ascending list"""
+    index = max(0, math.ceil(q / 100 * len(sorted_values)) - 1)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+def bench_operation(client, operation, requests, concurrency, warmup, use_cache=False):
+    """Latency, throughput, errors, queries and size statistics of one route"""
+    no_cache = operation['method'] == 'GET' and not use_cache
+
+    def call(_index, profile=False):
+        return client.request(
+            operation['method'], operation['path'], operation['query'], operation['json_params'],
+            anonymous=operation['public'] and not profile, profile=profile, no_cache=no_cache,
+        )
+
+    for index in range(warmup):
+        call(index)
+
+    started = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(concurrency) as pool:
+        samples = list(pool.map(call, range(requests)))
+    wall_time = time.perf_counter() - started
+
+    profiled = [call(index, profile=True) for index in range(QUERY_SAMPLES)]
+
+    latencies = sorted(seconds * 1000 for _status, _body, _headers, seconds in samples)
+    query_counts = [int(headers['X-Query-Count']) for _status, _body, headers, _seconds in profiled if headers.get('X-Query-Count')]
+    errors = sum(
+        1 for status, body, _headers, _seconds in samples
+        if status >= 400 or (operation['json_params'] is not None and b'"error"' in body[:200])
+    )
+    return {
+        'requests': requests,
+        'errors': errors,
+        'error_rate': round(errors / requests, 4),
+        'p50_ms': round(percentile(latencies, 50), 2),
+        'p95_ms': round(percentile(latencies, 95), 2),
+        'p99_ms': round(percentile(latencies, 99), 2),
+        'throughput_rps': round(requests / wall_time, 1),
+        'queries_per_request': round(sum(query_counts) / len(query_counts), 1) if query_counts else None,
+        'bytes_per_response': round(sum(len(body) for _status, body, _headers, _seconds in samples) / requests),
+    }
+
+
+def run_suite(client, operations, requests, concurrency, warmup, use_cache=False):
+    results = {}
+    for operation in operations:
+        count = max(concurrency, requests // 10) if operation['heavy'] else requests
+        results[operation['key']] = stats = bench_operation(client, operation, count, concurrency, warmup, use_cache)
+        print(
+            f'{operation["key"]:<70} p50 {stats["p50_ms"]:8.2f}  p95 {stats["p95_ms"]:8.2f}'
+            f'  p99 {stats["p99_ms"]:8.2f} ms  {stats["throughput_rps"]:7.1f} req/s'
+            f'  {stats["queries_per_request"] if stats["queries_per_request"] is not None else "-":>5} q'
+            f'  {stats["bytes_per_response"]:>8} B{"  ERRORS: " + str(stats["errors"]) if stats["errors"] else ""}'
+        )
+    return results
+
+
+def seed(args, size, previous):
+    """Grow the database to a scale_data preset through odoo shell"""
+    command = [args.odoo_bin, 'shell', '-d', args.db, '--no-http', '--log-level=warn']
+    if args.odoo_config:
+        command += ['-c', args.odoo_config]
+    script = SEED_SCRIPT.format(size=size, previous=previous, seed=args.seed)
+    print(f'Seeding {args.db} to size {size!r}...')
+    subprocess.run(command, input=script, text=True, check=True)
+
+
+# ========== Baseline Comparison ==========
+
+def compare(report, baseline, threshold):
+    """Regressions of report against baseline, as a list of dicts"""
+    regressions = []
+    for size, routes in report['results'].items():
+        baseline_routes = baseline.get('results', {}).get(size, {})
+        for key, current in routes.items():
+            previous = baseline_routes.get(key)
+            if not previous:
+                continue
+            # Any new failure is a regression: fast errors must not pass as a speedup
+            old_rate, new_rate = previous.get('error_rate', 0.0), current.get('error_rate', 0.0)
+            if new_rate > old_rate:
+                regressions.append({'size': size, 'route': key, 'metric': 'error_rate', 'baseline': old_rate, 'current': new_rate})
+            for metric, min_delta in REGRESSION_METRICS.items():
+                old, new = previous.get(metric), current.get(metric)
+                if old is None or new is None:
+                    continue
+                if new > old * (1 + threshold) and new - old >= min_delta:
+                    regressions.append({'size': size, 'route': key, 'metric': metric, 'baseline': old, 'current': new})
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--url', default='http://localhost:8069')
+    parser.add_argument('--db', required=True)
+    parser.add_argument('--login', default='admin')
+    parser.add_argument('--password', default='admin')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=200, help='measured requests per route')
+    parser.add_argument('--warmup', type=int, default=5, help='unmeasured requests per route')
+    parser.add_argument('--only', help='regex: benchmark matching "METHOD /path" keys only')
+    parser.add_argument('--exclude', help='regex: skip matching "METHOD /path" keys')
+    parser.add_argument('--writes', action='store_true', help='also run write routes (adds data)')
+    parser.add_argument('--cache', action='store_true', help='let public GET routes answer from their response cache')
+    parser.add_argument('--sizes', help='scale_data presets to seed and measure, ascending (e.g. small,medium)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--odoo-bin', default='odoo-bin')
+    parser.add_argument('--odoo-config')
+    parser.add_argument('--output', default='bench_report.json')
+    parser.add_argument('--baseline', help='report to compare with')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed relative increase (0.2 = 20%%)')
+    args = parser.parse_args(argv)
+
+    client = Client(args.url)
+    client.login(args.db, args.login, args.password)
+
+    report = {
+        'meta': {
+            'url': args.url,
+            'db': args.db,
+            'concurrency': args.concurrency,
+            'requests': args.requests,
+            'response_cache': args.cache,
+            'started': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        },
+        'skipped': {},
+        'results': {},
+    }
+
+    previous = None
+    for size in (args.sizes.split(',') if args.sizes else ['current']):
+        if args.sizes:
+            seed(args, size, previous)
+            previous = size
+        operations, report['skipped'] = discover_routes(
+            client, discover_fixtures(client), writes=args.writes, only=args.only, exclude=args.exclude,
+        )
+        print(f'\n== {size}: {len(operations)} routes, concurrency {args.concurrency} ==')
+        report['results'][size] = run_suite(client, operations, args.requests, args.concurrency, args.warmup, args.cache)
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            report['regressions'] = compare(report, json.load(baseline_file), args.threshold)
+        for regression in report['regressions']:
+            print(
+                f'REGRESSION [{regression["size"]}] {regression["route"]}: {regression["metric"]}'
+                f' {regression["baseline"]} -> {regression["current"]}'
+            )
+        status = 1 if report['regressions'] else 0
+
+    with open(args.output, 'w') as output_file:
+        json.dump(report, output_file, indent=2, sort_keys=True)
+    print(f'\nReport written to {args.output}')
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Fast Write Benchmark - Training Example
+
+Compares the regular ORM write() with the fast-write API
+(api.fast.write.mixin) on the hot-path writes of the API:
+
+- last login timestamp of a profile (GET /api/training/users/profile)
+- view counter of a blog post (view-hit flush)
+
+Each iteration is flushed so the SQL is included in the timing. All
+changes are rolled back at the end.
+
+Usage (odoo shell -d <database>):
+    >>> from odoo.addons.api_training_course.benchmarks import bench_fast_write
+    >>> bench_fast_write.run(env, iterations=500)
+"""
+
+import time
+
+from odoo import fields
+
+
+def _measure(env, func, iterations):
+    """(seconds per call, SQL statements per call)"""
+    cr = env.cr
+    func()
+    env.flush_all()
+    queries_before = cr.sql_log_count
+    started = time.perf_counter()
+    for _i in range(iterations):
+        func()
+        env.flush_all()
+    elapsed = time.perf_counter() - started
+    return elapsed / iterations, (cr.sql_log_count - queries_before) / iterations
+
+
+def run(env, iterations=500):
+    env = env(su=True)
+    post = env['api.blog.post'].search([], limit=1)
+    profile = env['api.user.profile'].search([], limit=1)
+    if not post or not profile:
+        print('Needs at least one blog post and one user profile (install the demo data)')
+        return {}
+
+    cases = {
+        'profile.last_login': (
+            lambda: profile.write({'last_login': fields.Datetime.now()}),
+            lambda: profile._fast_write({'last_login': fields.Datetime.now()}),
+        ),
+        'post.view_count': (
+            lambda: post.write({'view_count': post.view_count + 1}),
+            lambda: post._fast_add('view_count', {post.id: 1}),
+        ),
+    }
+
+    results = {}
+    try:
+        print(f'{iterations} iterations per case')
+        for name, (orm_write, fast_write) in cases.items():
+            orm_time, orm_queries = _measure(env, orm_write, iterations)
+            fast_time, fast_queries = _measure(env, fast_write, iterations)
+            results[name] = {
+                'write_ms': orm_time * 1000, 'write_queries': orm_queries,
+                'fast_ms': fast_time * 1000, 'fast_queries': fast_queries,
+            }
+            print(
+                f'{name:>20}: write() {orm_time * 1000:7.3f} ms / {orm_queries:4.1f} queries'
+                f' | fast {fast_time * 1000:7.3f} ms / {fast_queries:4.1f} queries'
+                f' | {orm_time / fast_time:5.1f}x'
+            )
+    finally:
+        env.cr.rollback()
+        env.invalidate_all()
+    return results
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""
+JSON Encoding Micro-Benchmark - Training Example
+
+Compares the time to build and encode one 100-task API page:
+
+- legacy:  per-field isoformat() in the serializer + json.dumps(default=str)
+- json:    raw dates + json_encoding.StdlibEncoder
+- orjson:  raw dates + json_encoding.OrjsonEncoder (if orjson is installed)
+
+It needs neither Odoo nor a database: rows are shaped like the output of
+api.task.read(load=None) and json_encoding is loaded straight from its file.
+
+Usage: python3 benchmarks/bench_json_encoding.py [--tasks 100] [--repeat 2000]
+"""
+
+import argparse
+import datetime
+import importlib.util
+import json
+import os
+import timeit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_json_encoding():
+    path = os.path.join(HERE, os.pardir, 'json_encoding.py')
+    spec = importlib.util.spec_from_file_location('json_encoding', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_rows(count):
+    """Rows as returned by api.task.read(load=None)"""
+    today = datetime.date(2024, 6, 1)
+    return [
+        {
+            'id': index,
+            'name': f'Task {index}',
+            'description': 'Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
+            'assigned_to': 2 + index % 5,
+            'created_by': 2,
+            'project_name': f'Project {index % 7}',
+            'status': ('todo', 'in_progress', 'review', 'done')[index % 4],
+            'priority': str(index % 4),
+            'due_date': today + datetime.timedelta(days=index % 30),
+            'completed_date': datetime.datetime(2024, 5, 1, 9, 30) if index % 4 == 3 else False,
+            'is_overdue': index % 9 == 0,
+            'days_until_due': index % 30,
+            'estimated_hours': 4.5,
+            'actual_hours': 1.25,
+            'progress': 40.0,
+        }
+        for index in range(1, count + 1)
+    ]
+
+
+def serialize(rows, dates):
+    """Same shape as TaskApiController._serialize_tasks; dates(value) formats a date"""
+    user_names = {uid: f'User {uid}' for uid in range(1, 10)}
+    return [
+        {
+            'id': row['id'],
+            'name': row['name'],
+            'description': row['description'],
+            'assigned_to': {'id': row['assigned_to'], 'name': user_names.get(row['assigned_to'])},
+            'created_by': {'id': row['created_by'], 'name': user_names.get(row['created_by'])},
+            'project_name': row['project_name'],
+            'status': row['status'],
+            'priority': row['priority'],
+            'due_date': dates(row['due_date']),
+            'completed_date': dates(row['completed_date']),
+            'is_overdue': row['is_overdue'],
+            'days_until_due': row['days_until_due'],
+            'estimated_hours': row['estimated_hours'],
+            'actual_hours': row['actual_hours'],
+            'progress': row['progress'],
+        }
+        for row in rows
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--tasks', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=2000)
+    args = parser.parse_args()
+
+    json_encoding = load_json_encoding()
+    rows = make_rows(args.tasks)
+
+    def legacy():
+        data = serialize(rows, lambda value: value.isoformat() if value else None)
+        return json.dumps({'success': True, 'data': data}, default=str).encode()
+
+    candidates = [('legacy', legacy)]
+    encoders = [json_encoding.StdlibEncoder()]
+    if json_encoding.orjson is not None:
+        encoders.append(json_encoding.OrjsonEncoder())
+    for encoder in encoders:
+        def run(encoder=encoder):
+            data = serialize(rows, lambda value: value or None)
+            return encoder.dumps({'success': True, 'data': data})
+        candidates.append((encoder.name, run))
+
+    # Same JSON document, modulo whitespace
+    reference = json.loads(legacy())
+    for name, func in candidates:
+        assert json.loads(func()) == reference, f'{name} output differs'
+
+    print(f'{args.tasks} tasks per page, best of 5 x {args.repeat} runs')
+    baseline = None
+    for name, func in candidates:
+        best = min(timeit.repeat(func, number=args.repeat, repeat=5)) / args.repeat
+        baseline = baseline or best
+        print(f'{name:>8}: {best * 1e6:8.1f} us/page  ({baseline / best:4.1f}x)  {len(func())} bytes')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""
+Scale Data Generator - Training Example
+
+Bulk-loads users, profiles, blog posts and tasks with production-like
+distributions, to benchmark and test the API at realistic sizes:
+
+- skewed authorship and assignment (Zipf-like: a few users own most rows)
+- HTML post bodies of varied length (log-normal paragraph counts)
+- due dates spread around today, realistic status and priority mixes
+
+Users are created through the ORM, since they need partners and groups.
+Profiles, posts and tasks are written with PostgreSQL COPY, in batches,
+without the ORM. Stored computed fields (slug, excerpt, word count,
+reading time) are computed with the models' own helpers, and the profile
+counters are recomputed at the end. For a given seed and today, the
+generated data is always the same.
+
+Usage (odoo shell -d <database>):
+    >>> from odoo.addons.api_training_course.benchmarks import scale_data
+    >>> scale_data.generate(env, users=1000, posts=100000, tasks=1000000, seed=42)
+    >>> env.cr.commit()
+
+Or with a preset: scale_data.generate(env, **scale_data.SIZES['large'])
+"""
+
+import csv
+import datetime
+import io
+import itertools
+import random
+import time
+
+from odoo import fields
+from odoo.tools import SQL
+
+from .. import text_analysis
+
+# Dataset presets, shared with the endpoint benchmarks
+SIZES = {
+    'small': {'users': 50, 'posts': 1000, 'tasks': 5000},
+    'medium': {'users': 500, 'posts': 20000, 'tasks': 100000},
+    'large': {'users': 5000, 'posts': 200000, 'tasks': 1000000},
+}
+
+BATCH_SIZE = 20000
+
+# Login of the i-th generated user; existing ones are reused
+LOGIN_PATTERN = 'scale.user{}@example.com'
+
+# Skew of authorship/assignment: weight of the user of rank r is 1 / r**s
+ZIPF_EXPONENT = 1.1
+
+POST_STATUSES = {'published': 75, 'draft': 18, 'archived': 7}
+TASK_STATUSES = {'todo': 35, 'in_progress': 20, 'review': 10, 'done': 30, 'cancelled': 5}
+TASK_PRIORITIES = {'0': 20, '1': 50, '2': 22, '3': 8}
+
+WORDS = (
+    'api backend request response cache query index database server client '
+    'python odoo model field record view route json token session worker '
+    'latency throughput scale design pattern test deploy release build debug '
+    'error retry timeout stream batch queue event schema migration replica '
+    'the a of to and in for with on is that this we it as by from at be are '
+    'fast simple robust clean modern small large common better new first'
+).split()
+TAGS = ['python', 'api', 'tutorial', 'odoo', 'postgresql', 'performance', 'rest', 'testing', 'devops', 'design']
+FIRST_NAMES = ['Alex', 'Sam', 'Jordan', 'Taylor', 'Morgan', 'Casey', 'Riley', 'Jamie', 'Robin', 'Avery', 'Quinn', 'Drew']
+LAST_NAMES = ['Smith', 'Garcia', 'Chen', 'Kumar', 'Müller', 'Rossi', 'Silva', 'Nguyen', 'Cohen', 'Okafor', 'Dubois', 'Sato']
+JOB_TITLES = ['Developer', 'Senior Developer', 'Tech Lead', 'Data Engineer', 'QA Engineer', 'Product Manager', 'Designer']
+CITIES = [('Paris', 'France'), ('Berlin', 'Germany'), ('Austin', 'USA'), ('Lagos', 'Nigeria'), ('Tokyo', 'Japan'), ('Lima', 'Peru')]
+PROJECTS = [f'Project {name}' for name in ('Atlas', 'Beacon', 'Comet', 'Delta', 'Echo', 'Falcon', 'Gemini', 'Helix', 'Ion', 'Juno')]
+
+
+# ========== Distributions ==========
+
+def _weighted(rng, weights, k):
+    """k values drawn from a {value: weight} mapping"""
+    return rng.choices(list(weights), weights=list(weights.values()), k=k)
+
+
+def _zipf_cum_weights(count):
+    return list(itertools.accumulate(1 / rank ** ZIPF_EXPONENT for rank in range(1, count + 1)))
+
+
+def _skewed(rng, values, cum_weights, k):
+    """k values, the first ones of values being the most frequent"""
+    return rng.choices(values, cum_weights=cum_weights, k=k)
+
+
+def _sentence(rng, min_words, max_words):
+    words = rng.choices(WORDS, k=rng.randint(min_words, max_words))
+    return ' '.join(words).capitalize() + '.'
+
+
+def _html_body(rng):
+    """HTML body: mostly short posts, a long tail of long ones"""
+    paragraphs = min(60, max(1, int(rng.lognormvariate(1.4, 0.8))))
+    parts = []
+    for index in range(paragraphs):
+        if index and index % 4 == 0:
+            parts.append(f'<h2>{_sentence(rng, 2, 6)}</h2>')
+        if rng.random() < 0.15:
+            items = ''.join(f'<li>{_sentence(rng, 3, 10)}</li>' for _i in range(rng.randint(2, 5)))
+            parts.append(f'<ul>{items}</ul>')
+        else:
+            sentences = ' '.join(_sentence(rng, 6, 18) for _i in range(rng.randint(2, 6)))
+            parts.append(f'<p>{sentences}</p>')
+    return ''.join(parts)
+
+
+# ========== Bulk Loading ==========
+
+def _copy_rows(cr, table, columns, rows):
+    """Load rows (tuples, None for NULL) into table with one COPY"""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    cr.copy_expert(f'COPY {table} ({", ".join(columns)}) FROM STDIN WITH (FORMAT csv)', buffer)
+
+
+def _copy_batches(cr, table, columns, count, make_row, batch_size=BATCH_SIZE):
+    """COPY count generated rows in batches, so memory stays bounded"""
+    for start in range(0, count, batch_size):
+        rows = [make_row(index) for index in range(start, min(start + batch_size, count))]
+        _copy_rows(cr, table, columns, rows)
+        print(f'  {table}: {start + len(rows)}/{count}')
+
+
+def _ensure_users(env, count, rng):
+    """Ids of count generated users, creating the missing ones"""
+    logins = [LOGIN_PATTERN.format(index) for index in range(count)]
+    Users = env['res.users'].with_context(
+        no_reset_password=True, tracking_disable=True, mail_create_nolog=True, mail_notrack=True,
+    )
+    existing = {user['login']: user['id'] for user in Users.search_read([('login', 'in', logins)], ['login'])}
+    missing = [login for login in logins if login not in existing]
+    for start in range(0, len(missing), 500):
+        batch = missing[start:start + 500]
+        users = Users.create([
+            {'name': f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}', 'login': login, 'email': login}
+            for login in batch
+        ])
+        existing.update(zip(batch, users.ids))
+    return [existing[login] for login in logins]
+
+
+def _load_profiles(env, user_ids, rng, now):
+    Profile = env['api.user.profile']
+    env.cr.execute(SQL('SELECT user_id FROM %s WHERE user_id = ANY(%s)', SQL.identifier(Profile._table), user_ids))
+    with_profile = {user_id for user_id, in env.cr.fetchall()}
+    user_ids = [user_id for user_id in user_ids if user_id not in with_profile]
+
+    columns = [
+        'user_id', 'bio', 'job_title', 'company', 'years_of_experience', 'skills', 'interests',
+        'city', 'country', 'timezone', 'preferred_language', 'email_notifications',
+        'newsletter_subscription', 'profile_views', 'posts_count', 'tasks_count',
+        'account_created', 'is_verified', 'is_active',
+        'create_uid', 'create_date', 'write_uid', 'write_date',
+    ]
+
+    def make_row(index):
+        city, country = rng.choice(CITIES)
+        created = now - datetime.timedelta(days=rng.randint(0, 1500))
+        return (
+            user_ids[index], _sentence(rng, 8, 30), rng.choice(JOB_TITLES), rng.choice(['Acme', 'Globex', 'Initech', None]),
+            rng.randint(0, 25), ','.join(rng.sample(TAGS, rng.randint(1, 4))), ','.join(rng.sample(TAGS, rng.randint(0, 3))) or None,
+            city, country, 'UTC', 'en', rng.random() < 0.8,
+            rng.random() < 0.3, int(rng.paretovariate(1.5) * 10), 0, 0,
+            created, rng.random() < 0.4, True,
+            env.uid, created, env.uid, created,
+        )
+
+    _copy_batches(env.cr, Profile._table, columns, len(user_ids), make_row)
+    return len(user_ids)
+
+
+def _load_posts(env, user_ids, count, rng, now):
+    Post = env['api.blog.post']
+    authors = rng.sample(user_ids, len(user_ids))
+    cum_weights = _zipf_cum_weights(len(authors))
+    columns = [
+        'title', 'slug', 'content', 'excerpt', 'word_count', 'reading_time_minutes',
+        'author_id', 'published_date', 'status', 'is_featured', 'view_count', 'like_count', 'legacy_like_count', 'tags',
+        'create_uid', 'create_date', 'write_uid', 'write_date',
+    ]
+
+    def make_row(index):
+        title = _sentence(rng, 4, 9)[:-1]
+        content = _html_body(rng)
+        analysis = text_analysis.analyze_html(content)
+        status = _weighted(rng, POST_STATUSES, 1)[0]
+        published = now - datetime.timedelta(minutes=int(rng.expovariate(1 / (180 * 24 * 60))))
+        view_count = int(rng.paretovariate(1.2) * 20) if status == 'published' else 0
+        author_id = _skewed(rng, authors, cum_weights, 1)[0]
+        # No like rows are generated: the likes are legacy ones, which
+        # recount_likes keeps
+        like_count = int(view_count * rng.uniform(0, 0.1))
+        return (
+            title, text_analysis.slugify(title), content, analysis.excerpt, analysis.word_count,
+            analysis.reading_time_minutes, author_id, published, status,
+            status == 'published' and rng.random() < 0.02, view_count,
+            like_count, like_count, ','.join(rng.sample(TAGS, rng.randint(1, 4))),
+            author_id, published, author_id, published,
+        )
+
+    _copy_batches(env.cr, Post._table, columns, count, make_row)
+    return count
+
+
+def _load_tasks(env, user_ids, count, rng, now):
+    Task = env['api.task']
+    assignees = rng.sample(user_ids, len(user_ids))
+    cum_weights = _zipf_cum_weights(len(assignees))
+    project_weights = _zipf_cum_weights(len(PROJECTS))
+    today = now.date()
+    columns = [
+        'name', 'description', 'assigned_to', 'created_by', 'project_name', 'status', 'priority',
+        'due_date', 'completed_date', 'estimated_hours', 'actual_hours', 'progress',
+        'create_uid', 'create_date', 'write_uid', 'write_date',
+    ]
+    progress_ranges = {'todo': (0, 0), 'in_progress': (10, 90), 'review': (80, 99), 'done': (100, 100), 'cancelled': (0, 50)}
+
+    def make_row(index):
+        status = _weighted(rng, TASK_STATUSES, 1)[0]
+        created = now - datetime.timedelta(minutes=rng.randint(0, 365 * 24 * 60))
+        due_date = today + datetime.timedelta(days=round(rng.gauss(0, 21))) if rng.random() < 0.9 else None
+        estimated = rng.choice([1, 2, 4, 8, 16, 24, 40]) if rng.random() < 0.8 else None
+        completed = actual = None
+        if status == 'done':
+            completed = min(created + datetime.timedelta(hours=rng.randint(1, 30 * 24)), now)
+            actual = round(estimated * rng.lognormvariate(0, 0.3), 2) if estimated else None
+        assigned_to = _skewed(rng, assignees, cum_weights, 1)[0] if rng.random() < 0.92 else None
+        created_by = rng.choice(user_ids)
+        return (
+            _sentence(rng, 3, 8)[:-1], _sentence(rng, 10, 40) if rng.random() < 0.7 else None,
+            assigned_to, created_by, _skewed(rng, PROJECTS, project_weights, 1)[0], status,
+            _weighted(rng, TASK_PRIORITIES, 1)[0], due_date, completed, estimated, actual,
+            rng.randint(*progress_ranges[status]),
+            created_by, created, created_by, completed or created,
+        )
+
+    _copy_batches(env.cr, Task._table, columns, count, make_row)
+    return count
+
+
+def generate(env, users=100, posts=1000, tasks=10000, seed=42, today=None):
+    """
+    Bulk-load scale data; nothing is committed
+
+    users: number of generated users (reused across runs, with profiles);
+    posts/tasks: rows added on each call. today (a date) fixes the dates
+    for fully reproducible data. Returns the generated user ids and the
+    number of rows loaded per table.
+    """
+    env = env(su=True)
+    started = time.perf_counter()
+    now = datetime.datetime.combine(today, datetime.time(12)) if today else fields.Datetime.now().replace(microsecond=0)
+
+    # Independent streams: changing one count leaves the other data unchanged
+    streams = {name: random.Random(f'{seed}:{name}') for name in ('users', 'profiles', 'posts', 'tasks')}
+
+    env.flush_all()
+    user_ids = _ensure_users(env, users, streams['users'])
+    env.flush_all()
+    result = {
+        'user_ids': user_ids,
+        'profiles': _load_profiles(env, user_ids, streams['profiles'], now),
+        'posts': _load_posts(env, user_ids, posts, streams['posts'], now),
+        'tasks': _load_tasks(env, user_ids, tasks, streams['tasks'], now),
+    }
+
+    # Rows were written behind the ORM's back
+    env.invalidate_all()
+    env.registry.clear_cache()
+    env['api.user.profile'].recompute_counts()
+    env['api.response.cache'].invalidate_scopes(['posts'])
+    for model_name in ('api.user.profile', 'api.blog.post', 'api.task'):
+        env.cr.execute(SQL('ANALYZE %s', SQL.identifier(env[model_name]._table)))
+
+    result['seconds'] = round(time.perf_counter() - started, 1)
+    print(f'Loaded {result["profiles"]} profiles, {result["posts"]} posts and {result["tasks"]} tasks in {result["seconds"]}s')
+    return result
@@ -1,4 +1,5 @@
 from . import blog_api
 from . import task_api
 from . import user_api
+from . import sync_api
 from . import main
@@ -0,0 +1,414 @@
+# -*- coding: utf-8 -*-
+"""
+Precomputed API Documentation - Training Example
+
+This module demonstrates:
+- Introspecting @http.route metadata instead of hand-maintained lists
+- Building static responses once per process (pre-encoded bytes + ETag)
+- Generating an OpenAPI 3 document from routes and docstrings
+
+The endpoint list is read from the routing information that http.route
+stores on each controller method (original_routing), and each summary is
+the first line of the method's docstring, so the documentation cannot
+drift from the real routes. Documents are built on first use (or when the
+registry loads, see ir.http._register_hook) and served as the same bytes
+object afterwards.
+"""
+
+import hashlib
+import inspect
+import re
+import threading
+
+from .. import json_encoding
+
+API_VERSION = '1.0.0'
+
+WELCOME = {
+    'name': 'API Training Course',
+    'version': API_VERSION,
+    'description': 'Learn backend API development with Odoo',
+    'base_url': '/api/training',
+    'authentication': {
+        'public': 'No authentication required',
+        'user': 'Requires user session authentication',
+        'note': 'For type=json endpoints, send credentials via session/cookies'
+    },
+    'features': [
+        'RESTful API Design',
+        'CRUD Operations',
+        'Authentication & Authorization',
+        'Pagination & Filtering',
+        'Search & Query',
+        'File Uploads',
+        'Error Handling',
+        'JSON Request/Response'
+    ],
+    'modules': {
+        'blog': {
+            'description': 'Blog post management',
+            'endpoints': '/api/training/blog/*'
+        },
+        'tasks': {
+            'description': 'Task management system',
+            'endpoints': '/api/training/tasks/*'
+        },
+        'users': {
+            'description': 'User profile management',
+            'endpoints': '/api/training/users/*'
+        }
+    },
+    'getting_started': {
+        'step_1': 'Install the api_training_course module in Odoo',
+        'step_2': 'Access /api/training/endpoints to see all available endpoints',
+        'step_3': 'Try GET /api/training/blog/posts to fetch blog posts',
+        'step_4': 'Read the controller source code to understand implementation',
+        'step_5': 'Experiment with creating your own endpoints'
+    },
+    'resources': {
+        'health_check': '/api/training/health',
+        'endpoints_list': '/api/training/endpoints',
+        'openapi': '/api/training/openapi.json',
+        'blog_api': '/api/training/blog/posts',
+        'tasks_api': '/api/training/tasks',
+        'profile_api': '/api/training/users/profile'
+    },
+    'learning_path': [
+        '1. Understand models (ORM, fields, constraints)',
+        '2. Learn controllers (routing, request handling)',
+        '3. Master CRUD operations (create, read, update, delete)',
+        '4. Implement authentication & authorization',
+        '5. Add pagination, filtering, and search',
+        '6. Handle file uploads and binary data',
+        '7. Implement proper error handling',
+        '8. Write API documentation',
+        '9. Test your APIs',
+        '10. Deploy to production'
+    ],
+    'tips': [
+        'Always validate input data',
+        'Use proper HTTP status codes',
+        'Return consistent JSON structure',
+        'Implement proper error messages',
+        'Add pagination for list endpoints',
+        'Use sudo() carefully for permissions',
+        'Log errors for debugging',
+        'Document your APIs'
+    ]
+}
+
+
+EXAMPLES = {
+    'getting_started': {
+        'description': 'Simple examples to get started',
+        'examples': [
+            {
+                'title': 'List all blog posts',
+                'method': 'GET',
+                'url': '/api/training/blog/posts',
+                'curl': 'curl http://localhost:8069/api/training/blog/posts'
+            },
+            {
+                'title': 'Get a single post',
+                'method': 'GET',
+                'url': '/api/training/blog/posts/1',
+                'curl': 'curl http://localhost:8069/api/training/blog/posts/1'
+            },
+            {
+                'title': 'Search posts',
+                'method': 'GET',
+                'url': '/api/training/blog/posts/search?q=python',
+                'curl': 'curl http://localhost:8069/api/training/blog/posts/search?q=python'
+            }
+        ]
+    },
+    'pagination': {
+        'description': 'Examples using pagination',
+        'examples': [
+            {
+                'title': 'Get page 2 with 20 items',
+                'method': 'GET',
+                'url': '/api/training/blog/posts?page=2&limit=20',
+                'curl': 'curl http://localhost:8069/api/training/blog/posts?page=2&limit=20'
+            }
+        ]
+    },
+    'sparse_fieldsets': {
+        'description': 'Return only the fields you need (smaller payload, fewer columns read)',
+        'examples': [
+            {
+                'title': 'List post titles without their content',
+                'method': 'GET',
+                'url': '/api/training/blog/posts?fields=id,title,status',
+                'curl': 'curl "http://localhost:8069/api/training/blog/posts?fields=id,title,status"'
+            },
+            {
+                'title': 'Include the author object',
+                'method': 'GET',
+                'url': '/api/training/blog/posts?fields=title,author&expand=author',
+                'curl': 'curl "http://localhost:8069/api/training/blog/posts?fields=title,author&expand=author"'
+            }
+        ]
+    },
+    'filtering': {
+        'description': 'Examples using filters',
+        'examples': [
+            {
+                'title': 'Get published posts only',
+                'method': 'GET',
+                'url': '/api/training/blog/posts?status=published',
+                'curl': 'curl http://localhost:8069/api/training/blog/posts?status=published'
+            },
+            {
+                'title': 'Get high priority tasks',
+                'method': 'GET',
+                'url': '/api/training/tasks?priority=3',
+                'curl': 'curl http://localhost:8069/api/training/tasks?priority=3',
+                'note': 'Requires authentication'
+            }
+        ]
+    },
+    'creating_data': {
+        'description': 'Examples creating data via POST',
+        'note': 'These require authentication and type=json',
+        'examples': [
+            {
+                'title': 'Create a blog post',
+                'method': 'POST',
+                'url': '/api/training/blog/posts',
+                'body': {
+                    'title': 'My First API Post',
+                    'content': '<p>Learning APIs with Odoo!</p>',
+                    'status': 'published',
+                    'tags': 'api,learning,odoo'
+                }
+            },
+            {
+                'title': 'Create a task',
+                'method': 'POST',
+                'url': '/api/training/tasks',
+                'body': {
+                    'name': 'Complete API Training',
+                    'description': 'Finish all training modules',
+                    'priority': '2',
+                    'status': 'todo'
+                }
+            }
+        ]
+    }
+}
+
+
+ENDPOINT_NOTES = {
+    'auth_public': 'No authentication required',
+    'auth_user': 'Requires user session authentication',
+    'query_params': 'Use ?param=value for query parameters',
+    'json_body': 'Send JSON in request body for POST/PUT',
+    'pagination': 'Use ?page=1&limit=10 for pagination',
+}
+
+# Section of the endpoint list per controller, in display order
+CONTROLLER_SECTIONS = (
+    ('meta', 'main', 'MainApiController'),
+    ('blog_api', 'blog_api', 'BlogApiController'),
+    ('task_api', 'task_api', 'TaskApiController'),
+    ('user_api', 'user_api', 'UserApiController'),
+    ('sync_api', 'sync_api', 'SyncApiController'),
+)
+
+# Werkzeug converter -> OpenAPI schema of the path parameter
+CONVERTER_SCHEMAS = {
+    'int': {'type': 'integer'},
+    'float': {'type': 'number'},
+    'string': {'type': 'string'},
+    'path': {'type': 'string'},
+}
+
+_CONVERTER_RE = re.compile(r'<(?:(\w+)(?:\([^)]*\))?:)?(\w+)>')
+_PARAM_RE = re.compile(r'^- ([\w, ]+): (.*)$')
+
+
+class PrecomputedDocument:
+    """An immutable JSON response: encoded body and its strong ETag"""
+
+    __slots__ = ('body', 'etag')
+
+    def __init__(self, data, envelope=True):
+        payload = {'success': True, 'data': data} if envelope else data
+        self.body = json_encoding.dumps(payload)
+        self.etag = hashlib.sha256(self.body).hexdigest()[:32]
+
+
+_documents = None
+_lock = threading.Lock()
+
+
+# ========== Route Introspection ==========
+
+def iter_routes(controller_class):
+    """
+    Yield one dict per (route, method) of a controller class
+
+    Methods are listed in definition order; the routing dict is the one
+    http.route attached to the decorated function.
+    """
+    for name, func in vars(controller_class).items():
+        routing = getattr(func, 'original_routing', None)
+        if not routing:
+            continue
+        doc = inspect.getdoc(func) or ''
+        for path in routing.get('routes') or []:
+            for method in routing.get('methods') or ['GET']:
+                yield {
+                    'name': name,
+                    'path': path,
+                    'method': method,
+                    'type': routing.get('type', 'http'),
+                    'auth': routing.get('auth', 'user'),
+                    'summary': doc.split('\n', 1)[0].strip(),
+                    'query_params': parse_query_params(doc),
+                }
+
+
+def parse_query_params(doc):
+    """
+    Read the "Query Parameters:" section of a route docstring
+
+    Lines look like "- name: description" or "- a, b: shared description";
+    indented lines continue the previous description.
+    Returns [(name, description)].
+    """
+    params = []
+    in_section = False
+    for line in doc.splitlines():
+        stripped = line.strip()
+        if stripped == 'Query Parameters:':
+            in_section = True
+            continue
+        if not in_section:
+            continue
+        if not stripped:
+            break
+        match = _PARAM_RE.match(stripped)
+        if match:
+            names = [n.strip() for n in match.group(1).split(',') if n.strip()]
+            params.append([names, match.group(2).strip()])
+        elif params:
+            params[-1][1] += ' ' + stripped
+    return [(name, description) for names, description in params for name in names]
+
+
+def display_path(path):
+    """'/tasks/<int:task_id>' -> '/tasks/<task_id>'"""
+    return _CONVERTER_RE.sub(lambda m: f'<{m.group(2)}>', path)
+
+
+def openapi_path(path):
+    """'/tasks/<int:task_id>' -> '/tasks/{task_id}'"""
+    return _CONVERTER_RE.sub(lambda m: '{' + m.group(2) + '}', path)
+
+
+def _controller_routes():
+    """[(section, [route, ...])] for the documented controllers"""
+    from . import blog_api, main, task_api, user_api
+    modules = {'main': main, 'blog_api': blog_api, 'task_api': task_api, 'user_api': user_api}
+    return [
+        (section, list(iter_routes(getattr(modules[module], class_name))))
+        for section, module, class_name in CONTROLLER_SECTIONS
+    ]
+
+
+# ========== Documents ==========
+
+def build_endpoint_list(sections):
+    endpoints = {}
+    for section, routes in sections:
+        entries = endpoints[section] = {}
+        for route in routes:
+            summary = route['summary']
+            if route['auth'] == 'user':
+                summary += ' (auth required)'
+            entries[f"{route['method']} {display_path(route['path'])}"] = summary
+    endpoints['notes'] = ENDPOINT_NOTES
+    return endpoints
+
+
+def build_openapi(sections):
+    """OpenAPI 3.0 document of all documented routes"""
+    paths = {}
+    for section, routes in sections:
+        for route in routes:
+            parameters = [
+                {
+                    'name': name,
+                    'in': 'path',
+                    'required': True,
+                    'schema': CONVERTER_SCHEMAS.get(converter or 'string', {'type': 'string'}),
+                }
+                for converter, name in _CONVERTER_RE.findall(route['path'])
+            ]
+            parameters += [
+                {'name': name, 'in': 'query', 'required': False,
+                 'description': description, 'schema': {'type': 'string'}}
+                for name, description in route['query_params']
+            ]
+
+            operation = {
+                'operationId': f"{section}_{route['name']}_{route['method'].lower()}",
+                'summary': route['summary'],
+                'tags': [section],
+                'parameters': parameters,
+                'responses': {'200': {'description': 'Success'}},
+            }
+            if route['type'] == 'json':
+                # type='json' routes take a JSON-RPC envelope: {"params": {...}}
+                operation['requestBody'] = {
+                    'content': {'application/json': {'schema': {
+                        'type': 'object',
+                        'properties': {
+                            'jsonrpc': {'type': 'string', 'example': '2.0'},
+                            'params': {'type': 'object'},
+                        },
+                    }}},
+                }
+            if route['auth'] == 'user':
+                operation['security'] = [{'sessionCookie': []}]
+            elif route['auth'] == 'none':
+                operation['security'] = []
+
+            paths.setdefault(openapi_path(route['path']), {})[route['method'].lower()] = operation
+
+    return {
+        'openapi': '3.0.3',
+        'info': {
+            'title': WELCOME['name'],
+            'version': API_VERSION,
+            'description': WELCOME['description'],
+        },
+        'paths': paths,
+        'components': {
+            'securitySchemes': {
+                'sessionCookie': {'type': 'apiKey', 'in': 'cookie', 'name': 'session_id'},
+            },
+        },
+    }
+
+
+def build_documents():
+    sections = _controller_routes()
+    return {
+        'welcome': PrecomputedDocument(WELCOME),
+        'endpoints': PrecomputedDocument(build_endpoint_list(sections)),
+        'examples': PrecomputedDocument(EXAMPLES),
+        'openapi': PrecomputedDocument(build_openapi(sections), envelope=False),
+    }
+
+
+def get_document(name):
+    """The precomputed document 'welcome', 'endpoints', 'examples' or 'openapi'"""
+    global _documents
+    if _documents is None:
+        with _lock:
+            if _documents is None:
+                _documents = build_documents()
+    return _documents[name]
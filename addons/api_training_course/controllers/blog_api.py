@@ -9,7 +9,9 @@ This controller demonstrates:
 - Error handling
 - Pagination
 - Filtering and searching
+- Sparse fieldsets (?fields=, ?expand=)
 - Authentication types (public, user)
+- Public reads served from a read replica (see replica.py)
 
 API Endpoints:
 GET    /api/training/blog/posts              - List all posts (with pagination)
@@ -20,17 +22,45 @@ DELETE /api/training/blog/posts/<int:id>     - Delete post
 POST   /api/training/blog/posts/<int:id>/like   - Like a post
 GET    /api/training/blog/posts/featured     - Get featured posts
 GET    /api/training/blog/posts/search       - Search posts
+GET    /api/training/blog/posts/export       - Stream all posts as NDJSON/JSON/CSV
+GET    /api/training/blog/cache/stats        - Response cache hit/miss counters
+
+Public GET endpoints are served from a response cache with ETag / 304
+support (see api.response.cache).
 """
 
-import json
+import functools
+import hashlib
 import logging
+from urllib.parse import urlencode
 from odoo import http
 from odoo.http import request, Response
 from datetime import datetime
 
+from . import fieldsets
+from .streaming import stream_export
+from . import responses
+from .. import profiling
+from .. import replica
+
 _logger = logging.getLogger(__name__)
 
 
+def cached_public_response(scopes):
+    """
+    Serve a public GET route through BlogApiController._cached_response
+
+    scopes: invalidation scopes of the response (see api.response.cache).
+    Place it below @http.route.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            return self._cached_response(scopes, lambda: func(self, *args, **kwargs))
+        return wrapper
+    return decorator
+
+
 class BlogApiController(http.Controller):
 
     # ========== Helper Methods ==========
@@ -39,56 +69,152 @@ class BlogApiController(http.Controller):
         """Helper to get blog post or return None"""
         return request.env['api.blog.post'].sudo().browse(post_id)
 
-    def _serialize_post(self, post):
+    # Output fields of a post and the columns they are read from
+    _post_fields = fieldsets.ResourceFields({
+        'id': fieldsets.column('id'),
+        'title': fieldsets.column('title'),
+        'slug': fieldsets.column('slug'),
+        'content': fieldsets.column('content'),
+        'excerpt': fieldsets.column('excerpt'),
+        'author': fieldsets.column('author_id'),
+        'published_date': fieldsets.column('published_date', lambda row: row['published_date'] or None),
+        'status': fieldsets.column('status'),
+        'is_featured': fieldsets.column('is_featured'),
+        'view_count': fieldsets.column('view_count'),
+        'like_count': fieldsets.column('like_count'),
+        'tags': fieldsets.column('tags', lambda row: row['tags'].split(',') if row['tags'] else []),
+        'reading_time_minutes': fieldsets.column('reading_time_minutes'),
+        'word_count': fieldsets.column('word_count'),
+    }, relations={'author': 'author_id'})
+
+    def _post_fieldset(self):
+        """Fieldset selected by the request's ?fields= / ?expand= parameters"""
+        return self._post_fields.select(request.httprequest.args)
+
+    def _serialize_post(self, post, fieldset=None):
         """Convert blog post record to dictionary"""
-        return {
-            'id': post.id,
-            'title': post.title,
-            'slug': post.slug,
-            'content': post.content,
-            'excerpt': post.excerpt,
-            'author': {
-                'id': post.author_id.id,
-                'name': post.author_name,
-            },
-            'published_date': post.published_date.isoformat() if post.published_date else None,
-            'status': post.status,
-            'is_featured': post.is_featured,
-            'view_count': post.view_count,
-            'like_count': post.like_count,
-            'tags': post.tags.split(',') if post.tags else [],
-            'reading_time_minutes': post.reading_time_minutes,
-        }
+        posts_data, _query_count = self._serialize_posts(post, fieldset)
+        return posts_data[0]
+
+    @profiling.timed()
+    def _serialize_posts(self, posts, fieldset=None):
+        """
+        Convert a blog post recordset to a list of dictionaries in one pass
+
+        Reads only the columns of the selected fields (all by default) for
+        the whole recordset and resolves all author names with a single
+        res.users lookup, only if the author is expanded.
+
+        Returns a tuple (posts_data, query_count) where query_count is the
+        number of SQL statements issued while serializing.
+        """
+        cr = posts.env.cr
+        queries_before = cr.sql_log_count
+
+        fieldset = fieldset or self._post_fields.all()
+        posts_data = responses.jsonrpc_safe(fieldset.serialize(posts))
+
+        return posts_data, cr.sql_log_count - queries_before
+
+    def _build_post_domain(self, params):
+        """Build search domain from list filter query parameters"""
+        domain = []
+
+        if params.get('status'):
+            domain.append(('status', '=', params['status']))
+
+        if params.get('author_id'):
+            domain.append(('author_id', '=', int(params['author_id'])))
+
+        if params.get('featured'):
+            is_featured = params['featured'].lower() == 'true'
+            domain.append(('is_featured', '=', is_featured))
+
+        return domain
+
+    def _visitor_fingerprint(self):
+        """
+        Anonymous visitor fingerprint (hashed IP address and user agent)
+
+        Behind a reverse proxy, Odoo must run with proxy_mode (as the
+        shipped docker-compose.yml does) for remote_addr to be the
+        visitor's address: otherwise every visitor has the proxy's, and
+        likes of different people with the same browser are deduplicated.
+        """
+        environ = request.httprequest.environ
+        raw = '|'.join([
+            request.httprequest.remote_addr or '',
+            environ.get('HTTP_USER_AGENT', ''),
+        ])
+        return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+    def _cached_response(self, scopes, build):
+        """
+        Serve a public GET response from the response cache
+
+        The key is the route path plus the normalized query string. On a
+        miss, build() is called and its body cached if the status is 200.
+        A matching If-None-Match gets an empty 304 instead of the body.
+
+        A request with Cache-Control: no-cache skips the lookup and
+        rebuilds (and re-caches) the response, as a miss would. It costs
+        no more than a query string the cache has not seen yet.
+
+        The cache is an optimization: when it fails, the response is built
+        and served uncached (X-Cache: ERROR).
+        """
+        Cache = request.env['api.response.cache'].sudo()
+        httprequest = request.httprequest
+        key = (httprequest.path, urlencode(sorted(httprequest.args.items(multi=True))))
+
+        try:
+            body, etag, generations = Cache.lookup(key, scopes)
+        except Exception as e:
+            _logger.error(f'Response cache lookup failed: {str(e)}')
+            # Nothing was written yet by this GET request: start over on a
+            # transaction the failed query did not abort
+            request.env.cr.rollback()
+            response = build()
+            response.headers['X-Cache'] = 'ERROR'
+            return response
+
+        cache_status = 'HIT'
+        if 'no-cache' in httprequest.headers.get('Cache-Control', ''):
+            body, cache_status = None, 'BYPASS'
+        if body is None:
+            response = build()
+            if response.status_code != 200:
+                return response
+            body = response.get_data()
+            try:
+                etag = Cache.store(key, body, generations)
+            except Exception as e:
+                _logger.error(f'Response cache store failed: {str(e)}')
+                response.headers['X-Cache'] = 'ERROR'
+                return response
+            cache_status = 'MISS' if cache_status == 'HIT' else cache_status
+
+        if httprequest.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            response = Response(body, status=200, mimetype=responses.JSON_MIMETYPE)
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'public, no-cache'
+        response.headers['X-Cache'] = cache_status
+        return response
 
     def _success_response(self, data, status=200):
         """Return successful JSON response"""
-        return Response(
-            json.dumps({
-                'success': True,
-                'data': data
-            }, default=str),
-            status=status,
-            mimetype='application/json'
-        )
+        return responses.success_response(data, status=status)
 
     def _error_response(self, message, status=400, errors=None):
         """Return error JSON response"""
-        response_data = {
-            'success': False,
-            'error': message
-        }
-        if errors:
-            response_data['errors'] = errors
-
-        return Response(
-            json.dumps(response_data),
-            status=status,
-            mimetype='application/json'
-        )
+        return responses.error_response(message, status=status, errors=errors)
 
     # ========== CRUD Endpoints ==========
 
-    @http.route('/api/training/blog/posts', type='http', auth='public', methods=['GET'], csrf=False)
+    @http.route('/api/training/blog/posts', type='http', auth='public', methods=['GET'], csrf=False, readonly=replica.use_replica)
+    @cached_public_response(['posts'])
     def get_posts(self, **params):
         """
         Get list of blog posts with pagination and filtering
@@ -99,35 +225,55 @@ class BlogApiController(http.Controller):
         - status: Filter by status (draft/published/archived)
         - author_id: Filter by author ID
         - featured: Filter featured posts (true/false)
+        - cursor: Opaque cursor for keyset pagination (send empty for the
+          first page, then the returned next_cursor); replaces page
+        - with_total: Also compute the total count in cursor mode (true/false)
+        - fields: Comma-separated fields to return (default: all), e.g. id,title,status
+        - expand: Relations to return as objects instead of ids (author)
 
         Example: GET /api/training/blog/posts?page=1&limit=10&status=published
+        Example: GET /api/training/blog/posts?cursor=&limit=10&status=published
+        Example: GET /api/training/blog/posts?fields=id,title,status
         """
         try:
             # Parse pagination parameters
-            page = int(params.get('page', 1))
-            limit = min(int(params.get('limit', 10)), 100)  # Max 100 items per page
+            page = max(1, int(params.get('page', 1)))
+            limit = max(1, min(int(params.get('limit', 10)), 100))  # Max 100 items per page
             offset = (page - 1) * limit
 
-            # Build domain (search filters)
-            domain = []
+            # Build domain (search filters) and the requested fields
+            domain = self._build_post_domain(params)
+            fieldset = self._post_fieldset()
 
-            if params.get('status'):
-                domain.append(('status', '=', params['status']))
+            Post = request.env['api.blog.post'].sudo()
 
-            if params.get('author_id'):
-                domain.append(('author_id', '=', int(params['author_id'])))
+            # Cursor mode: keyset pagination, count only on request
+            if 'cursor' in params:
+                posts, next_cursor = Post._keyset_search(domain, limit, cursor=params['cursor'])
+                posts_data, query_count = self._serialize_posts(posts, fieldset)
+
+                pagination = {
+                    'limit': limit,
+                    'next_cursor': next_cursor,
+                    'has_more': bool(next_cursor),
+                }
+                if params.get('with_total', '').lower() == 'true':
+                    pagination['total'] = Post.search_count(domain)
 
-            if params.get('featured'):
-                is_featured = params['featured'].lower() == 'true'
-                domain.append(('is_featured', '=', is_featured))
+                return self._success_response({
+                    'posts': posts_data,
+                    'pagination': pagination,
+                    'meta': {
+                        'query_count': query_count,
+                    }
+                })
 
             # Get posts with pagination
-            Post = request.env['api.blog.post'].sudo()
             total_count = Post.search_count(domain)
             posts = Post.search(domain, limit=limit, offset=offset, order='published_date desc')
 
-            # Serialize posts
-            posts_data = [self._serialize_post(post) for post in posts]
+            # Serialize posts (only the requested columns are read)
+            posts_data, query_count = self._serialize_posts(posts, fieldset)
 
             # Build response with pagination metadata
             return self._success_response({
@@ -137,6 +283,9 @@ class BlogApiController(http.Controller):
                     'limit': limit,
                     'total': total_count,
                     'pages': (total_count + limit - 1) // limit,  # Ceiling division
+                },
+                'meta': {
+                    'query_count': query_count,
                 }
             })
 
@@ -146,30 +295,46 @@ class BlogApiController(http.Controller):
             _logger.error(f'Error fetching posts: {str(e)}')
             return self._error_response('Internal server error', status=500)
 
-    @http.route('/api/training/blog/posts/<int:post_id>', type='http', auth='public', methods=['GET'], csrf=False)
+    @http.route('/api/training/blog/posts/<int:post_id>', type='http', auth='public', methods=['GET'], csrf=False, readonly=replica.use_replica)
     def get_post(self, post_id):
         """
         Get single blog post by ID
 
+        Query Parameters:
+        - fields: Comma-separated fields to return (default: all), e.g. id,title,status
+        - expand: Relations to return as objects instead of ids (author)
+
         Example: GET /api/training/blog/posts/1
+        Example: GET /api/training/blog/posts/1?fields=title,content&expand=author
         """
         try:
-            post = self._get_blog_post(post_id)
+            response = self._cached_response(
+                [f'post:{post_id}'], lambda: self._build_post_response(post_id)
+            )
 
-            if not post.exists():
-                return self._error_response('Post not found', status=404)
-
-            # Increment view count
-            post.action_increment_views()
+            if response.status_code in (200, 304):
+                # Increment view count (buffered; the record itself is not written)
+                self._get_blog_post(post_id).action_increment_views()
 
-            return self._success_response({
-                'post': self._serialize_post(post)
-            })
+            return response
 
+        except ValueError as e:
+            return self._error_response(f'Invalid parameter: {str(e)}', status=400)
         except Exception as e:
             _logger.error(f'Error fetching post {post_id}: {str(e)}')
             return self._error_response('Internal server error', status=500)
 
+    def _build_post_response(self, post_id):
+        """Build the (cacheable) single post response"""
+        post = self._get_blog_post(post_id)
+
+        if not post.exists():
+            return self._error_response('Post not found', status=404)
+
+        return self._success_response({
+            'post': self._serialize_post(post, self._post_fieldset())
+        })
+
     @http.route('/api/training/blog/posts', type='json', auth='user', methods=['POST'], csrf=False)
     def create_post(self, **params):
         """
@@ -317,7 +482,7 @@ class BlogApiController(http.Controller):
     @http.route('/api/training/blog/posts/<int:post_id>/like', type='json', auth='public', methods=['POST'], csrf=False)
     def like_post(self, post_id):
         """
-        Like a blog post
+        Like a blog post (once per user, or per visitor for anonymous likes)
 
         Example:
         POST /api/training/blog/posts/1/like
@@ -328,13 +493,14 @@ class BlogApiController(http.Controller):
             if not post.exists():
                 return {'success': False, 'error': 'Post not found'}
 
-            post.action_like()
+            result = post.action_like(fingerprint=self._visitor_fingerprint())
 
             return {
                 'success': True,
                 'data': {
-                    'like_count': post.like_count,
-                    'message': 'Post liked successfully'
+                    'like_count': result['like_count'],
+                    'liked': result['liked'],
+                    'message': 'Post liked successfully' if result['liked'] else 'Post already liked'
                 }
             }
 
@@ -342,11 +508,16 @@ class BlogApiController(http.Controller):
             _logger.error(f'Error liking post {post_id}: {str(e)}')
             return {'success': False, 'error': str(e)}
 
-    @http.route('/api/training/blog/posts/featured', type='http', auth='public', methods=['GET'], csrf=False)
+    @http.route('/api/training/blog/posts/featured', type='http', auth='public', methods=['GET'], csrf=False, readonly=replica.use_replica)
+    @cached_public_response(['posts'])
     def get_featured_posts(self):
         """
         Get all featured blog posts
 
+        Query Parameters:
+        - fields: Comma-separated fields to return (default: all), e.g. id,title,status
+        - expand: Relations to return as objects instead of ids (author)
+
         Example: GET /api/training/blog/posts/featured
         """
         try:
@@ -356,52 +527,117 @@ class BlogApiController(http.Controller):
                 ('status', '=', 'published')
             ], order='published_date desc')
 
-            posts_data = [self._serialize_post(post) for post in posts]
+            posts_data, query_count = self._serialize_posts(posts, self._post_fieldset())
 
             return self._success_response({
                 'posts': posts_data,
-                'count': len(posts_data)
+                'count': len(posts_data),
+                'meta': {
+                    'query_count': query_count,
+                }
             })
 
+        except ValueError as e:
+            return self._error_response(f'Invalid parameter: {str(e)}', status=400)
         except Exception as e:
             _logger.error(f'Error fetching featured posts: {str(e)}')
             return self._error_response('Internal server error', status=500)
 
-    @http.route('/api/training/blog/posts/search', type='http', auth='public', methods=['GET'], csrf=False)
+    @http.route('/api/training/blog/posts/search', type='http', auth='public', methods=['GET'], csrf=False, readonly=replica.use_replica)
+    @cached_public_response(['posts'])
     def search_posts(self, **params):
         """
-        Search blog posts by title or content
+        Full-text search of blog posts, ranked by relevance
 
         Query Parameters:
-        - q: Search query (searches in title and content)
+        - q: Search query (web search syntax: words, "exact phrase", or, -exclude)
         - limit: Maximum results (default: 20)
+        - fields: Comma-separated fields to return (default: all), e.g. id,title,status
+        - expand: Relations to return as objects instead of ids (author)
+
+        Each result includes a relevance 'rank' and a 'snippet' with the
+        matching words wrapped in <mark> tags. Relevance is ranked among
+        the 1000 most recent matching posts.
 
         Example: GET /api/training/blog/posts/search?q=python&limit=10
+        Example: GET /api/training/blog/posts/search?q="rest api" -graphql
         """
         try:
             query = params.get('q', '')
-            limit = min(int(params.get('limit', 20)), 100)
+            limit = max(1, min(int(params.get('limit', 20)), 100))
 
             if not query:
                 return self._error_response('Search query (q) is required', status=400)
 
-            # Search in title and content
+            # Ranked search on the GIN-indexed tsvector column
             Post = request.env['api.blog.post'].sudo()
-            posts = Post.search([
-                '|',
-                ('title', 'ilike', query),
-                ('content', 'ilike', query),
-                ('status', '=', 'published')
-            ], limit=limit, order='published_date desc')
+            hits = Post.search_fulltext(query, limit=limit)
+
+            posts = Post.browse([post_id for post_id, _rank, _snippet in hits])
+            posts_data, query_count = self._serialize_posts(posts, self._post_fieldset())
 
-            posts_data = [self._serialize_post(post) for post in posts]
+            for post_data, (_post_id, rank, snippet) in zip(posts_data, hits):
+                post_data['rank'] = round(rank, 6)
+                post_data['snippet'] = snippet
 
             return self._success_response({
                 'posts': posts_data,
                 'count': len(posts_data),
-                'query': query
+                'query': query,
+                'meta': {
+                    'query_count': query_count,
+                }
             })
 
+        except ValueError as e:
+            return self._error_response(f'Invalid parameter: {str(e)}', status=400)
         except Exception as e:
             _logger.error(f'Error searching posts: {str(e)}')
             return self._error_response('Internal server error', status=500)
+
+    @http.route('/api/training/blog/posts/export', type='http', auth='public', methods=['GET'], csrf=False)
+    def export_posts(self, **params):
+        """
+        Stream all matching blog posts in one response (for BI extracts)
+
+        Rows are read in id-ordered batches and written to a chunked
+        response as they are serialized, so memory stays bounded. An
+        export that fails midway still has a 200 status: ndjson and json
+        exports then end with an {"error": ...} item (see streaming).
+
+        Query Parameters:
+        - format: ndjson (default), json or csv
+        - status, author_id, featured: Same filters as GET /api/training/blog/posts
+        - fields: Comma-separated fields to return (default: all), e.g. id,title,status
+        - expand: Relations to return as objects instead of ids (author)
+
+        Example: GET /api/training/blog/posts/export?format=ndjson&status=published
+        """
+        try:
+            domain = self._build_post_domain(params)
+            fieldset = self._post_fieldset()
+            return stream_export(
+                'api.blog.post', domain, lambda posts: self._serialize_posts(posts, fieldset),
+                params.get('format', 'ndjson'), 'posts', fieldset.csv_columns(),
+            )
+
+        except ValueError as e:
+            return self._error_response(f'Invalid parameter: {str(e)}', status=400)
+        except Exception as e:
+            _logger.error(f'Error exporting posts: {str(e)}')
+            return self._error_response('Internal server error', status=500)
+
+    @http.route('/api/training/blog/cache/stats', type='http', auth='user', methods=['GET'], csrf=False)
+    def get_cache_stats(self):
+        """
+        Response cache statistics of the worker serving this request
+
+        Example: GET /api/training/blog/cache/stats
+        """
+        try:
+            stats = request.env['api.response.cache'].sudo().get_stats()
+            return self._success_response({'cache': stats})
+
+        except Exception as e:
+            _logger.error(f'Error fetching cache stats: {str(e)}')
+            return self._error_response('Internal server error', status=500)
@@ -7,34 +7,53 @@ This controller demonstrates:
 - API health check
 - API versioning
 - Rate limiting info
-- Available endpoints listing
+- Available endpoints listing, generated from the route registry
+- Precomputed static responses (pre-encoded bytes, ETag, Cache-Control)
 
 API Endpoints:
 GET /api/training                    - API documentation and welcome
 GET /api/training/health             - Health check
 GET /api/training/endpoints          - List all available endpoints
+GET /api/training/examples           - Usage examples
+GET /api/training/openapi.json       - OpenAPI 3 document
+GET /metrics                         - Prometheus metrics for /api/training/*
 """
 
-import json
+import hmac
+import ipaddress
 import logging
+import os
 from odoo import http
 from odoo.http import request, Response
+from odoo.tools import config
+
+from . import api_docs
+from .. import metrics
+from .. import replica
+from . import responses
 
 _logger = logging.getLogger(__name__)
 
+# Static documentation only changes on deployment
+DOCS_MAX_AGE = 86400
+
 
 class MainApiController(http.Controller):
 
     def _success_response(self, data, status=200):
         """Return successful JSON response"""
-        return Response(
-            json.dumps({
-                'success': True,
-                'data': data
-            }, default=str),
-            status=status,
-            mimetype='application/json'
-        )
+        return responses.success_response(data, status=status)
+
+    def _precomputed_response(self, name):
+        """Serve a precomputed document (see api_docs) with ETag / 304 support"""
+        document = api_docs.get_document(name)
+        headers = [('Cache-Control', f'public, max-age={DOCS_MAX_AGE}')]
+        if request.httprequest.if_none_match.contains(document.etag):
+            response = Response(status=304, headers=headers)
+        else:
+            response = Response(document.body, status=200, mimetype=responses.JSON_MIMETYPE, headers=headers)
+        response.set_etag(document.etag)
+        return response
 
     @http.route('/api/training', type='http', auth='public', methods=['GET'], csrf=False)
     def api_documentation(self):
@@ -43,81 +62,9 @@ class MainApiController(http.Controller):
 
         Example: GET /api/training
         """
-        doc = {
-            'name': 'API Training Course',
-            'version': '1.0.0',
-            'description': 'Learn backend API development with Odoo',
-            'base_url': '/api/training',
-            'authentication': {
-                'public': 'No authentication required',
-                'user': 'Requires user session authentication',
-                'note': 'For type=json endpoints, send credentials via session/cookies'
-            },
-            'features': [
-                'RESTful API Design',
-                'CRUD Operations',
-                'Authentication & Authorization',
-                'Pagination & Filtering',
-                'Search & Query',
-                'File Uploads',
-                'Error Handling',
-                'JSON Request/Response'
-            ],
-            'modules': {
-                'blog': {
-                    'description': 'Blog post management',
-                    'endpoints': '/api/training/blog/*'
-                },
-                'tasks': {
-                    'description': 'Task management system',
-                    'endpoints': '/api/training/tasks/*'
-                },
-                'users': {
-                    'description': 'User profile management',
-                    'endpoints': '/api/training/users/*'
-                }
-            },
-            'getting_started': {
-                'step_1': 'Install the api_training_course module in Odoo',
-                'step_2': 'Access /api/training/endpoints to see all available endpoints',
-                'step_3': 'Try GET /api/training/blog/posts to fetch blog posts',
-                'step_4': 'Read the controller source code to understand implementation',
-                'step_5': 'Experiment with creating your own endpoints'
-            },
-            'resources': {
-                'health_check': '/api/training/health',
-                'endpoints_list': '/api/training/endpoints',
-                'blog_api': '/api/training/blog/posts',
-                'tasks_api': '/api/training/tasks',
-                'profile_api': '/api/training/users/profile'
-            },
-            'learning_path': [
-                '1. Understand models (ORM, fields, constraints)',
-                '2. Learn controllers (routing, request handling)',
-                '3. Master CRUD operations (create, read, update, delete)',
-                '4. Implement authentication & authorization',
-                '5. Add pagination, filtering, and search',
-                '6. Handle file uploads and binary data',
-                '7. Implement proper error handling',
-                '8. Write API documentation',
-                '9. Test your APIs',
-                '10. Deploy to production'
-            ],
-            'tips': [
-                'Always validate input data',
-                'Use proper HTTP status codes',
-                'Return consistent JSON structure',
-                'Implement proper error messages',
-                'Add pagination for list endpoints',
-                'Use sudo() carefully for permissions',
-                'Log errors for debugging',
-                'Document your APIs'
-            ]
-        }
-
-        return self._success_response(doc)
-
-    @http.route('/api/training/health', type='http', auth='public', methods=['GET'], csrf=False)
+        return self._precomputed_response('welcome')
+
+    @http.route('/api/training/health', type='http', auth='public', methods=['GET'], csrf=False, readonly=replica.use_replica)
     def health_check(self):
         """
         API Health Check
@@ -147,70 +94,71 @@ class MainApiController(http.Controller):
 
         except Exception as e:
             _logger.error(f'Health check failed: {str(e)}')
-            return Response(
-                json.dumps({
-                    'success': False,
-                    'status': 'unhealthy',
-                    'error': str(e)
-                }),
-                status=500,
-                mimetype='application/json'
-            )
+            return responses.json_response({
+                'success': False,
+                'status': 'unhealthy',
+                'error': str(e)
+            }, status=500)
+
+    @http.route('/metrics', type='http', auth='none', methods=['GET'], csrf=False)
+    def prometheus_metrics(self):
+        """
+        Prometheus metrics for all /api/training/* routes (text format)
+
+        Request counts, latency / response size / SQL histograms per route
+        and response cache counters, summed over all Odoo workers.
+        If api_training_metrics_token is set in the Odoo configuration
+        file (or API_TRAINING_METRICS_TOKEN in the environment, as with
+        the shipped docker-compose.yml), scrapers must send it as
+        "Authorization: Bearer <token>".
+        Without a token, only direct requests from localhost are served
+        (not requests relayed by a proxy, which add X-Forwarded-For).
+
+        Example: GET /metrics
+        """
+        token = config.get('api_training_metrics_token') or os.environ.get('API_TRAINING_METRICS_TOKEN')
+        if token:
+            auth_header = request.httprequest.headers.get('Authorization', '')
+            if not hmac.compare_digest(auth_header, f'Bearer {token}'):
+                return Response('Unauthorized\n', status=401, mimetype='text/plain')
+        elif not self._is_local_request():
+            return Response('Forbidden\n', status=403, mimetype='text/plain')
+
+        snapshot = metrics.registry.merged_snapshot()
+        body = metrics.registry.render(snapshot)
+
+        # Derived gauge: response cache hit ratio over all workers
+        hits = snapshot.get('api_training_response_cache_hits_total', {}).get('samples', {}).get((), 0)
+        misses = snapshot.get('api_training_response_cache_misses_total', {}).get('samples', {}).get((), 0)
+        ratio = hits / (hits + misses) if hits + misses else 0.0
+        body += (
+            '# HELP api_training_response_cache_hit_ratio Response cache hits / lookups\n'
+            '# TYPE api_training_response_cache_hit_ratio gauge\n'
+            f'api_training_response_cache_hit_ratio {ratio:.6f}\n'
+        )
+
+        return Response(body, status=200, content_type='text/plain; version=0.0.4; charset=utf-8')
+
+    def _is_local_request(self):
+        """Whether the request comes straight from the loopback interface"""
+        httprequest = request.httprequest
+        if 'X-Forwarded-For' in httprequest.headers:
+            return False
+        try:
+            return ipaddress.ip_address(httprequest.remote_addr or '').is_loopback
+        except ValueError:
+            return False
 
     @http.route('/api/training/endpoints', type='http', auth='public', methods=['GET'], csrf=False)
     def list_endpoints(self):
         """
         List all available API endpoints
 
+        Generated from the @http.route metadata of the API controllers.
+
         Example: GET /api/training/endpoints
         """
-        endpoints = {
-            'meta': {
-                'GET /api/training': 'API documentation and welcome',
-                'GET /api/training/health': 'Health check endpoint',
-                'GET /api/training/endpoints': 'This endpoint - list all routes',
-            },
-            'blog_api': {
-                'GET /api/training/blog/posts': 'List all blog posts (with pagination)',
-                'GET /api/training/blog/posts/<id>': 'Get single blog post',
-                'POST /api/training/blog/posts': 'Create new blog post (auth required)',
-                'PUT /api/training/blog/posts/<id>': 'Update blog post (auth required)',
-                'DELETE /api/training/blog/posts/<id>': 'Delete blog post (auth required)',
-                'POST /api/training/blog/posts/<id>/like': 'Like a blog post',
-                'GET /api/training/blog/posts/featured': 'Get featured posts',
-                'GET /api/training/blog/posts/search': 'Search blog posts',
-            },
-            'task_api': {
-                'GET /api/training/tasks': 'List all tasks (auth required)',
-                'GET /api/training/tasks/<id>': 'Get single task (auth required)',
-                'POST /api/training/tasks': 'Create new task (auth required)',
-                'PUT /api/training/tasks/<id>': 'Update task (auth required)',
-                'DELETE /api/training/tasks/<id>': 'Delete task (auth required)',
-                'POST /api/training/tasks/<id>/start': 'Start task (auth required)',
-                'POST /api/training/tasks/<id>/complete': 'Complete task (auth required)',
-                'POST /api/training/tasks/<id>/cancel': 'Cancel task (auth required)',
-                'GET /api/training/tasks/my': 'Get my tasks (auth required)',
-                'GET /api/training/tasks/overdue': 'Get overdue tasks (auth required)',
-                'GET /api/training/tasks/stats': 'Get task statistics (auth required)',
-            },
-            'user_api': {
-                'GET /api/training/users/profile': 'Get my profile (auth required)',
-                'PUT /api/training/users/profile': 'Update my profile (auth required)',
-                'GET /api/training/users/<id>/profile': 'Get user profile (public)',
-                'POST /api/training/users/profile/avatar': 'Upload avatar (auth required)',
-                'GET /api/training/users/search': 'Search users',
-                'GET /api/training/users/leaderboard': 'Get user leaderboard',
-            },
-            'notes': {
-                'auth_public': 'No authentication required',
-                'auth_user': 'Requires user session authentication',
-                'query_params': 'Use ?param=value for query parameters',
-                'json_body': 'Send JSON in request body for POST/PUT',
-                'pagination': 'Use ?page=1&limit=10 for pagination',
-            }
-        }
-
-        return self._success_response(endpoints)
+        return self._precomputed_response('endpoints')
 
     @http.route('/api/training/examples', type='http', auth='public', methods=['GET'], csrf=False)
     def api_examples(self):
@@ -219,87 +167,13 @@ class MainApiController(http.Controller):
 
         Example: GET /api/training/examples
         """
-        examples = {
-            'getting_started': {
-                'description': 'Simple examples to get started',
-                'examples': [
-                    {
-                        'title': 'List all blog posts',
-                        'method': 'GET',
-                        'url': '/api/training/blog/posts',
-                        'curl': 'curl http://localhost:8069/api/training/blog/posts'
-                    },
-                    {
-                        'title': 'Get a single post',
-                        'method': 'GET',
-                        'url': '/api/training/blog/posts/1',
-                        'curl': 'curl http://localhost:8069/api/training/blog/posts/1'
-                    },
-                    {
-                        'title': 'Search posts',
-                        'method': 'GET',
-                        'url': '/api/training/blog/posts/search?q=python',
-                        'curl': 'curl http://localhost:8069/api/training/blog/posts/search?q=python'
-                    }
-                ]
-            },
-            'pagination': {
-                'description': 'Examples using pagination',
-                'examples': [
-                    {
-                        'title': 'Get page 2 with 20 items',
-                        'method': 'GET',
-                        'url': '/api/training/blog/posts?page=2&limit=20',
-                        'curl': 'curl http://localhost:8069/api/training/blog/posts?page=2&limit=20'
-                    }
-                ]
-            },
-            'filtering': {
-                'description': 'Examples using filters',
-                'examples': [
-                    {
-                        'title': 'Get published posts only',
-                        'method': 'GET',
-                        'url': '/api/training/blog/posts?status=published',
-                        'curl': 'curl http://localhost:8069/api/training/blog/posts?status=published'
-                    },
-                    {
-                        'title': 'Get high priority tasks',
-                        'method': 'GET',
-                        'url': '/api/training/tasks?priority=3',
-                        'curl': 'curl http://localhost:8069/api/training/tasks?priority=3',
-                        'note': 'Requires authentication'
-                    }
-                ]
-            },
-            'creating_data': {
-                'description': 'Examples creating data via POST',
-                'note': 'These require authentication and type=json',
-                'examples': [
-                    {
-                        'title': 'Create a blog post',
-                        'method': 'POST',
-                        'url': '/api/training/blog/posts',
-                        'body': {
-                            'title': 'My First API Post',
-                            'content': '<p>Learning APIs with Odoo!</p>',
-                            'status': 'published',
-                            'tags': 'api,learning,odoo'
-                        }
-                    },
-                    {
-                        'title': 'Create a task',
-                        'method': 'POST',
-                        'url': '/api/training/tasks',
-                        'body': {
-                            'name': 'Complete API Training',
-                            'description': 'Finish all training modules',
-                            'priority': '2',
-                            'status': 'todo'
-                        }
-                    }
-                ]
-            }
-        }
+        return self._precomputed_response('examples')
+
+    @http.route('/api/training/openapi.json', type='http', auth='public', methods=['GET'], csrf=False)
+    def openapi_document(self):
+        """
+        OpenAPI 3 description of all API endpoints
 
-        return self._success_response(examples)
+        Example: GET /api/training/openapi.json
+        """
+        return self._precomputed_response('openapi')
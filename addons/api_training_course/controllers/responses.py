@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Shared JSON Responses - Training Example
+
+This module demonstrates:
+- One response layer for every API controller
+- Consistent success/error envelopes
+
+Success: {"success": true, "data": ...}
+Error:   {"success": false, "error": "...", ...extra keys}
+
+Bodies are encoded by json_encoding (orjson when installed), so dates and
+datetimes can be passed as they are. Large arrays are streamed with
+json_encoding.iter_json_array instead (see streaming.stream_export).
+"""
+
+from odoo.http import Response, request
+
+from .. import json_encoding
+from .. import profiling
+
+JSON_MIMETYPE = 'application/json'
+
+
+@profiling.timed()
+def json_response(payload, status=200, headers=None):
+    """Encode any payload as a JSON response"""
+    return Response(
+        json_encoding.dumps(payload),
+        status=status,
+        mimetype=JSON_MIMETYPE,
+        headers=headers,
+    )
+
+
+def success_response(data, status=200, headers=None):
+    """Return successful JSON response"""
+    return json_response({'success': True, 'data': data}, status=status, headers=headers)
+
+
+def jsonrpc_safe(data):
+    """
+    Serialized records, ready for the result of the current route
+
+    type='json' results are encoded by Odoo's JSON-RPC layer, not by
+    json_encoding: dates and datetimes are converted to ISO 8601 strings
+    first, as http routes return them.
+    """
+    if request and request.dispatcher.routing_type == 'json':
+        return json_encoding.isoformat_dates(data)
+    return data
+
+
+def error_response(message, status=400, **extra):
+    """Return error JSON response; extra keys are added to the envelope"""
+    payload = {'success': False, 'error': message}
+    payload.update({key: value for key, value in extra.items() if value})
+    return json_response(payload, status=status)
+
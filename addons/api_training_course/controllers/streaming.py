@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+Streaming Export Helpers - Training Example
+
+This module demonstrates:
+- Generator-backed HTTP responses (chunked transfer encoding)
+- Walking a large table in id-ordered batches (keyset, no OFFSET)
+- Bounded memory: one batch in memory at a time, ORM cache cleared
+- NDJSON, JSON array and CSV output
+
+The generator runs after the controller has returned, when the request's
+own cursor is already closed, so it opens a dedicated cursor and
+environment for the duration of the export.
+
+The 200 status and headers are sent before the first row is read, so an
+error midway cannot change them. An NDJSON or JSON export that fails
+ends with EXPORT_ERROR_MARKER as its last line / array item: clients must
+treat an export ending with an item that has an "error" key as
+incomplete. A CSV export has no room for a marker and is just cut short;
+use ndjson or json when truncation must be detected.
+"""
+
+import csv
+import datetime
+import io
+import logging
+
+from odoo import api
+from odoo.http import request, Response
+
+from .. import json_encoding
+
+_logger = logging.getLogger(__name__)
+
+EXPORT_BATCH_SIZE = 1000
+
+# Last item of an NDJSON / JSON export that failed midway
+EXPORT_ERROR_MARKER = {'error': 'Export interrupted by a server error; the rows above are incomplete'}
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'json': 'application/json',
+    'csv': 'text/csv',
+}
+
+
+def flatten_row(data, prefix=''):
+    """Flatten nested dicts ('author.name') and lists (comma-joined) for CSV"""
+    row = {}
+    for key, value in data.items():
+        name = f'{prefix}{key}'
+        if isinstance(value, dict):
+            row.update(flatten_row(value, prefix=f'{name}.'))
+        elif isinstance(value, list):
+            row[name] = ','.join(str(item) for item in value)
+        elif isinstance(value, (datetime.date, datetime.datetime)):
+            row[name] = value.isoformat()
+        else:
+            row[name] = '' if value is None else value
+    return row
+
+
+def iter_batches(env, model_name, domain, batch_size=EXPORT_BATCH_SIZE):
+    """Yield recordsets of at most batch_size records, in id order"""
+    Model = env[model_name].sudo()
+    last_id = 0
+    while True:
+        records = Model.search(domain + [('id', '>', last_id)], order='id', limit=batch_size)
+        if not records:
+            return
+        yield records
+        last_id = records[-1].id
+        # Drop the batch from the ORM cache to keep memory bounded
+        env.invalidate_all()
+
+
+def stream_export(model_name, domain, serialize, export_format, filename, columns):
+    """
+    Build a chunked response streaming every record matching domain
+
+    serialize(records) must return (list_of_dicts, query_count), like the
+    controllers' batch serializers, and use records.env (not request.env).
+    columns: CSV header (see Fieldset.csv_columns), written even when no
+    record matches.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f'Unsupported export format: {export_format}')
+
+    registry = request.env.registry
+    uid = request.env.uid
+    context = dict(request.env.context)
+
+    def iter_rows(error_marker=None):
+        """Batches of serialized rows, then [error_marker] if reading fails"""
+        try:
+            with registry.cursor() as cr:
+                env = api.Environment(cr, uid, context)
+                for records in iter_batches(env, model_name, domain):
+                    rows, _query_count = serialize(records)
+                    yield rows
+        except Exception as e:
+            _logger.error(f'Error streaming {model_name} export: {str(e)}')
+            if error_marker is not None:
+                yield [error_marker]
+
+    def iter_csv(batches):
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction='ignore')
+        writer.writeheader()
+        for rows in batches:
+            writer.writerows(flatten_row(row) for row in rows)
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+
+    def generate():
+        try:
+            if export_format == 'ndjson':
+                for rows in iter_rows(EXPORT_ERROR_MARKER):
+                    yield b''.join(json_encoding.dumps(row) + b'\n' for row in rows)
+            elif export_format == 'json':
+                yield from json_encoding.iter_json_array(iter_rows(EXPORT_ERROR_MARKER))
+            else:
+                yield from iter_csv(iter_rows())
+        except Exception as e:
+            # Failed while encoding: headers are sent, the cut is the only signal
+            _logger.error(f'Error encoding {model_name} export: {str(e)}')
+
+    return Response(
+        generate(),
+        status=200,
+        mimetype=EXPORT_FORMATS[export_format],
+        headers=[('Content-Disposition', f'attachment; filename="{filename}.{export_format}"')],
+        direct_passthrough=True,
+    )
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+Sync API Controller - Training Example
+
+This controller demonstrates:
+- Delta sync: "what changed since my last sync" in one request
+- Opaque watermarks encoded as URL-safe base64 JSON
+- Deletions served from a tombstone log (api.sync.tombstone)
+- Tolerating commit-order skew with a safety window
+
+API Endpoints:
+GET /api/training/sync               - Records changed or deleted since a watermark
+
+A client stores the watermark of its last response and sends it back as
+?since=. For each resource, the response has the records written after
+the watermark (new or modified, full representation) and the ids deleted
+or moved out of the client's scope. Clients apply the deletions first,
+then upsert the changes, and repeat while has_more is true.
+
+write_date and deleted_at are the start time of the writing transaction,
+so a transaction may commit rows older than rows already served. Once the
+client caught up, the watermark is therefore set to now - SAFETY_WINDOW:
+the last SAFETY_WINDOW seconds are served again on the next sync, which
+costs a few duplicate (idempotent) upserts. Rows of a transaction that
+runs longer than SAFETY_WINDOW (a backfill, a large bulk write) can still
+be missed; clients that must not miss them resync from scratch after such
+maintenance.
+"""
+
+import base64
+import json
+import logging
+from datetime import datetime, timedelta
+from odoo import http
+from odoo.http import request
+
+from . import responses
+from .blog_api import BlogApiController
+from .task_api import TaskApiController
+from .user_api import UserApiController
+
+_logger = logging.getLogger(__name__)
+
+SAFETY_WINDOW = timedelta(seconds=120)
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 500
+
+
+class SyncApiController(http.Controller):
+
+    # ========== Resources ==========
+
+    # Resource name -> (model, domain of the current user's scope, fieldset)
+    # The domains must match each model's _sync_scope().
+    SYNC_RESOURCES = {
+        'tasks': (
+            'api.task',
+            lambda user: [('assigned_to', '=', user.id)],
+            TaskApiController._task_fields.all(),
+        ),
+        'posts': (
+            'api.blog.post',
+            lambda user: [('status', '=', 'published')],
+            BlogApiController._post_fields.all(),
+        ),
+        'profiles': (
+            'api.user.profile',
+            lambda user: [],
+            UserApiController._profile_fields.all([
+                name for name in UserApiController._profile_fields.fields
+                if name not in UserApiController._profile_private_fields
+            ]),
+        ),
+    }
+
+    # ========== Helper Methods ==========
+
+    def _success_response(self, data, status=200):
+        """Return successful JSON response"""
+        return responses.success_response(data, status=status)
+
+    def _error_response(self, message, status=400):
+        """Return error JSON response"""
+        return responses.error_response(message, status=status)
+
+    def _encode_watermark(self, watermark):
+        """
+        Encode {resource: [changed key, deleted key]} as an opaque string
+
+        Keys are (timestamp, id) pairs; timestamps keep their microseconds.
+        """
+        payload = json.dumps({
+            resource: [key and [key[0].isoformat(), key[1]] for key in keys]
+            for resource, keys in watermark.items()
+        }, separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+    def _decode_watermark(self, token):
+        """Decode a watermark string (raises ValueError)"""
+        try:
+            padding = '=' * (-len(token) % 4)
+            values = json.loads(base64.urlsafe_b64decode(token + padding))
+            watermark = {}
+            for resource, keys in values.items():
+                if resource not in self.SYNC_RESOURCES or len(keys) != 2:
+                    raise ValueError(resource)
+                watermark[resource] = [
+                    key and (datetime.fromisoformat(key[0]), int(key[1]))
+                    for key in keys
+                ]
+        except (TypeError, ValueError, AttributeError) as e:
+            raise ValueError('Invalid watermark') from e
+        return watermark
+
+    def _advance(self, last_key, has_more, horizon):
+        """
+        Next watermark key of a stream
+
+        Follows the last row while pages remain. On the last page (empty
+        or not), it moves to the horizon (now - SAFETY_WINDOW), or stays on
+        the last row if that is older, so that rows committed late inside
+        the window are served by the next sync, and the watermark of a
+        stream without rows keeps moving and does not expire.
+        """
+        if has_more:
+            return last_key
+        if last_key is None:
+            return (horizon, 0)
+        return min(last_key, (horizon, 0))
+
+    # ========== Sync Endpoint ==========
+
+    @http.route('/api/training/sync', type='http', auth='user', methods=['GET'], csrf=False)
+    def sync(self, **params):
+        """
+        Records changed or deleted since a watermark
+
+        Query Parameters:
+        - since: Watermark of the previous response (omit for a full sync)
+        - resources: Comma-separated resources (default: tasks,posts,profiles)
+        - limit: Changes and deletions per resource and page (default: 100, max: 500)
+
+        A watermark older than the tombstone retention (30 days) is answered
+        with 410 Gone: the client must drop its data and sync from scratch.
+
+        Example: GET /api/training/sync
+        Example: GET /api/training/sync?since=eyJ0YXNrcyI6...&resources=tasks
+        """
+        try:
+            limit = max(1, min(int(params.get('limit', DEFAULT_LIMIT)), MAX_LIMIT))
+            if limit < 1:
+                raise ValueError('limit must be positive')
+
+            resources = [name.strip() for name in params.get('resources', '').split(',') if name.strip()]
+            resources = resources or list(self.SYNC_RESOURCES)
+            unknown = set(resources) - set(self.SYNC_RESOURCES)
+            if unknown:
+                raise ValueError(f'unknown resources {", ".join(sorted(unknown))}')
+
+            watermark = self._decode_watermark(params['since']) if params.get('since') else {}
+
+            Tombstone = request.env['api.sync.tombstone'].sudo()
+            oldest = Tombstone._oldest_available()
+            if any(keys[1] and keys[1][0] < oldest for keys in watermark.values()):
+                return self._error_response('Watermark expired, start a full sync', status=410)
+
+            user = request.env.user
+            horizon = request.env.cr.now() - SAFETY_WINDOW
+            changes, deleted, has_more = {}, {}, False
+
+            for resource in resources:
+                model_name, scope_domain, fieldset = self.SYNC_RESOURCES[resource]
+                changed_key, deleted_key = watermark.get(resource, [None, None])
+
+                records, last_key, more = request.env[model_name].sudo()._sync_changes(
+                    scope_domain(user), changed_key, limit,
+                )
+                changes[resource] = fieldset.serialize(records)
+                changed_key = self._advance(last_key, more, horizon)
+                has_more = has_more or more
+
+                if resource in watermark:
+                    ids, last_key, more = Tombstone.read_after(model_name, user.id, deleted_key, limit)
+                    deleted[resource] = ids
+                    deleted_key = self._advance(last_key, more, horizon)
+                    has_more = has_more or more
+                else:
+                    # First sync of this resource: nothing to delete yet
+                    deleted[resource] = []
+                    deleted_key = (horizon, 0)
+
+                watermark[resource] = [changed_key, deleted_key]
+
+            return self._success_response({
+                'changes': changes,
+                'deleted': deleted,
+                'watermark': self._encode_watermark(watermark),
+                'has_more': has_more,
+            })
+
+        except ValueError as e:
+            return self._error_response(f'Invalid parameter: {str(e)}', status=400)
+        except Exception as e:
+            _logger.error(f'Error syncing: {str(e)}')
+            return self._error_response('Internal server error', status=500)
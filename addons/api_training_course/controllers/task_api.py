@@ -8,6 +8,8 @@ This controller demonstrates:
 - Action endpoints (start, complete, cancel)
 - User-specific queries (my tasks)
 - Statistics endpoints
+- Sparse fieldsets (?fields=, ?expand=)
+- Push notifications over the bus (task change events)
 
 API Endpoints:
 GET    /api/training/tasks                    - List all tasks
@@ -19,17 +21,35 @@ POST   /api/training/tasks/<int:id>/start     - Start task
 POST   /api/training/tasks/<int:id>/complete  - Complete task
 GET    /api/training/tasks/my                 - Get my tasks
 GET    /api/training/tasks/overdue            - Get overdue tasks
-GET    /api/training/tasks/stats              - Get task statistics
+GET    /api/training/tasks/stats              - Get task statistics (filterable)
+GET    /api/training/tasks/export             - Stream all tasks as NDJSON/JSON/CSV
+POST   /api/training/tasks/bulk               - Bulk create/update/delete tasks
+GET    /api/training/tasks/subscribe          - Bus channels of task change events
 """
 
 import json
 import logging
+from collections import defaultdict
 from odoo import http
-from odoo.http import request, Response
+from odoo.http import request
+
+from . import fieldsets
+from .streaming import stream_export
+from . import responses
+from .. import profiling
+from .. import task_events
 
 _logger = logging.getLogger(__name__)
 
 
+class BulkItemError(Exception):
+    """First failing item of an atomic bulk request (see bulk_tasks)"""
+
+    def __init__(self, item):
+        super().__init__(item['error'])
+        self.item = item
+
+
 class TaskApiController(http.Controller):
 
     # ========== Helper Methods ==========
@@ -38,53 +58,188 @@ class TaskApiController(http.Controller):
         """Helper to get task or return None"""
         return request.env['api.task'].sudo().browse(task_id)
 
-    def _serialize_task(self, task):
+    # Output fields of a task and the columns they are read from
+    _task_fields = fieldsets.ResourceFields({
+        'id': fieldsets.column('id'),
+        'name': fieldsets.column('name'),
+        'description': fieldsets.column('description'),
+        'assigned_to': fieldsets.column('assigned_to'),
+        'created_by': fieldsets.column('created_by'),
+        'project_name': fieldsets.column('project_name'),
+        'status': fieldsets.column('status'),
+        'priority': fieldsets.column('priority'),
+        'due_date': fieldsets.column('due_date', lambda row: row['due_date'] or None),
+        'completed_date': fieldsets.column('completed_date', lambda row: row['completed_date'] or None),
+        'is_overdue': fieldsets.column('is_overdue'),
+        'days_until_due': fieldsets.column('days_until_due'),
+        'estimated_hours': fieldsets.column('estimated_hours'),
+        'actual_hours': fieldsets.column('actual_hours'),
+        'progress': fieldsets.column('progress'),
+    }, relations={'assigned_to': 'assigned_to', 'created_by': 'created_by'})
+
+    def _task_fieldset(self):
+        """Fieldset selected by the request's ?fields= / ?expand= parameters"""
+        return self._task_fields.select(request.httprequest.args)
+
+    def _serialize_task(self, task, fieldset=None):
         """Convert task record to dictionary"""
+        tasks_data, _query_count = self._serialize_tasks(task, fieldset)
+        return tasks_data[0]
+
+    @profiling.timed()
+    def _serialize_tasks(self, tasks, fieldset=None):
+        """
+        Convert a task recordset to a list of dictionaries in one pass
+
+        Reads only the columns of the selected fields (all by default) for
+        the whole recordset, then resolves the names of expanded
+        assignees/creators with a single res.users lookup instead of
+        touching the relations record by record.
+
+        Returns a tuple (tasks_data, query_count) where query_count is the
+        number of SQL statements issued while serializing.
+        """
+        cr = tasks.env.cr
+        queries_before = cr.sql_log_count
+
+        fieldset = fieldset or self._task_fields.all()
+        tasks_data = responses.jsonrpc_safe(fieldset.serialize(tasks))
+
+        return tasks_data, cr.sql_log_count - queries_before
+
+    # Fields a client may change through the update endpoints
+    _task_update_fields = [
+        'name', 'description', 'assigned_to', 'project_name', 'status',
+        'priority', 'due_date', 'estimated_hours', 'actual_hours', 'progress',
+    ]
+
+    def _prepare_create_vals(self, params):
+        """Build create() values from request parameters"""
+        vals = {
+            'name': params['name'],
+            'description': params.get('description', ''),
+            'created_by': request.env.user.id,
+            'status': params.get('status', 'todo'),
+            'priority': params.get('priority', '1'),
+            'project_name': params.get('project_name', ''),
+        }
+
+        if params.get('assigned_to'):
+            vals['assigned_to'] = params['assigned_to']
+
+        if params.get('due_date'):
+            vals['due_date'] = params['due_date']
+
+        if params.get('estimated_hours'):
+            vals['estimated_hours'] = float(params['estimated_hours'])
+
+        return vals
+
+    def _prepare_update_vals(self, params):
+        """Build write() values from request parameters (whitelisted fields)"""
         return {
-            'id': task.id,
-            'name': task.name,
-            'description': task.description,
-            'assigned_to': {
-                'id': task.assigned_to.id,
-                'name': task.assigned_to_name,
-            } if task.assigned_to else None,
-            'created_by': {
-                'id': task.created_by.id,
-                'name': task.created_by.name,
-            } if task.created_by else None,
-            'project_name': task.project_name,
-            'status': task.status,
-            'priority': task.priority,
-            'due_date': task.due_date.isoformat() if task.due_date else None,
-            'completed_date': task.completed_date.isoformat() if task.completed_date else None,
-            'is_overdue': task.is_overdue,
-            'days_until_due': task.days_until_due,
-            'estimated_hours': task.estimated_hours,
-            'actual_hours': task.actual_hours,
-            'progress': task.progress,
+            field: params[field]
+            for field in self._task_update_fields
+            if field in params
+        }
+
+    def _build_task_domain(self, params):
+        """Build search domain from list filter query parameters"""
+        domain = []
+
+        if params.get('status'):
+            domain.append(('status', '=', params['status']))
+
+        if params.get('priority'):
+            domain.append(('priority', '=', params['priority']))
+
+        if params.get('assigned_to'):
+            domain.append(('assigned_to', '=', int(params['assigned_to'])))
+
+        if params.get('project'):
+            domain.append(('project_name', 'ilike', params['project']))
+
+        if params.get('overdue'):
+            is_overdue = params['overdue'].lower() == 'true'
+            domain.append(('is_overdue', '=', is_overdue))
+
+        return domain
+
+    def _list_tasks(self, domain, params):
+        """
+        Tasks matching domain for the /tasks/my and /tasks/overdue routes
+
+        These routes historically returned every matching task. They still
+        do unless the client asks for a page with ?page=, ?limit= or
+        ?cursor=, in which case the response is _paginate_tasks()'s.
+        """
+        if any(name in params for name in ('page', 'limit', 'cursor')):
+            data = self._paginate_tasks(domain, params)
+        else:
+            tasks = request.env['api.task'].sudo().search(domain)
+            tasks_data, query_count = self._serialize_tasks(tasks, self._task_fieldset())
+            data = {
+                'tasks': tasks_data,
+                'meta': {
+                    'query_count': query_count,
+                }
+            }
+        data['count'] = len(data['tasks'])
+        return data
+
+    def _paginate_tasks(self, domain, params):
+        """
+        One page of tasks matching domain, in the model order
+
+        Page mode (?page=, ?limit=) counts the total; cursor mode (?cursor=)
+        uses keyset pagination and counts only with ?with_total=true.
+        Returns the response data: tasks, pagination and meta.
+        """
+        page = max(1, int(params.get('page', 1)))
+        limit = max(1, min(int(params.get('limit', 20)), 100))
+        offset = (page - 1) * limit
+        fieldset = self._task_fieldset()
+
+        Task = request.env['api.task'].sudo()
+
+        # Cursor mode: keyset pagination, count only on request
+        if 'cursor' in params:
+            tasks, next_cursor = Task._keyset_search(domain, limit, cursor=params['cursor'])
+            pagination = {
+                'limit': limit,
+                'next_cursor': next_cursor,
+                'has_more': bool(next_cursor),
+            }
+            if params.get('with_total', '').lower() == 'true':
+                pagination['total'] = Task.search_count(domain)
+        else:
+            total_count = Task.search_count(domain)
+            tasks = Task.search(domain, limit=limit, offset=offset)
+            pagination = {
+                'page': page,
+                'limit': limit,
+                'total': total_count,
+                'pages': (total_count + limit - 1) // limit,
+            }
+
+        # Serialize (only the requested columns are read)
+        tasks_data, query_count = self._serialize_tasks(tasks, fieldset)
+
+        return {
+            'tasks': tasks_data,
+            'pagination': pagination,
+            'meta': {
+                'query_count': query_count,
+            }
         }
 
     def _success_response(self, data, status=200):
         """Return successful JSON response"""
-        return Response(
-            json.dumps({
-                'success': True,
-                'data': data
-            }, default=str),
-            status=status,
-            mimetype='application/json'
-        )
+        return responses.success_response(data, status=status)
 
     def _error_response(self, message, status=400):
         """Return error JSON response"""
-        return Response(
-            json.dumps({
-                'success': False,
-                'error': message
-            }),
-            status=status,
-            mimetype='application/json'
-        )
+        return responses.error_response(message, status=status)
 
     # ========== CRUD Endpoints ==========
 
@@ -101,52 +256,22 @@ class TaskApiController(http.Controller):
         - assigned_to: Filter by assigned user ID
         - project: Filter by project name
         - overdue: Show only overdue tasks (true/false)
+        - cursor: Opaque cursor for keyset pagination (send empty for the
+          first page, then the returned next_cursor); replaces page
+        - with_total: Also compute the total count in cursor mode (true/false)
+        - fields: Comma-separated fields to return (default: all), e.g. id,name,status
+        - expand: Relations to return as objects instead of ids (assigned_to, created_by)
 
         Example: GET /api/training/tasks?status=in_progress&priority=3
+        Example: GET /api/training/tasks?cursor=&limit=50
+        Example: GET /api/training/tasks?fields=id,name,status&expand=assigned_to
         """
         try:
-            # Parse pagination
-            page = int(params.get('page', 1))
-            limit = min(int(params.get('limit', 20)), 100)
-            offset = (page - 1) * limit
-
-            # Build domain
-            domain = []
-
-            if params.get('status'):
-                domain.append(('status', '=', params['status']))
-
-            if params.get('priority'):
-                domain.append(('priority', '=', params['priority']))
-
-            if params.get('assigned_to'):
-                domain.append(('assigned_to', '=', int(params['assigned_to'])))
-
-            if params.get('project'):
-                domain.append(('project_name', 'ilike', params['project']))
-
-            if params.get('overdue'):
-                is_overdue = params['overdue'].lower() == 'true'
-                domain.append(('is_overdue', '=', is_overdue))
-
-            # Get tasks
-            Task = request.env['api.task'].sudo()
-            total_count = Task.search_count(domain)
-            tasks = Task.search(domain, limit=limit, offset=offset)
-
-            # Serialize
-            tasks_data = [self._serialize_task(task) for task in tasks]
-
-            return self._success_response({
-                'tasks': tasks_data,
-                'pagination': {
-                    'page': page,
-                    'limit': limit,
-                    'total': total_count,
-                    'pages': (total_count + limit - 1) // limit,
-                }
-            })
+            domain = self._build_task_domain(params)
+            return self._success_response(self._paginate_tasks(domain, params))
 
+        except ValueError as e:
+            return self._error_response(f'Invalid parameter: {str(e)}', status=400)
         except Exception as e:
             _logger.error(f'Error fetching tasks: {str(e)}')
             return self._error_response('Internal server error', status=500)
@@ -156,6 +281,10 @@ class TaskApiController(http.Controller):
         """
         Get single task by ID
 
+        Query Parameters:
+        - fields: Comma-separated fields to return (default: all), e.g. id,name,status
+        - expand: Relations to return as objects instead of ids (assigned_to, created_by)
+
         Example: GET /api/training/tasks/1
         """
         try:
@@ -165,9 +294,11 @@ class TaskApiController(http.Controller):
                 return self._error_response('Task not found', status=404)
 
             return self._success_response({
-                'task': self._serialize_task(task)
+                'task': self._serialize_task(task, self._task_fieldset())
             })
 
+        except ValueError as e:
+            return self._error_response(f'Invalid parameter: {str(e)}', status=400)
         except Exception as e:
             _logger.error(f'Error fetching task {task_id}: {str(e)}')
             return self._error_response('Internal server error', status=500)
@@ -195,23 +326,7 @@ class TaskApiController(http.Controller):
                 return {'success': False, 'error': 'Task name is required'}
 
             # Prepare values
-            vals = {
-                'name': params['name'],
-                'description': params.get('description', ''),
-                'created_by': request.env.user.id,
-                'status': params.get('status', 'todo'),
-                'priority': params.get('priority', '1'),
-                'project_name': params.get('project_name', ''),
-            }
-
-            if params.get('assigned_to'):
-                vals['assigned_to'] = params['assigned_to']
-
-            if params.get('due_date'):
-                vals['due_date'] = params['due_date']
-
-            if params.get('estimated_hours'):
-                vals['estimated_hours'] = float(params['estimated_hours'])
+            vals = self._prepare_create_vals(params)
 
             # Create task
             task = request.env['api.task'].create(vals)
@@ -242,14 +357,7 @@ class TaskApiController(http.Controller):
                 return {'success': False, 'error': 'Task not found'}
 
             # Prepare update values
-            vals = {}
-            updateable_fields = ['name', 'description', 'assigned_to', 'project_name',
-                                 'status', 'priority', 'due_date', 'estimated_hours',
-                                 'actual_hours', 'progress']
-
-            for field in updateable_fields:
-                if field in params:
-                    vals[field] = params[field]
+            vals = self._prepare_update_vals(params)
 
             # Update task
             task.write(vals)
@@ -290,6 +398,198 @@ class TaskApiController(http.Controller):
             _logger.error(f'Error deleting task {task_id}: {str(e)}')
             return {'success': False, 'error': str(e)}
 
+    # ========== Bulk Endpoints ==========
+
+    def _bulk_max_rows(self):
+        """Maximum operations per bulk request (ir.config_parameter)"""
+        value = request.env['ir.config_parameter'].sudo().get_param(
+            'api_training_course.bulk_max_rows', '1000'
+        )
+        return int(value)
+
+    @http.route('/api/training/tasks/bulk', type='json', auth='user', methods=['POST'], csrf=False)
+    def bulk_tasks(self, **params):
+        """
+        Create, update and delete many tasks in one request / transaction
+
+        Request Body (JSON):
+        {
+            "create": [{"name": "Task A", "priority": "2"}, ...],  // optional
+            "update": [{"id": 5, "status": "done"}, ...],  // optional
+            "delete": [7, 8, 9],  // optional, task IDs
+            "atomic": true  // optional (default true): all or nothing
+        }
+
+        All creates go through one batched create(vals_list); updates with
+        identical values share one write(). The operations run in a
+        savepoint with the access rights of the current user. With
+        atomic=true, the first failing item rolls the savepoint back and is
+        the only error returned; with atomic=false, failing items are
+        rolled back individually (nested savepoints) and the others are
+        kept. The total number of operations is limited by the
+        api_training_course.bulk_max_rows system parameter (default 1000).
+
+        Response data: per-item results
+        {
+            "created": [{"index": 0, "id": 12}, ...],
+            "updated": [5, ...],
+            "deleted": [7, ...],
+            "errors": [{"op": "create", "index": 1, "id": null, "error": "..."}, ...]
+        }
+        Errors always have the same keys: the operation, the item's position
+        in its input list, the task id (null for creates) and the message.
+        """
+        try:
+            creates = params.get('create') or []
+            updates = params.get('update') or []
+            deletes = params.get('delete') or []
+            atomic = params.get('atomic', True)
+
+            total_rows = len(creates) + len(updates) + len(deletes)
+            max_rows = self._bulk_max_rows()
+            if total_rows > max_rows:
+                return {'success': False, 'error': f'Too many operations ({total_rows}); maximum is {max_rows}'}
+
+            results = {'created': [], 'updated': [], 'deleted': [], 'errors': []}
+
+            try:
+                with request.env.cr.savepoint():
+                    self._bulk_create(creates, atomic, results)
+                    self._bulk_update(updates, atomic, results)
+                    self._bulk_delete(deletes, atomic, results)
+            except BulkItemError as e:
+                # All or nothing: the savepoint undid this request's changes
+                return {
+                    'success': False,
+                    'error': 'Bulk operation rolled back',
+                    'data': {'created': [], 'updated': [], 'deleted': [], 'errors': [e.item]},
+                }
+
+            return {'success': not results['errors'], 'data': results}
+
+        except Exception as e:
+            _logger.error(f'Error in bulk task operation: {str(e)}')
+            return {'success': False, 'error': str(e)}
+
+    def _bulk_error(self, results, atomic, op, index, task_id, error):
+        """Report a failing item; in atomic mode, abort the whole bulk request"""
+        item = {'op': op, 'index': index, 'id': task_id, 'error': str(error)}
+        if atomic:
+            raise BulkItemError(item)
+        results['errors'].append(item)
+
+    def _bulk_create(self, creates, atomic, results):
+        """Validate rows, then create all valid ones with one create(vals_list)"""
+        Task = request.env['api.task']
+        indexes, vals_list = [], []
+        for index, item in enumerate(creates):
+            if not isinstance(item, dict) or not item.get('name'):
+                self._bulk_error(results, atomic, 'create', index, None, 'Task name is required')
+                continue
+            try:
+                vals_list.append(self._prepare_create_vals(item))
+                indexes.append(index)
+            except (TypeError, ValueError) as e:
+                self._bulk_error(results, atomic, 'create', index, None, e)
+
+        if not vals_list:
+            return
+
+        try:
+            with request.env.cr.savepoint():
+                tasks = Task.create(vals_list)
+            results['created'].extend(
+                {'index': index, 'id': task.id} for index, task in zip(indexes, tasks)
+            )
+            return
+        except Exception:
+            pass
+
+        # Batch failed: retry row by row to find which items are invalid
+        for index, vals in zip(indexes, vals_list):
+            try:
+                with request.env.cr.savepoint():
+                    task = Task.create([vals])
+                results['created'].append({'index': index, 'id': task.id})
+            except Exception as e:
+                self._bulk_error(results, atomic, 'create', index, None, e)
+
+    def _bulk_update(self, updates, atomic, results):
+        """Apply updates, one write() per group of identical values"""
+        Task = request.env['api.task']
+        groups = defaultdict(list)
+        group_vals = {}
+        for index, item in enumerate(updates):
+            if not isinstance(item, dict) or not isinstance(item.get('id'), int):
+                self._bulk_error(results, atomic, 'update', index, None, 'Task id is required')
+                continue
+            vals = self._prepare_update_vals(item)
+            key = json.dumps(vals, sort_keys=True, default=str)
+            groups[key].append((index, item['id']))
+            group_vals[key] = vals
+
+        existing = set(Task.browse([task_id for items in groups.values() for _index, task_id in items]).exists().ids)
+
+        for key, items in groups.items():
+            for index, task_id in items:
+                if task_id not in existing:
+                    self._bulk_error(results, atomic, 'update', index, task_id, 'Task not found')
+            items = [(index, task_id) for index, task_id in items if task_id in existing]
+            if not items:
+                continue
+
+            task_ids = [task_id for _index, task_id in items]
+            try:
+                with request.env.cr.savepoint():
+                    Task.browse(task_ids).write(group_vals[key])
+                results['updated'].extend(task_ids)
+                continue
+            except Exception:
+                pass
+
+            for index, task_id in items:
+                try:
+                    with request.env.cr.savepoint():
+                        Task.browse(task_id).write(group_vals[key])
+                    results['updated'].append(task_id)
+                except Exception as e:
+                    self._bulk_error(results, atomic, 'update', index, task_id, e)
+
+    def _bulk_delete(self, deletes, atomic, results):
+        """Delete all existing tasks with one unlink()"""
+        Task = request.env['api.task']
+        items = []
+        for index, task_id in enumerate(deletes):
+            if not isinstance(task_id, int):
+                self._bulk_error(results, atomic, 'delete', index, None, 'Invalid task id')
+                continue
+            items.append((index, task_id))
+
+        existing = set(Task.browse([task_id for _index, task_id in items]).exists().ids)
+        for index, task_id in items:
+            if task_id not in existing:
+                self._bulk_error(results, atomic, 'delete', index, task_id, 'Task not found')
+        items = [(index, task_id) for index, task_id in items if task_id in existing]
+        if not items:
+            return
+
+        tasks = Task.browse([task_id for _index, task_id in items])
+        try:
+            with request.env.cr.savepoint():
+                tasks.unlink()
+            results['deleted'].extend(tasks.ids)
+            return
+        except Exception:
+            pass
+
+        for index, task_id in items:
+            try:
+                with request.env.cr.savepoint():
+                    Task.browse(task_id).unlink()
+                results['deleted'].append(task_id)
+            except Exception as e:
+                self._bulk_error(results, atomic, 'delete', index, task_id, e)
+
     # ========== Action Endpoints ==========
 
     @http.route('/api/training/tasks/<int:task_id>/start', type='json', auth='user', methods=['POST'], csrf=False)
@@ -382,8 +682,13 @@ class TaskApiController(http.Controller):
 
         Query Parameters:
         - status: Filter by status (optional)
+        - page, limit, cursor, with_total: Pagination, as for GET /api/training/tasks.
+          Without page, limit or cursor, every matching task is returned
+        - fields: Comma-separated fields to return (default: all), e.g. id,name,status
+        - expand: Relations to return as objects instead of ids (assigned_to, created_by)
 
         Example: GET /api/training/tasks/my?status=in_progress
+        Example: GET /api/training/tasks/my?cursor=&limit=50
         """
         try:
             domain = [('assigned_to', '=', request.env.user.id)]
@@ -391,73 +696,146 @@ class TaskApiController(http.Controller):
             if params.get('status'):
                 domain.append(('status', '=', params['status']))
 
-            Task = request.env['api.task'].sudo()
-            tasks = Task.search(domain)
-
-            tasks_data = [self._serialize_task(task) for task in tasks]
-
-            return self._success_response({
-                'tasks': tasks_data,
-                'count': len(tasks_data)
-            })
+            return self._success_response(self._list_tasks(domain, params))
 
+        except ValueError as e:
+            return self._error_response(f'Invalid parameter: {str(e)}', status=400)
         except Exception as e:
             _logger.error(f'Error fetching my tasks: {str(e)}')
             return self._error_response('Internal server error', status=500)
 
     @http.route('/api/training/tasks/overdue', type='http', auth='user', methods=['GET'], csrf=False)
-    def get_overdue_tasks(self):
+    def get_overdue_tasks(self, **params):
         """
-        Get all overdue tasks
+        Get overdue tasks, most urgent first
+
+        Query Parameters:
+        - page, limit, cursor, with_total: Pagination, as for GET /api/training/tasks.
+          Without page, limit or cursor, every overdue task is returned
+        - fields: Comma-separated fields to return (default: all), e.g. id,name,status
+        - expand: Relations to return as objects instead of ids (assigned_to, created_by)
 
         Example: GET /api/training/tasks/overdue
+        Example: GET /api/training/tasks/overdue?cursor=&limit=50
         """
         try:
-            Task = request.env['api.task'].sudo()
-            tasks = Task.search([('is_overdue', '=', True)])
+            return self._success_response(self._list_tasks([('is_overdue', '=', True)], params))
 
-            tasks_data = [self._serialize_task(task) for task in tasks]
+        except ValueError as e:
+            return self._error_response(f'Invalid parameter: {str(e)}', status=400)
+        except Exception as e:
+            _logger.error(f'Error fetching overdue tasks: {str(e)}')
+            return self._error_response('Internal server error', status=500)
 
-            return self._success_response({
-                'tasks': tasks_data,
-                'count': len(tasks_data)
-            })
+    @http.route('/api/training/tasks/export', type='http', auth='user', methods=['GET'], csrf=False)
+    def export_tasks(self, **params):
+        """
+        Stream all matching tasks in one response (for BI extracts)
+
+        Rows are read in id-ordered batches and written to a chunked
+        response as they are serialized, so memory stays bounded. An
+        export that fails midway still has a 200 status: ndjson and json
+        exports then end with an {"error": ...} item (see streaming).
+
+        Query Parameters:
+        - format: ndjson (default), json or csv
+        - status, priority, assigned_to, project, overdue: Same filters as
+          GET /api/training/tasks
+        - fields: Comma-separated fields to return (default: all), e.g. id,name,status
+        - expand: Relations to return as objects instead of ids (assigned_to, created_by)
 
+        Example: GET /api/training/tasks/export?format=csv&status=done
+        """
+        try:
+            domain = self._build_task_domain(params)
+            fieldset = self._task_fieldset()
+            return stream_export(
+                'api.task', domain, lambda tasks: self._serialize_tasks(tasks, fieldset),
+                params.get('format', 'ndjson'), 'tasks', fieldset.csv_columns(),
+            )
+
+        except ValueError as e:
+            return self._error_response(f'Invalid parameter: {str(e)}', status=400)
         except Exception as e:
-            _logger.error(f'Error fetching overdue tasks: {str(e)}')
+            _logger.error(f'Error exporting tasks: {str(e)}')
             return self._error_response('Internal server error', status=500)
 
     @http.route('/api/training/tasks/stats', type='http', auth='user', methods=['GET'], csrf=False)
-    def get_task_stats(self):
+    def get_task_stats(self, **params):
         """
-        Get task statistics
+        Get task statistics (computed in a single aggregate query)
+
+        Query Parameters:
+        - status, priority, assigned_to, project, overdue: Same filters as
+          GET /api/training/tasks, to scope the statistics
+        - breakdown: Comma-separated extra breakdowns (project, assignee)
 
         Example: GET /api/training/tasks/stats
+        Example: GET /api/training/tasks/stats?project=Alpha&breakdown=assignee
         """
         try:
-            Task = request.env['api.task'].sudo()
+            domain = self._build_task_domain(params)
+            breakdowns = [b.strip() for b in params.get('breakdown', '').split(',') if b.strip()]
 
-            stats = {
-                'total': Task.search_count([]),
-                'by_status': {
-                    'todo': Task.search_count([('status', '=', 'todo')]),
-                    'in_progress': Task.search_count([('status', '=', 'in_progress')]),
-                    'review': Task.search_count([('status', '=', 'review')]),
-                    'done': Task.search_count([('status', '=', 'done')]),
-                    'cancelled': Task.search_count([('status', '=', 'cancelled')]),
-                },
-                'by_priority': {
-                    'low': Task.search_count([('priority', '=', '0')]),
-                    'normal': Task.search_count([('priority', '=', '1')]),
-                    'high': Task.search_count([('priority', '=', '2')]),
-                    'urgent': Task.search_count([('priority', '=', '3')]),
-                },
-                'overdue': Task.search_count([('is_overdue', '=', True)]),
-                'my_tasks': Task.search_count([('assigned_to', '=', request.env.user.id)]),
-            }
+            Task = request.env['api.task'].sudo()
+            stats = Task.get_stats(domain, breakdowns=breakdowns)
 
             return self._success_response(stats)
 
+        except ValueError as e:
+            return self._error_response(f'Invalid parameter: {str(e)}', status=400)
         except Exception as e:
             _logger.error(f'Error fetching task stats: {str(e)}')
             return self._error_response('Internal server error', status=500)
+
+    # ========== Push Notifications ==========
+
+    @http.route('/api/training/tasks/subscribe', type='http', auth='user', methods=['GET'], csrf=False)
+    def subscribe_task_events(self, **params):
+        """
+        Bus channels to listen to for task change events
+
+        Instead of polling /tasks/my or /tasks/stats, open the Odoo websocket
+        (wss://<host>/websocket, with the session cookie) and send the
+        returned subscribe_message. Each change then arrives as
+        {"id": ..., "message": {"type": "api_training/task", "payload": {...}}}
+        with payload: event (created, updated, deleted), id, name, status,
+        previous_status (on status changes), priority, progress, assigned_to,
+        project_name, due_date and changed (the fields written).
+
+        Query Parameters:
+        - assignees: Comma-separated user ids, or "me" (default: me)
+        - projects: Comma-separated project names (default: none)
+
+        Example: GET /api/training/tasks/subscribe
+        Example: GET /api/training/tasks/subscribe?assignees=me,7&projects=Alpha
+        """
+        try:
+            assignees = [a.strip() for a in params.get('assignees', 'me').split(',') if a.strip()]
+            projects = [p.strip() for p in params.get('projects', '').split(',') if p.strip()]
+
+            channels = [
+                task_events.assignee_channel(request.env.user.id if assignee == 'me' else int(assignee))
+                for assignee in assignees
+            ]
+            channels += [task_events.project_channel(project) for project in projects]
+            if not channels:
+                raise ValueError('no assignees or projects to subscribe to')
+
+            last = request.env['bus.bus'].sudo()._bus_last_id()
+            return self._success_response({
+                'websocket_url': '/websocket',
+                'notification_type': task_events.NOTIFICATION_TYPE,
+                'channels': channels,
+                'last': last,
+                'subscribe_message': {
+                    'event_name': 'subscribe',
+                    'data': {'channels': channels, 'last': last},
+                },
+            })
+
+        except ValueError as e:
+            return self._error_response(f'Invalid parameter: {str(e)}', status=400)
+        except Exception as e:
+            _logger.error(f'Error preparing task subscription: {str(e)}')
+            return self._error_response('Internal server error', status=500)
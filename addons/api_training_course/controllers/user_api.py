@@ -4,101 +4,132 @@ User Profile API Controller - Training Example
 
 This controller demonstrates:
 - User profile management
-- File uploads (avatar)
+- Streaming file uploads with magic-byte validation (avatar)
+- Immutable, content-hashed image URLs with long cache lifetimes
 - Profile validation
 - User-specific endpoints
 - Statistics and metrics
+- Sparse fieldsets (?fields=)
+- Public reads served from a read replica (see replica.py)
 
 API Endpoints:
 GET    /api/training/users/profile              - Get current user profile
 PUT    /api/training/users/profile              - Update current user profile
 GET    /api/training/users/<int:id>/profile     - Get user profile by ID (public)
 POST   /api/training/users/profile/avatar       - Upload avatar image
+GET    /api/training/users/<int:id>/avatar/<int:size>/<hash> - Avatar thumbnail (WebP)
 GET    /api/training/users/search               - Search users
 """
 
-import json
-import base64
 import logging
+
+import psycopg2
+
 from odoo import http
-from odoo.http import request, Response
+from odoo.exceptions import ValidationError
+from odoo.http import request
+
+from . import responses
+from . import fieldsets
+from .. import avatar_images
+from .. import profiling
+from .. import replica
+from ..models.api_user_profile import AVATAR_FIELDS, SOCIAL_LINK_FIELDS, social_links, split_list
 
 _logger = logging.getLogger(__name__)
 
+# Errors Odoo answers by replaying the request: a write on the read-only
+# replica (replayed on the primary), a profile created concurrently after
+# this transaction's snapshot (replayed on a fresh snapshot)
+RETRIED_ERRORS = (psycopg2.errors.ReadOnlySqlTransaction, psycopg2.errors.SerializationFailure)
+
+
+def avatar_urls(row):
+    """Immutable thumbnail URLs of a profile row, by size; None without avatar"""
+    if not row['avatar_hash']:
+        return None
+    return {
+        str(size): f'/api/training/users/{row["user_id"]}/avatar/{size}/{row["avatar_hash"]}'
+        for size in sorted(AVATAR_FIELDS)
+    }
+
 
 class UserApiController(http.Controller):
 
     # ========== Helper Methods ==========
 
     def _get_profile(self, user_id):
-        """Helper to get user profile or create if doesn't exist"""
-        Profile = request.env['api.user.profile'].sudo()
-        profile = Profile.search([('user_id', '=', user_id)], limit=1)
-
-        # Auto-create profile if doesn't exist
-        if not profile:
-            profile = Profile.create({'user_id': user_id})
+        """Helper to get user profile or create if doesn't exist (cached lookup)"""
+        return request.env['api.user.profile'].sudo().get_or_create_for_user(user_id)
+
+    # Output fields of a profile and the columns they are read from
+    _profile_fields = fieldsets.ResourceFields({
+        'id': fieldsets.column('id'),
+        'user_id': fieldsets.column('user_id'),
+        'display_name': fieldsets.column('display_name'),
+        'bio': fieldsets.column('bio'),
+        'avatar_url': fieldsets.column('avatar_url'),
+        'avatars': (('user_id', 'avatar_hash'), avatar_urls),
+        'job_title': fieldsets.column('job_title'),
+        'company': fieldsets.column('company'),
+        'years_of_experience': fieldsets.column('years_of_experience'),
+        'skills': fieldsets.column('skills', lambda row: split_list(row['skills'])),
+        'interests': fieldsets.column('interests', lambda row: split_list(row['interests'])),
+        'city': fieldsets.column('city'),
+        'country': fieldsets.column('country'),
+        'social_links': (SOCIAL_LINK_FIELDS, social_links),
+        'profile_views': fieldsets.column('profile_views'),
+        'posts_count': fieldsets.column('posts_count'),
+        'tasks_count': fieldsets.column('tasks_count'),
+        'is_verified': fieldsets.column('is_verified'),
+        'account_created': fieldsets.column('account_created', lambda row: row['account_created'] or None),
+        # Private fields, only for the own profile
+        'phone': fieldsets.column('phone'),
+        'website': fieldsets.column('website'),
+        'timezone': fieldsets.column('timezone'),
+        'preferred_language': fieldsets.column('preferred_language'),
+        'email_notifications': fieldsets.column('email_notifications'),
+        'newsletter_subscription': fieldsets.column('newsletter_subscription'),
+        'last_login': fieldsets.column('last_login', lambda row: row['last_login'] or None),
+    })
+
+    _profile_private_fields = [
+        'phone', 'website', 'timezone', 'preferred_language',
+        'email_notifications', 'newsletter_subscription', 'last_login',
+    ]
+
+    def _profile_available_fields(self, include_private):
+        if include_private:
+            return None
+        return [name for name in self._profile_fields.fields if name not in self._profile_private_fields]
 
-        return profile
+    def _profile_fieldset(self, include_private=False):
+        """Fieldset selected by the request's ?fields= parameter"""
+        available = self._profile_available_fields(include_private)
+        return self._profile_fields.select(request.httprequest.args, available=available)
 
-    def _serialize_profile(self, profile, include_private=False):
+    def _serialize_profile(self, profile, include_private=False, fieldset=None):
         """Convert profile record to dictionary"""
-        data = {
-            'id': profile.id,
-            'user_id': profile.user_id.id,
-            'display_name': profile.display_name,
-            'bio': profile.bio,
-            'avatar_url': profile.avatar_url,
-            'job_title': profile.job_title,
-            'company': profile.company,
-            'years_of_experience': profile.years_of_experience,
-            'skills': profile.get_skills_list(),
-            'interests': profile.get_interests_list(),
-            'city': profile.city,
-            'country': profile.country,
-            'social_links': profile.get_social_links(),
-            'profile_views': profile.profile_views,
-            'posts_count': profile.posts_count,
-            'tasks_count': profile.tasks_count,
-            'is_verified': profile.is_verified,
-            'account_created': profile.account_created.isoformat() if profile.account_created else None,
-        }
+        return self._serialize_profiles(profile, include_private, fieldset)[0]
 
-        # Include private info only for own profile
-        if include_private:
-            data.update({
-                'phone': profile.phone,
-                'website': profile.website,
-                'timezone': profile.timezone,
-                'preferred_language': profile.preferred_language,
-                'email_notifications': profile.email_notifications,
-                'newsletter_subscription': profile.newsletter_subscription,
-                'last_login': profile.last_login.isoformat() if profile.last_login else None,
-            })
+    @profiling.timed()
+    def _serialize_profiles(self, profiles, include_private=False, fieldset=None):
+        """
+        Convert a profile recordset to a list of dictionaries in one pass
 
-        return data
+        Only the columns of the selected fields are read (all by default);
+        private info is included only when include_private is set.
+        """
+        fieldset = fieldset or self._profile_fields.all(self._profile_available_fields(include_private))
+        return responses.jsonrpc_safe(fieldset.serialize(profiles))
 
     def _success_response(self, data, status=200):
         """Return successful JSON response"""
-        return Response(
-            json.dumps({
-                'success': True,
-                'data': data
-            }, default=str),
-            status=status,
-            mimetype='application/json'
-        )
+        return responses.success_response(data, status=status)
 
     def _error_response(self, message, status=400):
         """Return error JSON response"""
-        return Response(
-            json.dumps({
-                'success': False,
-                'error': message
-            }),
-            status=status,
-            mimetype='application/json'
-        )
+        return responses.error_response(message, status=status)
 
     # ========== Profile Endpoints ==========
 
@@ -107,6 +138,9 @@ class UserApiController(http.Controller):
         """
         Get current user's profile (includes private info)
 
+        Query Parameters:
+        - fields: Comma-separated fields to return (default: all), e.g. id,display_name,job_title
+
         Example: GET /api/training/users/profile
         """
         try:
@@ -116,9 +150,15 @@ class UserApiController(http.Controller):
             profile.action_update_last_login()
 
             return self._success_response({
-                'profile': self._serialize_profile(profile, include_private=True)
+                'profile': self._serialize_profile(
+                    profile, include_private=True, fieldset=self._profile_fieldset(include_private=True)
+                )
             })
 
+        except RETRIED_ERRORS:
+            raise
+        except ValueError as e:
+            return self._error_response(f'Invalid parameter: {str(e)}', status=400)
         except Exception as e:
             _logger.error(f'Error fetching user profile: {str(e)}')
             return self._error_response('Internal server error', status=500)
@@ -180,15 +220,20 @@ class UserApiController(http.Controller):
                 }
             }
 
+        except RETRIED_ERRORS:
+            raise
         except Exception as e:
             _logger.error(f'Error updating profile: {str(e)}')
             return {'success': False, 'error': str(e)}
 
-    @http.route('/api/training/users/<int:user_id>/profile', type='http', auth='public', methods=['GET'], csrf=False)
+    @http.route('/api/training/users/<int:user_id>/profile', type='http', auth='public', methods=['GET'], csrf=False, readonly=replica.use_replica)
     def get_user_profile(self, user_id):
         """
         Get user profile by ID (public info only)
 
+        Query Parameters:
+        - fields: Comma-separated fields to return (default: all), e.g. id,display_name,job_title
+
         Example: GET /api/training/users/5/profile
         """
         try:
@@ -199,13 +244,18 @@ class UserApiController(http.Controller):
 
             profile = self._get_profile(user_id)
 
-            # Increment view count
+            # Increment view count (buffered; the record itself is not written)
             profile.action_increment_views()
 
             return self._success_response({
-                'profile': self._serialize_profile(profile, include_private=False)
+                'profile': self._serialize_profile(profile, fieldset=self._profile_fieldset())
             })
 
+        except RETRIED_ERRORS:
+            # First access creates the profile: Odoo replays the request
+            raise
+        except ValueError as e:
+            return self._error_response(f'Invalid parameter: {str(e)}', status=400)
         except Exception as e:
             _logger.error(f'Error fetching profile for user {user_id}: {str(e)}')
             return self._error_response('Internal server error', status=500)
@@ -216,7 +266,13 @@ class UserApiController(http.Controller):
         Upload avatar image
 
         Form Data:
-        - avatar: File upload (image file)
+        - avatar: File upload (JPG, PNG, GIF or WebP, max 2MB)
+
+        The spooled file is copied in chunks and rejected as soon as it
+        exceeds the limit; its type is checked from its first bytes, not
+        its name.
+        64, 128 and 512 px WebP thumbnails are generated once, here, and
+        returned as URLs in the profile's "avatars" field.
 
         Example: POST /api/training/users/profile/avatar
         Content-Type: multipart/form-data
@@ -225,43 +281,65 @@ class UserApiController(http.Controller):
             # Get uploaded file
             avatar_file = params.get('avatar')
 
-            if not avatar_file:
+            if not avatar_file or not hasattr(avatar_file, 'stream'):
                 return self._error_response('No file uploaded', status=400)
 
-            # Validate file type (basic check)
-            filename = avatar_file.filename if hasattr(avatar_file, 'filename') else ''
-            allowed_extensions = ['.jpg', '.jpeg', '.png', '.gif']
-
-            if not any(filename.lower().endswith(ext) for ext in allowed_extensions):
-                return self._error_response(
-                    'Invalid file type. Allowed: JPG, PNG, GIF',
-                    status=400
-                )
-
-            # Read file and encode to base64
-            file_content = avatar_file.read()
+            data = avatar_images.read_upload(avatar_file.stream)
 
-            # Check file size (max 2MB)
-            max_size = 2 * 1024 * 1024  # 2MB in bytes
-            if len(file_content) > max_size:
-                return self._error_response('File too large. Maximum size: 2MB', status=400)
-
-            avatar_base64 = base64.b64encode(file_content)
-
-            # Update profile
+            # Update profile (thumbnails are derived by the model)
             profile = self._get_profile(request.env.user.id)
-            profile.write({'avatar': avatar_base64})
+            profile.set_avatar(data)
 
             return self._success_response({
                 'message': 'Avatar uploaded successfully',
                 'profile': self._serialize_profile(profile, include_private=True)
             })
 
+        except RETRIED_ERRORS:
+            raise
+        except avatar_images.AvatarTooLarge as e:
+            return self._error_response(str(e), status=413)
+        except (ValueError, ValidationError) as e:
+            return self._error_response(str(e), status=400)
         except Exception as e:
             _logger.error(f'Error uploading avatar: {str(e)}')
             return self._error_response('Internal server error', status=500)
 
-    @http.route('/api/training/users/search', type='http', auth='public', methods=['GET'], csrf=False)
+    @http.route('/api/training/users/<int:user_id>/avatar/<int:size>/<string:unique>', type='http', auth='public', methods=['GET'], csrf=False)
+    def get_avatar(self, user_id, size, unique):
+        """
+        Get an avatar thumbnail (WebP)
+
+        Use the URLs of a profile's "avatars" field: they contain the
+        avatar's content hash, so responses are cached for a year as
+        immutable. An outdated hash redirects to the current avatar.
+
+        Example: GET /api/training/users/5/avatar/128/3f2a9c0d1e4b5a67
+        """
+        try:
+            field_name = AVATAR_FIELDS.get(size)
+            profile = request.env['api.user.profile'].sudo()._profile_for_user(user_id)
+            if not field_name or not profile or not profile.avatar_hash:
+                return self._error_response('Avatar not found', status=404)
+
+            if unique != profile.avatar_hash:
+                return request.redirect(
+                    f'/api/training/users/{user_id}/avatar/{size}/{profile.avatar_hash}', code=302
+                )
+
+            # Streamed from the filestore; ETag/If-None-Match handled by send_file
+            stream = request.env['ir.binary']._get_stream_from(
+                profile, field_name,
+                filename=f'avatar_{user_id}_{size}.webp',
+                mimetype=avatar_images.AVATAR_MIMETYPE,
+            )
+            return stream.get_response(immutable=True)
+
+        except Exception as e:
+            _logger.error(f'Error serving avatar of user {user_id}: {str(e)}')
+            return self._error_response('Internal server error', status=500)
+
+    @http.route('/api/training/users/search', type='http', auth='public', methods=['GET'], csrf=False, readonly=replica.use_replica)
     def search_users(self, **params):
         """
         Search users by name or job title
@@ -269,12 +347,13 @@ class UserApiController(http.Controller):
         Query Parameters:
         - q: Search query (searches in name and job title)
         - limit: Maximum results (default: 10)
+        - fields: Comma-separated fields to return (default: all), e.g. id,display_name,job_title
 
         Example: GET /api/training/users/search?q=developer&limit=5
         """
         try:
             query = params.get('q', '')
-            limit = min(int(params.get('limit', 10)), 50)
+            limit = max(1, min(int(params.get('limit', 10)), 50))
 
             if not query:
                 return self._error_response('Search query (q) is required', status=400)
@@ -289,10 +368,7 @@ class UserApiController(http.Controller):
                 ('company', 'ilike', query),
             ], limit=limit)
 
-            profiles_data = [
-                self._serialize_profile(profile, include_private=False)
-                for profile in profiles
-            ]
+            profiles_data = self._serialize_profiles(profiles, fieldset=self._profile_fieldset())
 
             return self._success_response({
                 'profiles': profiles_data,
@@ -300,11 +376,13 @@ class UserApiController(http.Controller):
                 'query': query
             })
 
+        except ValueError as e:
+            return self._error_response(f'Invalid parameter: {str(e)}', status=400)
         except Exception as e:
             _logger.error(f'Error searching users: {str(e)}')
             return self._error_response('Internal server error', status=500)
 
-    @http.route('/api/training/users/leaderboard', type='http', auth='public', methods=['GET'], csrf=False)
+    @http.route('/api/training/users/leaderboard', type='http', auth='public', methods=['GET'], csrf=False, readonly=replica.use_replica)
     def get_leaderboard(self, **params):
         """
         Get user leaderboard by blog posts count
@@ -315,11 +393,11 @@ class UserApiController(http.Controller):
         Example: GET /api/training/users/leaderboard?limit=10
         """
         try:
-            limit = min(int(params.get('limit', 10)), 50)
+            limit = max(1, min(int(params.get('limit', 10)), 50))
 
             Profile = request.env['api.user.profile'].sudo()
 
-            # Get profiles ordered by posts count
+            # Get profiles ordered by posts count (stored, indexed column)
             profiles = Profile.search([], order='posts_count desc', limit=limit)
 
             leaderboard = []
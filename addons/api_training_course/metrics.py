@@ -0,0 +1,378 @@
+# -*- coding: utf-8 -*-
+"""
+API Metrics Registry - Training Example
+
+A small, dependency-free Prometheus metrics registry for the
+/api/training/* endpoints.
+
+This module demonstrates:
+- Counters and histograms in Prometheus text exposition format
+- Thread-safe in-process metric collection
+- Aggregating metrics across Odoo worker processes
+
+Every worker records into its own in-memory registry. With several
+workers, each one periodically dumps a snapshot to
+<data_dir>/api_training_metrics/<pid>-<token>.json and the /metrics
+endpoint merges all snapshots, so a scrape sees the totals of every
+worker no matter which worker answers it.
+
+Snapshots of dead workers are folded into retired.json and removed, so
+counters never go backwards when a worker is recycled and the directory
+does not grow with every worker ever started. The random token keeps a
+new worker that reuses a pid from overwriting its predecessor's counts.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+
+try:
+    import fcntl
+except ImportError:
+    # No pruning without file locks (Windows); snapshots just accumulate
+    fcntl = None
+
+from odoo.tools import config
+
+_logger = logging.getLogger(__name__)
+
+# Default Prometheus latency buckets (seconds)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+# Minimum seconds between two snapshot dumps of one worker
+SNAPSHOT_INTERVAL = 5.0
+
+# Totals of dead workers, and the lock serializing updates to it
+RETIRED_FILE = 'retired.json'
+LOCK_FILE = '.lock'
+
+_SNAPSHOT_FILE = re.compile(r'^(\d+)(-[0-9a-f]+)?\.json$')
+
+
+class Metric:
+    """Base class: a named metric with label names and per-label values"""
+
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values = {}
+
+    def samples(self):
+        """[(labels, value)] where value is a float or a list of floats"""
+        return list(self.values.items())
+
+
+class CounterMetric(Metric):
+    kind = 'counter'
+
+    def inc(self, labels=(), amount=1.0):
+        self.values[labels] = self.values.get(labels, 0.0) + amount
+
+
+class HistogramMetric(Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, labels, value):
+        # Stored as [count per bucket (non-cumulative)..., +Inf count, sum]
+        stored = self.values.get(labels)
+        if stored is None:
+            stored = self.values[labels] = [0.0] * (len(self.buckets) + 2)
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                stored[index] += 1
+                break
+        else:
+            stored[len(self.buckets)] += 1
+        stored[-1] += value
+
+
+class MetricsRegistry:
+    """Holds the metrics of one process and renders merged snapshots"""
+
+    def __init__(self):
+        self.metrics = {}
+        self.collectors = []
+        self.lock = threading.Lock()
+        self._last_dump = 0.0
+        self._process = (None, None)
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.metrics.setdefault(name, CounterMetric(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        return self.metrics.setdefault(name, HistogramMetric(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector):
+        """Register fn() -> {counter_name: value}, read at snapshot time"""
+        self.collectors.append(collector)
+
+    # ========== Snapshots ==========
+
+    def snapshot(self):
+        """Serializable copy of all metric values of this process"""
+        with self.lock:
+            data = {}
+            for metric in self.metrics.values():
+                data[metric.name] = {
+                    'kind': metric.kind,
+                    'help': metric.documentation,
+                    'labelnames': list(metric.labelnames),
+                    'buckets': list(getattr(metric, 'buckets', ())),
+                    'samples': [
+                        [list(labels), list(value) if isinstance(value, list) else value]
+                        for labels, value in metric.samples()
+                    ],
+                }
+
+        for collector in self.collectors:
+            for name, (documentation, value) in collector().items():
+                data[name] = {
+                    'kind': 'counter', 'help': documentation, 'labelnames': [],
+                    'buckets': [], 'samples': [[[], value]],
+                }
+        return data
+
+    def _snapshot_dir(self):
+        return os.path.join(config['data_dir'], 'api_training_metrics')
+
+    def _snapshot_name(self):
+        """File name of this process's snapshot: <pid>-<token>.json"""
+        pid = os.getpid()
+        if self._process[0] != pid:
+            # A forked worker must not write to its parent's file
+            self._process = (pid, uuid.uuid4().hex[:8])
+        return f'{pid}-{self._process[1]}.json'
+
+    def dump_snapshot(self, force=False):
+        """Write this worker's snapshot to disk (rate limited)"""
+        now = time.monotonic()
+        if not force and now - self._last_dump < SNAPSHOT_INTERVAL:
+            return
+        self._last_dump = now
+
+        directory = self._snapshot_dir()
+        path = os.path.join(directory, self._snapshot_name())
+        try:
+            os.makedirs(directory, exist_ok=True)
+            _write_json(path, self.snapshot())
+        except OSError as e:
+            _logger.warning(f'Could not write metrics snapshot: {str(e)}')
+
+    def merged_snapshot(self):
+        """Sum the snapshots of all workers, live (this process) and retired"""
+        directory = self._snapshot_dir()
+        if not os.path.isdir(directory):
+            return _merge([self.snapshot()])
+        self._retire_dead_snapshots(directory)
+
+        own_file = self._snapshot_name()
+        workers = {}
+        for filename in os.listdir(directory):
+            if _SNAPSHOT_FILE.match(filename) and filename != own_file:
+                snapshot = _read_json(os.path.join(directory, filename))
+                if snapshot is not None:
+                    workers[filename] = snapshot
+        # Read last: a snapshot retired meanwhile is listed in it, not lost
+        retired = _read_json(os.path.join(directory, RETIRED_FILE)) or {'folded': [], 'metrics': {}}
+        for filename in retired['folded']:
+            workers.pop(filename, None)
+        return _merge([self.snapshot(), retired['metrics']] + list(workers.values()))
+
+    def _retire_dead_snapshots(self, directory):
+        """Fold the snapshots of dead workers into retired.json and remove them"""
+        dead = [
+            filename for filename in os.listdir(directory)
+            if _SNAPSHOT_FILE.match(filename) and not _pid_alive(int(_SNAPSHOT_FILE.match(filename).group(1)))
+        ]
+        if not dead or fcntl is None:
+            return
+        try:
+            with open(os.path.join(directory, LOCK_FILE), 'w') as lock:
+                try:
+                    fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    # Another worker is retiring them
+                    return
+                retired_path = os.path.join(directory, RETIRED_FILE)
+                retired = _read_json(retired_path) or {'folded': [], 'metrics': {}}
+                folded = set(retired['folded'])
+                snapshots = [retired['metrics']]
+                for filename in dead:
+                    # Already folded if a previous run stopped before removing it
+                    snapshot = None if filename in folded else _read_json(os.path.join(directory, filename))
+                    if snapshot is not None:
+                        snapshots.append(snapshot)
+                        folded.add(filename)
+                present = set(os.listdir(directory))
+                _write_json(retired_path, {
+                    'folded': sorted(folded & present),
+                    'metrics': _unmerge(_merge(snapshots)),
+                })
+                for filename in dead:
+                    try:
+                        os.remove(os.path.join(directory, filename))
+                    except FileNotFoundError:
+                        pass
+        except OSError as e:
+            _logger.warning(f'Could not retire metrics snapshots: {str(e)}')
+
+    # ========== Exposition ==========
+
+    def render(self, snapshot=None):
+        """Prometheus text exposition format (version 0.0.4)"""
+        snapshot = snapshot if snapshot is not None else self.merged_snapshot()
+        lines = []
+        for name in sorted(snapshot):
+            metric = snapshot[name]
+            lines.append(f'# HELP {name} {metric["help"]}')
+            lines.append(f'# TYPE {name} {metric["kind"]}')
+            for labels, value in sorted(metric['samples'].items()):
+                label_pairs = list(zip(metric['labelnames'], labels))
+                if metric['kind'] == 'histogram':
+                    lines.extend(_render_histogram(name, label_pairs, metric['buckets'], value))
+                else:
+                    lines.append(f'{name}{_format_labels(label_pairs)} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _read_json(path):
+    """Content of a JSON file, None if missing or unreadable"""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path, data):
+    """Atomically replace a JSON file"""
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def _merge(snapshots):
+    """Sum snapshots into {name: metric} with samples as {labels tuple: value}"""
+    merged = {}
+    for snapshot in snapshots:
+        for name, metric in snapshot.items():
+            target = merged.setdefault(name, dict(metric, samples={}))
+            for labels, value in metric['samples']:
+                key = tuple(labels)
+                if key not in target['samples']:
+                    target['samples'][key] = list(value) if isinstance(value, list) else value
+                elif isinstance(value, list):
+                    target['samples'][key] = [a + b for a, b in zip(target['samples'][key], value)]
+                else:
+                    target['samples'][key] += value
+    return merged
+
+
+def _unmerge(merged):
+    """Merged metrics back in the serializable snapshot format"""
+    return {
+        name: dict(metric, samples=[[list(labels), value] for labels, value in metric['samples'].items()])
+        for name, metric in merged.items()
+    }
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(label_pairs):
+    if not label_pairs:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in label_pairs) + '}'
+
+
+def _format_value(value):
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _render_histogram(name, label_pairs, buckets, value):
+    lines = []
+    cumulative = 0.0
+    for bound, count in zip(buckets, value):
+        cumulative += count
+        labels = _format_labels(label_pairs + [('le', _format_value(bound))])
+        lines.append(f'{name}_bucket{labels} {_format_value(cumulative)}')
+    cumulative += value[len(buckets)]
+    lines.append(f'{name}_bucket{_format_labels(label_pairs + [("le", "+Inf")])} {_format_value(cumulative)}')
+    lines.append(f'{name}_sum{_format_labels(label_pairs)} {_format_value(value[-1])}')
+    lines.append(f'{name}_count{_format_labels(label_pairs)} {_format_value(cumulative)}')
+    return lines
+
+
+# ========== API Training Metrics ==========
+
+registry = MetricsRegistry()
+
+REQUESTS = registry.counter(
+    'api_training_requests_total',
+    'Requests handled per route, method and status code',
+    ('route', 'method', 'status'),
+)
+ERRORS = registry.counter(
+    'api_training_request_errors_total',
+    'Requests that raised or returned a 5xx status',
+    ('route', 'method'),
+)
+LATENCY = registry.histogram(
+    'api_training_request_duration_seconds',
+    'Request latency per route',
+    ('route', 'method'), LATENCY_BUCKETS,
+)
+RESPONSE_SIZE = registry.histogram(
+    'api_training_response_size_bytes',
+    'Response body size per route (streamed responses excluded)',
+    ('route', 'method'), SIZE_BUCKETS,
+)
+QUERIES = registry.histogram(
+    'api_training_db_queries_per_request',
+    'SQL statements executed per request',
+    ('route',), QUERY_BUCKETS,
+)
+DB_TIME = registry.histogram(
+    'api_training_db_duration_seconds',
+    'Time spent in SQL per request',
+    ('route',), LATENCY_BUCKETS,
+)
+
+
+def observe_request(route, method, status, duration, response_size, query_count, query_time):
+    """Record one finished /api/training request"""
+    with registry.lock:
+        REQUESTS.inc((route, method, str(status)))
+        if status >= 500:
+            ERRORS.inc((route, method))
+        LATENCY.observe((route, method), duration)
+        if response_size is not None:
+            RESPONSE_SIZE.observe((route, method), response_size)
+        QUERIES.observe((route,), query_count)
+        DB_TIME.observe((route,), query_time)
+    registry.dump_snapshot()
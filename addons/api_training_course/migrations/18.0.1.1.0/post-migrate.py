@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""
+Keep likes counted before api.blog.post.like existed
+
+Those likes have no like row, so recount_likes would drop them from
+like_count. Whatever like_count holds beyond the like rows becomes
+legacy_like_count, which recount_likes adds back.
+"""
+
+
+def migrate(cr, version):
+    if not version:
+        return
+    cr.execute("""
+        UPDATE api_blog_post AS p
+           SET legacy_like_count = GREATEST(COALESCE(p.like_count, 0) - (
+                   SELECT COUNT(*) FROM api_blog_post_like AS l WHERE l.post_id = p.id
+               ), 0)
+    """)
@@ -1,3 +1,12 @@
+from . import api_keyset_mixin
+from . import api_fast_write_mixin
+from . import api_sync_mixin
 from . import api_blog_post
 from . import api_task
 from . import api_user_profile
+from . import api_view_hit
+from . import api_blog_post_like
+from . import api_response_cache
+from . import api_sync_tombstone
+from . import ir_http
+from . import ir_websocket
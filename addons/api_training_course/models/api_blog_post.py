@@ -8,17 +8,40 @@ This model demonstrates:
 - Model constraints
 - CRUD operations via ORM
 - Many2one relationships (author)
+- PostgreSQL full-text search (tsvector column, GIN index, trigger)
+- One content analysis pass for several stored computed fields
+- Batched, bounded-memory backfill of stored computed fields
+- Delta sync with tombstones (api.sync.mixin)
 """
 
+import logging
+from collections import Counter
+
 from odoo import models, fields, api
 from odoo.exceptions import ValidationError
+from odoo.tools import SQL
+from odoo.tools.sql import column_exists, create_column, table_exists
+
+from .. import text_analysis
+
+_logger = logging.getLogger(__name__)
+
+# Text search configuration used for both the index and the queries
+FTS_CONFIG = 'english'
+
+# Most recent matches ranked by search_fulltext (ts_rank reads each
+# candidate's whole tsvector, so a common word must not rank every post)
+FTS_MAX_CANDIDATES = 1000
 
 
 class ApiBlogPost(models.Model):
     _name = 'api.blog.post'
     _description = 'Blog Post for API Training'
     _order = 'published_date desc, id desc'
-    _inherit = ['mail.thread', 'mail.activity.mixin']  # For tracking changes
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'api.keyset.mixin', 'api.fast.write.mixin', 'api.sync.mixin']  # For tracking changes
+    _keyset_order = [('published_date', 'desc'), ('id', 'desc')]
+    _fast_write_fields = ('view_count', 'like_count')
+    _sync_scope_fields = ('status',)
 
     # Basic Fields
     title = fields.Char(
@@ -43,7 +66,7 @@ class ApiBlogPost(models.Model):
 
     excerpt = fields.Text(
         string='Excerpt',
-        compute='_compute_excerpt',
+        compute='_compute_content_stats',
         store=True,
         help='Short preview (first 200 chars)'
     )
@@ -94,58 +117,188 @@ class ApiBlogPost(models.Model):
         default=0
     )
 
+    legacy_like_count = fields.Integer(
+        string='Legacy Likes',
+        default=0,
+        readonly=True,
+        help='Likes counted before likes were recorded per liker; part of like_count'
+    )
+
     # Categories (simplified - using tags as text)
     tags = fields.Char(
         string='Tags',
         help='Comma-separated tags (e.g., "python,api,tutorial")'
     )
 
-    # Computed field for reading time
+    # Computed fields for reading time
+    word_count = fields.Integer(
+        string='Word Count',
+        compute='_compute_content_stats',
+        store=True
+    )
+
     reading_time_minutes = fields.Integer(
         string='Reading Time (min)',
-        compute='_compute_reading_time',
+        compute='_compute_content_stats',
         store=True,
         help='Estimated reading time in minutes'
     )
 
+    # Stored fields derived from content by text_analysis.analyze_html()
+    _content_stats_fields = ('excerpt', 'word_count', 'reading_time_minutes')
+
+    # ========== Database Setup ==========
+
+    def _auto_init(self):
+        """
+        Create word_count before the ORM sees it
+
+        A new stored computed column would otherwise be computed for the
+        whole table at once during the upgrade; init() fills it in batches
+        with recompute_content_stats() instead. On a fresh install there is
+        no table yet, and nothing to compute.
+        """
+        cr = self.env.cr
+        if table_exists(cr, self._table) and not column_exists(cr, self._table, 'word_count'):
+            create_column(cr, self._table, 'word_count', 'int4')
+        return super()._auto_init()
+
+    def init(self):
+        """
+        Create the full-text search column, its GIN index and trigger,
+        and the index of the delta sync of published posts
+
+        search_vector is maintained by PostgreSQL itself (title > tags >
+        excerpt > tag-stripped content, by weight), so every write path -
+        ORM, raw SQL or imports - keeps it current. The ORM does not know
+        about the column.
+        """
+        cr = self.env.cr
+        cr.execute(f"""
+            ALTER TABLE {self._table} ADD COLUMN IF NOT EXISTS search_vector tsvector;
+
+            CREATE OR REPLACE FUNCTION api_blog_post_plain_text(html text) RETURNS text AS $$
+                SELECT regexp_replace(COALESCE(html, ''), '<[^>]*>', ' ', 'g')
+            $$ LANGUAGE sql IMMUTABLE;
+
+            CREATE OR REPLACE FUNCTION api_blog_post_search_vector_update() RETURNS trigger AS $$
+            BEGIN
+                NEW.search_vector :=
+                    setweight(to_tsvector('{FTS_CONFIG}', COALESCE(NEW.title, '')), 'A') ||
+                    setweight(to_tsvector('{FTS_CONFIG}', replace(COALESCE(NEW.tags, ''), ',', ' ')), 'B') ||
+                    setweight(to_tsvector('{FTS_CONFIG}', COALESCE(NEW.excerpt, '')), 'C') ||
+                    setweight(to_tsvector('{FTS_CONFIG}', api_blog_post_plain_text(NEW.content)), 'D');
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql;
+
+            DROP TRIGGER IF EXISTS api_blog_post_search_vector_trg ON {self._table};
+            CREATE TRIGGER api_blog_post_search_vector_trg
+                BEFORE INSERT OR UPDATE OF title, tags, excerpt, content ON {self._table}
+                FOR EACH ROW EXECUTE FUNCTION api_blog_post_search_vector_update();
+
+            CREATE INDEX IF NOT EXISTS api_blog_post_search_vector_idx
+                ON {self._table} USING gin (search_vector);
+
+            CREATE INDEX IF NOT EXISTS api_blog_post_sync_idx
+                ON {self._table} (write_date, id)
+                WHERE status = 'published';
+
+            CREATE INDEX IF NOT EXISTS api_blog_post_recent_published_idx
+                ON {self._table} (published_date DESC NULLS LAST, id DESC)
+                WHERE status = 'published';
+        """)
+
+        # Backfill rows created before the trigger existed
+        cr.execute(f"UPDATE {self._table} SET title = title WHERE search_vector IS NULL")
+
+        # Backfill word_count (and refresh excerpt/reading time) for old rows
+        self.recompute_content_stats(only_missing=True)
+
     # ========== Computed Methods ==========
 
     @api.depends('title')
     def _compute_slug(self):
         """Generate URL-friendly slug from title"""
         for record in self:
-            if record.title:
-                # Simple slug: lowercase, replace spaces with hyphens
-                slug = record.title.lower()
-                slug = ''.join(c if c.isalnum() or c.isspace() else '' for c in slug)
-                slug = '-'.join(slug.split())
-                record.slug = slug
-            else:
-                record.slug = False
+            record.slug = text_analysis.slugify(record.title)
 
     @api.depends('content')
-    def _compute_excerpt(self):
-        """Generate excerpt from content (first 200 characters)"""
+    def _compute_content_stats(self):
+        """Excerpt, word count and reading time, from one analysis of content"""
         for record in self:
-            if record.content:
-                # Remove HTML tags (simple approach)
-                import re
-                clean_text = re.sub('<[^<]+?>', '', record.content)
-                record.excerpt = clean_text[:200] + ('...' if len(clean_text) > 200 else '')
-            else:
-                record.excerpt = ''
+            analysis = text_analysis.analyze_html(record.content)
+            record.excerpt = analysis.excerpt
+            record.word_count = analysis.word_count
+            record.reading_time_minutes = analysis.reading_time_minutes
 
-    @api.depends('content')
-    def _compute_reading_time(self):
-        """Calculate reading time (average 200 words per minute)"""
-        for record in self:
-            if record.content:
-                import re
-                clean_text = re.sub('<[^<]+?>', '', record.content)
-                word_count = len(clean_text.split())
-                record.reading_time_minutes = max(1, word_count // 200)
-            else:
-                record.reading_time_minutes = 0
+    @api.model
+    def recompute_content_stats(self, batch_size=2000, only_missing=False, commit=False):
+        """
+        Recompute excerpt, word_count and reading_time_minutes in batches
+
+        Repair/backfill command for large tables (e.g. after a bulk import
+        through SQL). Posts are read batch_size at a time by id, without
+        the ORM cache, and each batch is applied with one UPDATE touching
+        only the rows whose values change, so memory stays bounded by one
+        batch. Set commit=True from a shell to commit after each batch:
+            env['api.blog.post'].recompute_content_stats(commit=True)
+
+        Returns the number of updated posts.
+        """
+        self.flush_model(['content', *self._content_stats_fields])
+        missing_filter = SQL('AND word_count IS NULL') if only_missing else SQL()
+        cr = self.env.cr
+        last_id = 0
+        updated = 0
+        while True:
+            cr.execute(SQL(
+                'SELECT id, content FROM %s WHERE id > %s %s ORDER BY id LIMIT %s',
+                SQL.identifier(self._table), last_id, missing_filter, batch_size,
+            ))
+            rows = cr.fetchall()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+
+            analyses = [text_analysis.analyze_html(content) for _post_id, content in rows]
+            cr.execute(SQL(
+                """
+                UPDATE %(table)s AS t
+                   SET excerpt = v.excerpt,
+                       word_count = v.word_count,
+                       reading_time_minutes = v.reading_time_minutes
+                  FROM unnest(%(ids)s::int[], %(excerpts)s::text[], %(word_counts)s::int[], %(reading_times)s::int[])
+                       AS v(id, excerpt, word_count, reading_time_minutes)
+                 WHERE t.id = v.id
+                   AND (t.excerpt IS DISTINCT FROM v.excerpt
+                        OR t.word_count IS DISTINCT FROM v.word_count
+                        OR t.reading_time_minutes IS DISTINCT FROM v.reading_time_minutes)
+             RETURNING t.id
+                """,
+                table=SQL.identifier(self._table),
+                ids=[post_id for post_id, _content in rows],
+                excerpts=[analysis.excerpt for analysis in analyses],
+                word_counts=[analysis.word_count for analysis in analyses],
+                reading_times=[analysis.reading_time_minutes for analysis in analyses],
+            ))
+            changed = self.browse([post_id for post_id, in cr.fetchall()])
+            if changed:
+                changed._invalidate_response_cache()
+            updated += len(changed)
+            if commit:
+                cr.commit()
+            _logger.info(f'Content stats: {updated} posts updated, up to id {last_id}')
+
+        self.invalidate_model(list(self._content_stats_fields))
+        return updated
+
+    # ========== Delta Sync ==========
+
+    def _sync_scope(self):
+        """Published posts are synced to every user (see api.sync.mixin)"""
+        self.ensure_one()
+        return False if self.status == 'published' else None
 
     # ========== Constraints ==========
 
@@ -179,16 +332,92 @@ class ApiBlogPost(models.Model):
         return True
 
     def action_increment_views(self):
-        """Increment view count (for API tracking)"""
-        for record in self:
-            record.view_count += 1
+        """
+        Increment view count (for API tracking)
+
+        Hits are buffered and applied later by the view-hit cron, so this
+        does not write to the post row (see api.view.hit).
+        """
+        return self.env['api.view.hit'].sudo().record_hit(self)
+
+    def action_like(self, fingerprint=None):
+        """
+        Like the post once per user (or anonymous visitor fingerprint)
+
+        Returns a dict with 'liked' (False if this liker already liked the
+        post) and the up-to-date 'like_count'.
+        """
+        self.ensure_one()
+        liked, like_count = self.env['api.blog.post.like'].sudo().add_like(
+            self, self.env.user, fingerprint=fingerprint
+        )
+        return {'liked': liked, 'like_count': like_count}
+
+    def action_recount_likes(self):
+        """Repair like_count from the like records"""
+        self.env['api.blog.post.like'].sudo().recount_likes(self.ids)
         return True
 
-    def action_like(self):
-        """Like the post"""
-        for record in self:
-            record.like_count += 1
-        return True
+    # ========== Full-Text Search ==========
+
+    @api.model
+    def search_fulltext(self, query, limit=20, status='published'):
+        """
+        Ranked full-text search over title, tags, excerpt and content
+
+        Uses websearch_to_tsquery (supports "quoted phrases", OR and -term)
+        against the GIN-indexed search_vector, orders by ts_rank and builds
+        a highlighted snippet for the returned rows only.
+
+        Only the FTS_MAX_CANDIDATES most recent matches are ranked. A rare
+        term is matched through the GIN index; for a term in most posts,
+        PostgreSQL walks the published_date index instead and stops after
+        the candidates, rather than ranking every matching post. An older
+        post can therefore be missing from a search for a very common term.
+
+        Returns a list of (post_id, rank, snippet) tuples, best match first.
+        """
+        self.flush_model()
+        status_filter = SQL('AND p.status = %s', status) if status else SQL()
+        self.env.cr.execute(SQL(
+            """
+            WITH q AS (
+                SELECT websearch_to_tsquery(%(config)s, %(query)s) AS query
+            ), candidates AS (
+                SELECT p.id, p.published_date, p.search_vector
+                  FROM %(table)s AS p, q
+                 WHERE p.search_vector @@ q.query
+                       %(status_filter)s
+              ORDER BY p.published_date DESC NULLS LAST, p.id DESC
+                 LIMIT %(max_candidates)s
+            ), hits AS (
+                SELECT c.id, ts_rank(c.search_vector, q.query) AS rank
+                  FROM candidates AS c, q
+              ORDER BY rank DESC, c.published_date DESC NULLS LAST, c.id DESC
+                 LIMIT %(limit)s
+            )
+            SELECT hits.id, hits.rank,
+                   ts_headline(%(config)s, api_blog_post_plain_text(p.content), q.query,
+                               'StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2')
+              FROM hits
+              JOIN %(table)s AS p ON p.id = hits.id, q
+          ORDER BY hits.rank DESC, p.published_date DESC NULLS LAST, p.id DESC
+            """,
+            config=FTS_CONFIG,
+            query=query,
+            table=SQL.identifier(self._table),
+            status_filter=status_filter,
+            max_candidates=FTS_MAX_CANDIDATES,
+            limit=limit,
+        ))
+        return self.env.cr.fetchall()
+
+    # ========== Response Cache ==========
+
+    def _invalidate_response_cache(self):
+        """Expire cached public API responses showing these posts"""
+        scopes = ['posts'] + [f'post:{post_id}' for post_id in self.ids]
+        self.env['api.response.cache'].sudo().invalidate_scopes(scopes)
 
     # ========== CRUD Override Examples ==========
 
@@ -199,7 +428,12 @@ class ApiBlogPost(models.Model):
         if vals.get('status') == 'published' and not vals.get('published_date'):
             vals['published_date'] = fields.Datetime.now()
 
-        return super(ApiBlogPost, self).create(vals)
+        post = super(ApiBlogPost, self).create(vals)
+        self.env['api.user.profile'].sudo()._adjust_counts(
+            'posts_count', Counter(post.author_id.ids)
+        )
+        post._invalidate_response_cache()
+        return post
 
     def write(self, vals):
         """Override write to add custom logic"""
@@ -207,7 +441,18 @@ class ApiBlogPost(models.Model):
         if vals.get('status') == 'published' and self.status != 'published':
             vals['published_date'] = fields.Datetime.now()
 
-        return super(ApiBlogPost, self).write(vals)
+        # Keep author profile post counters in sync on author changes
+        deltas = Counter()
+        if 'author_id' in vals:
+            deltas.subtract(post.author_id.id for post in self)
+
+        result = super(ApiBlogPost, self).write(vals)
+
+        if 'author_id' in vals:
+            deltas.update(post.author_id.id for post in self)
+            self.env['api.user.profile'].sudo()._adjust_counts('posts_count', deltas)
+        self._invalidate_response_cache()
+        return result
 
     def unlink(self):
         """Override unlink to add custom logic"""
@@ -215,4 +460,10 @@ class ApiBlogPost(models.Model):
         if any(post.status == 'published' for post in self):
             raise ValidationError('Cannot delete published posts. Archive them first.')
 
-        return super(ApiBlogPost, self).unlink()
+        deltas = Counter()
+        deltas.subtract(post.author_id.id for post in self)
+
+        self._invalidate_response_cache()
+        result = super(ApiBlogPost, self).unlink()
+        self.env['api.user.profile'].sudo()._adjust_counts('posts_count', deltas)
+        return result
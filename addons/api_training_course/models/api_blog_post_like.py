@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+Blog Post Like Model - Training Example
+
+This model demonstrates:
+- Relation tables with SQL unique constraints
+- INSERT ... ON CONFLICT DO NOTHING for idempotent writes
+- Atomic counter increments in a single SQL round trip
+- Bulk consistency repair with UPDATE ... FROM
+
+Each like is one row keyed by (post, liker). The liker is either a user
+('user:<id>') or an anonymous visitor fingerprint ('anon:<hash>'), so the
+same liker can like a post only once. Likes counted before these rows
+existed have no row: they are kept in the post's legacy_like_count.
+"""
+
+from odoo import models, fields, api
+from odoo.tools import SQL
+
+
+class ApiBlogPostLike(models.Model):
+    _name = 'api.blog.post.like'
+    _description = 'Blog Post Like'
+    _log_access = False
+
+    post_id = fields.Many2one(
+        'api.blog.post',
+        string='Post',
+        required=True,
+        ondelete='cascade',
+        index=True
+    )
+
+    user_id = fields.Many2one(
+        'res.users',
+        string='User',
+        ondelete='cascade',
+        help='Empty for anonymous likes'
+    )
+
+    liker_key = fields.Char(
+        string='Liker Key',
+        required=True,
+        help='user:<id> for users, anon:<fingerprint> for anonymous visitors'
+    )
+
+    liked_on = fields.Datetime(
+        string='Liked On',
+        default=fields.Datetime.now
+    )
+
+    _sql_constraints = [
+        ('post_liker_uniq', 'unique(post_id, liker_key)',
+         'This post has already been liked by this user.'),
+    ]
+
+    # ========== Like Methods ==========
+
+    @api.model
+    def _liker_key(self, user, fingerprint=None):
+        """Dedupe key: the user for logged-in likers, the fingerprint otherwise"""
+        if user and not user._is_public():
+            return f'user:{user.id}'
+        if not fingerprint:
+            raise ValueError('An anonymous like requires a visitor fingerprint')
+        return f'anon:{fingerprint}'
+
+    @api.model
+    def add_like(self, post, user, fingerprint=None):
+        """
+        Like a post once per liker, in a single SQL round trip
+
+        The like row is inserted with ON CONFLICT DO NOTHING and, only if it
+        was new, the post counter is bumped atomically in the same statement.
+
+        Returns a tuple (liked, like_count); liked is False when this liker
+        had already liked the post.
+        """
+        post.ensure_one()
+        liker_key = self._liker_key(user, fingerprint)
+        user_id = user.id if user and not user._is_public() else None
+
+        self.env.cr.execute(SQL(
+            """
+            WITH new_like AS (
+                INSERT INTO %(likes)s (post_id, user_id, liker_key, liked_on)
+                VALUES (%(post_id)s, %(user_id)s, %(liker_key)s, NOW() AT TIME ZONE 'UTC')
+                ON CONFLICT (post_id, liker_key) DO NOTHING
+                RETURNING post_id
+            ), bumped AS (
+                UPDATE %(posts)s AS p
+                   SET like_count = COALESCE(p.like_count, 0) + 1
+                  FROM new_like
+                 WHERE p.id = new_like.post_id
+                RETURNING p.like_count
+            )
+            SELECT (SELECT like_count FROM bumped),
+                   (SELECT like_count FROM %(posts)s WHERE id = %(post_id)s)
+            """,
+            likes=SQL.identifier(self._table),
+            posts=SQL.identifier(post._table),
+            post_id=post.id,
+            user_id=user_id,
+            liker_key=liker_key,
+        ))
+        new_count, current_count = self.env.cr.fetchone()
+        post.invalidate_recordset(['like_count'])
+
+        if new_count is not None:
+            return True, new_count
+        return False, current_count or 0
+
+    @api.model
+    def recount_likes(self, post_ids=None):
+        """
+        Recompute like_count from the like rows (consistency repair)
+
+        like_count becomes legacy_like_count plus the number of like rows.
+        Runs as one UPDATE ... FROM over all posts, or only over post_ids
+        when given; only rows whose counter drifted are written.
+        Returns the number of posts corrected.
+        """
+        Post = self.env['api.blog.post']
+        self.flush_model()
+        Post.flush_model(['like_count'])
+
+        post_filter = SQL('WHERE p.id = ANY(%s)', list(post_ids)) if post_ids is not None else SQL()
+        self.env.cr.execute(SQL(
+            """
+            UPDATE %(posts)s AS t
+               SET like_count = counts.total
+              FROM (
+                    SELECT p.id, COALESCE(p.legacy_like_count, 0) + COUNT(l.id) AS total
+                      FROM %(posts)s AS p
+                 LEFT JOIN %(likes)s AS l ON l.post_id = p.id
+                      %(post_filter)s
+                  GROUP BY p.id
+                   ) AS counts
+             WHERE t.id = counts.id
+               AND t.like_count IS DISTINCT FROM counts.total
+            """,
+            posts=SQL.identifier(Post._table),
+            likes=SQL.identifier(self._table),
+            post_filter=post_filter,
+        ))
+        corrected = self.env.cr.rowcount
+        Post.invalidate_model(['like_count'])
+        return corrected
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Fast Write Mixin - Training Example
+
+This mixin demonstrates:
+- A sanctioned way around the full ORM write for system fields
+- Direct UPDATE statements that keep the ORM cache consistent
+- Bulk counter increments with UPDATE ... FROM unnest()
+
+BaseModel.write() (and mail.thread on top of it) computes tracking
+values, may post chatter messages, subscribes followers, bumps
+write_date/write_uid and runs every override of write(). That is right
+for business data, but wasteful for counters and bookkeeping fields such
+as view counts or a last login timestamp, written on hot request paths.
+
+Models list those fields in _fast_write_fields. _fast_write() and
+_fast_add() then update them with one statement, without tracking,
+followers or write_date changes, after flushing pending ORM values and
+before invalidating the cache. Only plain stored fields that nothing
+depends on are accepted, so no computed field can go stale.
+"""
+
+from odoo import models, api
+from odoo.tools import SQL
+
+
+class ApiFastWriteMixin(models.AbstractModel):
+    _name = 'api.fast.write.mixin'
+    _description = 'Fast Write Mixin'
+
+    # Stored, non-business fields that may bypass write()
+    _fast_write_fields = ()
+
+    def _check_fast_write_fields(self, field_names):
+        for field_name in field_names:
+            field = self._fields.get(field_name)
+            if field_name not in self._fast_write_fields or field is None:
+                raise ValueError(f'{self._name}.{field_name} is not a fast-write field')
+            if not field.store or field.compute or getattr(field, 'translate', False) or self.pool.field_triggers.get(field):
+                raise ValueError(f'{self._name}.{field_name} cannot be written outside the ORM')
+
+    def _fast_write(self, vals):
+        """
+        Write system fields of these records with a single UPDATE
+
+        No tracking, no chatter, no write_date/write_uid change and no
+        write() override is involved. Constraints on the written fields
+        are still checked.
+        """
+        if not self:
+            return True
+        self._check_fast_write_fields(vals)
+
+        self.flush_recordset(list(vals))
+        assignments = SQL(', ').join(
+            SQL('%s = %s', SQL.identifier(field_name),
+                self._fields[field_name].convert_to_column_update(value, self))
+            for field_name, value in vals.items()
+        )
+        self.env.cr.execute(SQL(
+            'UPDATE %s SET %s WHERE id = ANY(%s)',
+            SQL.identifier(self._table), assignments, self.ids,
+        ))
+        self.invalidate_recordset(list(vals))
+        self._validate_fields(list(vals))
+        return True
+
+    @api.model
+    def _fast_add(self, field_name, deltas, key='id'):
+        """
+        Add deltas to a numeric system field with a single UPDATE
+
+        deltas: mapping {key value: delta}, where key is 'id' or another
+        column identifying the rows (e.g. 'user_id'). Falsy keys and zero
+        deltas are ignored. Returns the number of rows updated.
+        """
+        self._check_fast_write_fields([field_name])
+        deltas = {ref: delta for ref, delta in deltas.items() if ref and delta}
+        if not deltas:
+            return 0
+
+        self.flush_model([field_name, key] if key != 'id' else [field_name])
+        self.env.cr.execute(SQL(
+            """
+            UPDATE %(table)s AS t
+               SET %(column)s = COALESCE(t.%(column)s, 0) + d.delta
+              FROM unnest(%(refs)s::int[], %(deltas)s::int[]) AS d(ref, delta)
+             WHERE t.%(key)s = d.ref
+            """,
+            table=SQL.identifier(self._table),
+            column=SQL.identifier(field_name),
+            key=SQL.identifier(key),
+            refs=list(deltas),
+            deltas=list(deltas.values()),
+        ))
+        updated = self.env.cr.rowcount
+        self.invalidate_model([field_name])
+        return updated
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+Keyset Pagination Mixin - Training Example
+
+This mixin demonstrates:
+- Abstract models shared by several concrete models
+- Keyset (cursor) pagination instead of OFFSET scans
+- Building domains programmatically with odoo.osv.expression
+- Opaque cursors encoded as URL-safe base64 JSON
+
+A cursor stores the sort key of the last row of a page. The next page is
+"every row that sorts after that key", which the database answers from the
+index in the same time whether it is page 1 or page 10,000.
+"""
+
+import base64
+import json
+
+from odoo import models, fields, api
+from odoo.osv import expression
+
+
+class ApiKeysetMixin(models.AbstractModel):
+    _name = 'api.keyset.mixin'
+    _description = 'Keyset Pagination Mixin'
+
+    # Sort key as (field, direction) pairs; must end with a unique field
+    # and match the ORDER BY used for keyset searches.
+    _keyset_order = [('id', 'desc')]
+
+    # ========== Cursor Encoding ==========
+
+    def _keyset_encode(self):
+        """Encode the sort key of this record as an opaque cursor string"""
+        self.ensure_one()
+        values = []
+        for field_name, _direction in self._keyset_order:
+            field = self._fields[field_name]
+            value = self[field_name]
+            if not value and field.type != 'integer':
+                value = None
+            elif field.type == 'date':
+                value = fields.Date.to_string(value)
+            elif field.type == 'datetime':
+                value = fields.Datetime.to_string(value)
+            values.append(value)
+
+        payload = json.dumps(values, separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+    @api.model
+    def _keyset_decode(self, cursor):
+        """Decode a cursor string into sort key values (raises ValueError)"""
+        try:
+            padding = '=' * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        except (TypeError, ValueError) as e:
+            raise ValueError('Invalid cursor') from e
+
+        if not isinstance(values, list) or len(values) != len(self._keyset_order):
+            raise ValueError('Invalid cursor')
+        return [
+            self._keyset_check_value(self._fields[field_name], value)
+            for (field_name, _direction), value in zip(self._keyset_order, values)
+        ]
+
+    @api.model
+    def _keyset_check_value(self, field, value):
+        """
+        A decoded cursor value, checked against the type of its field
+
+        Cursors come from clients: a value of the wrong type would only
+        fail in the database, as a 500. None stands for NULL, except for
+        integer fields (see _keyset_encode). Raises ValueError.
+        """
+        if value is None and field.type != 'integer':
+            return None
+        if field.type == 'integer':
+            valid = isinstance(value, int) and not isinstance(value, bool)
+        elif field.type == 'float':
+            valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+        elif field.type in ('char', 'text'):
+            valid = isinstance(value, str)
+        elif field.type == 'selection':
+            valid = isinstance(value, str) and value in field.get_values(self.env)
+        elif field.type in ('date', 'datetime'):
+            converter = fields.Date.to_date if field.type == 'date' else fields.Datetime.to_datetime
+            try:
+                valid = isinstance(value, str) and converter(value) is not None
+            except ValueError:
+                valid = False
+        else:
+            valid = False
+        if not valid:
+            raise ValueError(f'Invalid cursor: bad value for {field.name}')
+        return value
+
+    # ========== Keyset Search ==========
+
+    @api.model
+    def _keyset_order_by(self):
+        """ORDER BY clause matching the keyset definition"""
+        return ', '.join(f'{name} {direction}' for name, direction in self._keyset_order)
+
+    @api.model
+    def _keyset_domain(self, values):
+        """
+        Domain selecting rows that sort strictly after the given key
+
+        PostgreSQL puts NULLs last for ASC and first for DESC, so a NULL in
+        the key is handled explicitly for each direction.
+        """
+        domain = None
+        keys = list(zip(self._keyset_order, values))
+
+        # Build from the last (most specific) key outwards:
+        # after(k0, k1, ...) = k0 after v0 OR (k0 = v0 AND after(k1, ...))
+        for (field_name, direction), value in reversed(keys):
+            if direction.lower() == 'desc':
+                if value is None:
+                    after = [(field_name, '!=', False)]
+                else:
+                    after = [(field_name, '<', value)]
+            else:
+                if value is None:
+                    after = expression.FALSE_DOMAIN
+                else:
+                    after = expression.OR([
+                        [(field_name, '>', value)],
+                        [(field_name, '=', False)],
+                    ])
+            if domain is None:
+                domain = after
+            else:
+                equal = [(field_name, '=', value if value is not None else False)]
+                domain = expression.OR([after, expression.AND([equal, domain])])
+
+        return domain
+
+    @api.model
+    def _keyset_search(self, domain, limit, cursor=None):
+        """
+        Search one page of records after the given cursor
+
+        Returns a tuple (records, next_cursor); next_cursor is None on the
+        last page. One extra row is fetched to detect whether more exist,
+        so no COUNT query is needed. Raises ValueError for a limit below 1
+        (search() would read every row for 0).
+        """
+        if limit < 1:
+            raise ValueError('limit must be at least 1')
+        if cursor:
+            values = self._keyset_decode(cursor)
+            domain = expression.AND([domain, self._keyset_domain(values)])
+
+        records = self.search(domain, limit=limit + 1, order=self._keyset_order_by())
+
+        next_cursor = None
+        if len(records) > limit:
+            records = records[:limit]
+            next_cursor = records[-1]._keyset_encode()
+
+        return records, next_cursor
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""
+API Response Cache - Training Example
+
+This model demonstrates:
+- Caching serialized HTTP responses (bytes + strong ETag)
+- Conditional requests (If-None-Match -> 304 Not Modified)
+- LRU eviction under a memory budget
+- Cross-worker cache invalidation through the database
+
+How it works:
+- Each Odoo worker keeps its own LRU of response bodies, bounded in bytes.
+- Every entry belongs to invalidation scopes ('posts' for list-like
+  routes, 'post:<id>' for a single post). Each scope has a generation
+  number in the api_response_cache table.
+- ApiBlogPost.create/write/unlink bump the generations of the scopes they
+  touch right after their transaction commits, in a short transaction of
+  its own. Bumping inside the writer's transaction would hold the 'posts'
+  row lock until commit and serialize every post writer on it. Other
+  workers see the new generation right after the data and rebuild on
+  their next request. A response built from the old data in that short
+  window was stored under the old generation, so it goes stale as well.
+- A hit costs one indexed lookup of the generations instead of the full
+  search + serialization. Counters written outside the ORM (views,
+  likes) become visible at the latest after ENTRY_TTL seconds.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from odoo import models, fields, api
+from odoo.tools import SQL
+
+from .. import metrics
+
+_logger = logging.getLogger(__name__)
+
+# Per-worker memory budget and maximum entry age
+CACHE_MAX_BYTES = 32 * 1024 * 1024
+ENTRY_TTL = 60.0
+
+
+class ResponseLRU:
+    """Thread-safe LRU of cached responses bounded by total body size"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, generations):
+        """Return (body, etag) if cached for these generations, else None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            body, etag, entry_generations, stored_at = entry
+            if entry_generations != generations or time.monotonic() - stored_at > ENTRY_TTL:
+                self._discard(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body, etag
+
+    def put(self, key, body, etag, generations):
+        """Store an entry, evicting least recently used ones over budget"""
+        if len(body) > self.max_bytes:
+            return
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (body, etag, generations, time.monotonic())
+            self.size += len(body)
+            while self.size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'size_bytes': self.size,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[0])
+
+
+# One LRU per worker process, shared by all databases (keys include dbname)
+response_lru = ResponseLRU(CACHE_MAX_BYTES)
+
+# Export the cache counters with the API metrics (see metrics.py)
+metrics.registry.add_collector(lambda: {
+    'api_training_response_cache_hits_total': ('Response cache hits', response_lru.hits),
+    'api_training_response_cache_misses_total': ('Response cache misses', response_lru.misses),
+    'api_training_response_cache_evictions_total': ('Response cache LRU evictions', response_lru.evictions),
+})
+
+
+class ApiResponseCache(models.Model):
+    _name = 'api.response.cache'
+    _description = 'API Response Cache Generation'
+    _log_access = False
+
+    scope = fields.Char(
+        string='Scope',
+        required=True,
+        help="Invalidation scope, e.g. 'posts' or 'post:42'"
+    )
+
+    generation = fields.Integer(
+        string='Generation',
+        default=0
+    )
+
+    _sql_constraints = [
+        ('scope_uniq', 'unique(scope)', 'Cache scopes must be unique.'),
+    ]
+
+    # ========== Generations ==========
+
+    @api.model
+    def _get_generations(self, scopes):
+        """Current generation of each scope, as a tuple (0 if never bumped)"""
+        self.env.cr.execute(SQL(
+            'SELECT scope, generation FROM %s WHERE scope = ANY(%s)',
+            SQL.identifier(self._table), list(scopes),
+        ))
+        generations = dict(self.env.cr.fetchall())
+        return tuple(generations.get(scope, 0) for scope in scopes)
+
+    @api.model
+    def invalidate_scopes(self, scopes):
+        """
+        Bump the generation of scopes once the current transaction commits
+
+        Cached entries in every worker then go stale. Nothing is bumped if
+        the transaction rolls back. Scopes invalidated several times in one
+        transaction are bumped once.
+        """
+        if not scopes:
+            return
+        postcommit = self.env.cr.postcommit
+        pending = postcommit.data.setdefault('api.response.cache.scopes', set())
+        if not pending:
+            dbname = self.env.cr.dbname
+            postcommit.add(lambda: self._bump_after_commit(dbname, pending))
+        pending.update(scopes)
+
+    @api.model
+    def _bump_after_commit(self, dbname, scopes):
+        """Bump generations in a transaction of their own (postcommit hook)"""
+        try:
+            with self.pool.cursor() as cr:
+                # Concurrent bumps of a scope wait for each other, then add up
+                cr.execute('SET TRANSACTION ISOLATION LEVEL READ COMMITTED')
+                self.with_env(self.env(cr=cr))._bump_generations(sorted(scopes))
+        except Exception as e:
+            # The data is committed; entries expire after ENTRY_TTL anyway
+            _logger.error(f'Cannot invalidate response cache scopes of {dbname}: {str(e)}')
+
+    @api.model
+    def _bump_generations(self, scopes):
+        self.env.cr.execute(SQL(
+            """
+            INSERT INTO %(table)s (scope, generation)
+            SELECT unnest(%(scopes)s::varchar[]), 1
+            ON CONFLICT (scope) DO UPDATE SET generation = %(table)s.generation + 1
+            """,
+            table=SQL.identifier(self._table),
+            scopes=scopes,
+        ))
+
+    # ========== Lookup ==========
+
+    @api.model
+    def lookup(self, key, scopes):
+        """
+        Look up a cached response
+
+        Returns (body, etag, generations); body and etag are None on a miss.
+        Pass the generations back to store() so that an invalidation
+        committed while the response was being built is not missed.
+        """
+        generations = self._get_generations(scopes)
+        cached = response_lru.get((self.env.cr.dbname,) + key, generations)
+        if cached is None:
+            return None, None, generations
+        body, etag = cached
+        return body, etag, generations
+
+    @api.model
+    def store(self, key, body, generations):
+        """Cache a response body and return its strong ETag"""
+        etag = hashlib.sha256(body).hexdigest()[:32]
+        response_lru.put((self.env.cr.dbname,) + key, body, etag, generations)
+        return etag
+
+    @api.model
+    def get_stats(self):
+        """Hit/miss counters of this worker's cache"""
+        return response_lru.stats()
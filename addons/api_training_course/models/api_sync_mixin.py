@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Delta Sync Mixin - Training Example
+
+This mixin demonstrates:
+- "Changes since" queries over (write_date, id) with a row-value keyset
+- Logging deletions and scope exits as tombstones (api.sync.tombstone)
+- Hooks in write()/unlink() shared by several models
+
+A record belongs to the sync scope returned by _sync_scope(): a user id
+(only that user syncs it), False (every user does) or None (nobody, e.g.
+an unpublished post). Deleting a record, or a write of one of the
+_sync_scope_fields that moves it out of a scope, logs a tombstone for the
+scope it left. Moving into a scope needs nothing: write_date changes, so
+the record is found by _sync_changes().
+"""
+
+from odoo import models, api
+from odoo.tools import SQL
+
+
+class ApiSyncMixin(models.AbstractModel):
+    _name = 'api.sync.mixin'
+    _description = 'Delta Sync Mixin'
+
+    # Fields whose change may move a record out of its sync scope
+    _sync_scope_fields = ()
+
+    def _sync_scope(self):
+        """User id syncing this record, False for all users, None for nobody"""
+        self.ensure_one()
+        return False
+
+    def _sync_log_tombstones(self, scopes, deleted=False):
+        """
+        Log tombstones from the scopes {id: scope} these records had
+
+        Logged for every record with a scope when deleted, otherwise for
+        the records whose scope changed since.
+        """
+        entries = [
+            (record.id, scopes[record.id])
+            for record in self
+            if scopes.get(record.id) is not None and (deleted or record._sync_scope() != scopes[record.id])
+        ]
+        self.env['api.sync.tombstone'].sudo().record(self._name, entries)
+
+    @api.model
+    def _sync_changes(self, domain, after=None, limit=100):
+        """
+        Records matching domain written after a (write_date, id) key
+
+        Ordered by (write_date, id) and answered from a btree index on
+        these columns. Returns (records, last_key, has_more).
+        """
+        self.flush_model(['write_date'])
+        query = self._search(domain)
+        write_date = SQL.identifier(self._table, 'write_date')
+        record_id = SQL.identifier(self._table, 'id')
+        after_filter = SQL('AND (%s, %s) > (%s, %s)', write_date, record_id, *after) if after else SQL()
+        self.env.cr.execute(SQL(
+            'SELECT %s, %s FROM %s WHERE %s %s ORDER BY %s, %s LIMIT %s',
+            record_id, write_date, query.from_clause, query.where_clause or SQL('TRUE'), after_filter,
+            write_date, record_id, limit + 1,
+        ))
+        rows = self.env.cr.fetchall()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        last_key = (rows[-1][1], rows[-1][0]) if rows else None
+        return self.browse([row[0] for row in rows]), last_key, has_more
+
+    # ========== CRUD Hooks ==========
+
+    def write(self, vals):
+        if not self._sync_scope_fields or not any(name in vals for name in self._sync_scope_fields):
+            return super().write(vals)
+        scopes = {record.id: record._sync_scope() for record in self}
+        result = super().write(vals)
+        self._sync_log_tombstones(scopes)
+        return result
+
+    def unlink(self):
+        self._sync_log_tombstones({record.id: record._sync_scope() for record in self}, deleted=True)
+        return super().unlink()
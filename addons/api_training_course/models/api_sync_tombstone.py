@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""
+Sync Tombstone Model - Training Example
+
+This model demonstrates:
+- A compact, append-only deletion log (tombstones)
+- Keyset reads over (timestamp, id)
+- Retention with a purge cron
+
+Delta sync clients (GET /api/training/sync) learn about new and modified
+records from their write_date, but a deleted row leaves nothing to find.
+api.sync.mixin writes one tombstone per record that is deleted or leaves
+the scope a client syncs (a task reassigned to someone else, a post that
+is unpublished): model, record id, the user whose scope it left (NULL:
+everybody) and the time. Tombstones are kept RETENTION_DAYS days;
+clients with an older watermark must start a full sync again.
+"""
+
+import logging
+from datetime import timedelta
+
+from odoo import models, fields, api
+from odoo.tools import SQL
+
+_logger = logging.getLogger(__name__)
+
+RETENTION_DAYS = 30
+
+
+class ApiSyncTombstone(models.Model):
+    _name = 'api.sync.tombstone'
+    _description = 'Sync Tombstone'
+    _order = 'deleted_at, id'
+    _log_access = False
+
+    res_model = fields.Char(
+        string='Model',
+        required=True
+    )
+
+    res_id = fields.Integer(
+        string='Record ID',
+        required=True
+    )
+
+    user_id = fields.Integer(
+        string='User ID',
+        help='User whose sync scope the record left (empty: all users)'
+    )
+
+    deleted_at = fields.Datetime(
+        string='Deleted At',
+        required=True
+    )
+
+    # ========== Database Setup ==========
+
+    def init(self):
+        """Index of the keyset reads of the sync endpoint"""
+        self.env.cr.execute(f"""
+            CREATE INDEX IF NOT EXISTS api_sync_tombstone_model_deleted_idx
+                ON {self._table} (res_model, deleted_at, id)
+        """)
+
+    # ========== Logging ==========
+
+    @api.model
+    def record(self, res_model, entries):
+        """
+        Log tombstones with one multi-row INSERT
+
+        entries: (record id, user id or False) pairs.
+        """
+        if not entries:
+            return 0
+        now = self.env.cr.now()
+        values = SQL(', ').join(
+            SQL('(%s, %s, %s, %s)', res_model, res_id, user_id or None, now)
+            for res_id, user_id in entries
+        )
+        self.env.cr.execute(SQL(
+            'INSERT INTO %s (res_model, res_id, user_id, deleted_at) VALUES %s',
+            SQL.identifier(self._table), values,
+        ))
+        return len(entries)
+
+    # ========== Reading ==========
+
+    @api.model
+    def _oldest_available(self):
+        """Tombstones older than this have been purged"""
+        return self.env.cr.now() - timedelta(days=RETENTION_DAYS)
+
+    @api.model
+    def read_after(self, res_model, user_id, after, limit):
+        """
+        Tombstones of res_model visible to user_id, after a (deleted_at, id) key
+
+        Returns (record ids, last_key, has_more).
+        """
+        after_filter = SQL('AND (deleted_at, id) > (%s, %s)', *after) if after else SQL()
+        self.env.cr.execute(SQL(
+            """
+            SELECT id, res_id, deleted_at
+              FROM %(table)s
+             WHERE res_model = %(model)s
+               AND (user_id IS NULL OR user_id = %(user_id)s)
+                   %(after_filter)s
+          ORDER BY deleted_at, id
+             LIMIT %(limit)s
+            """,
+            table=SQL.identifier(self._table),
+            model=res_model,
+            user_id=user_id,
+            after_filter=after_filter,
+            limit=limit + 1,
+        ))
+        rows = self.env.cr.fetchall()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        last_key = (rows[-1][2], rows[-1][0]) if rows else None
+        return [res_id for _id, res_id, _deleted_at in rows], last_key, has_more
+
+    # ========== Retention ==========
+
+    @api.model
+    def _cron_purge_tombstones(self):
+        """Scheduled action: drop tombstones past the retention period"""
+        self.env.cr.execute(SQL(
+            'DELETE FROM %s WHERE deleted_at < %s',
+            SQL.identifier(self._table), self._oldest_available(),
+        ))
+        if self.env.cr.rowcount:
+            _logger.info(f'Purged {self.env.cr.rowcount} sync tombstones')
+        return True
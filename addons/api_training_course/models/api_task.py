@@ -8,18 +8,40 @@ This model demonstrates:
 - Priority fields
 - Date handling
 - Search and filtering patterns
+- Partial indexes for the common list queries
+- Delta sync with tombstones (api.sync.mixin)
+- Change events pushed on the bus (see task_events)
 """
 
+from collections import Counter
+
 from odoo import models, fields, api
 from odoo.exceptions import ValidationError
+from odoo.tools import SQL
 from datetime import datetime, timedelta
 
+from .. import task_events
+
+# Stats keys for the priority selection values
+PRIORITY_STAT_KEYS = {'0': 'low', '1': 'normal', '2': 'high', '3': 'urgent'}
+
+# Statuses of tasks that can still become overdue (matches the partial indexes)
+OPEN_TASK_STATUSES = ('todo', 'in_progress', 'review')
+
+# Fields whose change is published on the bus (not chatter/activity fields)
+BUS_EVENT_FIELDS = frozenset({
+    'name', 'description', 'assigned_to', 'project_name', 'status', 'priority',
+    'due_date', 'completed_date', 'estimated_hours', 'actual_hours', 'progress',
+})
+
 
 class ApiTask(models.Model):
     _name = 'api.task'
     _description = 'Task for API Training'
     _order = 'priority desc, due_date asc, id desc'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'api.keyset.mixin', 'api.sync.mixin']
+    _keyset_order = [('priority', 'desc'), ('due_date', 'asc'), ('id', 'desc')]
+    _sync_scope_fields = ('assigned_to',)
 
     # Basic Fields
     name = fields.Char(
@@ -115,6 +137,136 @@ class ApiTask(models.Model):
         help='Task completion percentage (0-100)'
     )
 
+    # ========== Database Setup ==========
+
+    def init(self):
+        """
+        Create the partial indexes of the task list queries
+
+        - open tasks by due date: the overdue filter (due_date < today on
+          open tasks, see _search_is_overdue)
+        - assignee + status: "my tasks", optionally filtered by status
+        - open tasks in _order: ORDER BY ... LIMIT pages of open tasks,
+          including keyset (cursor) pages
+        - assignee + write date: delta sync of "my tasks" (api.sync.mixin)
+
+        The predicates use status IN (open statuses), the form the ORM
+        generates for _search_is_overdue, so PostgreSQL can match them.
+        """
+        open_statuses = ', '.join(f"'{status}'" for status in OPEN_TASK_STATUSES)
+        self.env.cr.execute(f"""
+            CREATE INDEX IF NOT EXISTS api_task_open_due_date_idx
+                ON {self._table} (due_date)
+                WHERE status IN ({open_statuses}) AND due_date IS NOT NULL;
+
+            CREATE INDEX IF NOT EXISTS api_task_assignee_status_idx
+                ON {self._table} (assigned_to, status)
+                WHERE assigned_to IS NOT NULL;
+
+            CREATE INDEX IF NOT EXISTS api_task_open_order_idx
+                ON {self._table} (priority DESC, due_date ASC, id DESC)
+                WHERE status IN ({open_statuses});
+
+            CREATE INDEX IF NOT EXISTS api_task_assignee_sync_idx
+                ON {self._table} (assigned_to, write_date, id)
+                WHERE assigned_to IS NOT NULL;
+        """)
+
+    # ========== Delta Sync ==========
+
+    def _sync_scope(self):
+        """Tasks are synced to their assignee (see api.sync.mixin)"""
+        self.ensure_one()
+        return self.assigned_to.id or None
+
+    # ========== Bus Notifications ==========
+
+    def _bus_state(self):
+        """Current values of the published fields: {id: {field: value}}"""
+        return {row['id']: row for row in self.read(sorted(BUS_EVENT_FIELDS), load=None)}
+
+    def _bus_track(self, created=False):
+        """
+        Remember the tasks this transaction touches; events are built at commit
+
+        The state of each task before its first change in the transaction
+        is kept (None for a task created by it), so the precommit hook
+        publishes the net change of the whole transaction, whatever the
+        savepoints rolled back in between.
+        """
+        precommit = self.env.cr.precommit
+        touched = precommit.data.get('api.task.bus')
+        if touched is None:
+            touched = precommit.data['api.task.bus'] = {}
+            precommit.add(self.env['api.task'].sudo()._bus_publish)
+        untracked = self.browse([task_id for task_id in self.ids if task_id not in touched])
+        if created:
+            touched.update(dict.fromkeys(untracked.ids))
+        elif untracked:
+            touched.update(untracked._bus_state())
+
+    @api.model
+    def _bus_publish(self):
+        """
+        Precommit hook: publish one compact event per task touched by the transaction
+
+        Events are built from what the database holds at commit: a task
+        created then rolled back to a savepoint is not published, a rolled
+        back write leaves no change to publish. Each event goes to the
+        task's assignee and project channels, plus the previous ones when
+        it was reassigned or moved; on status changes it carries the
+        previous status, so stats dashboards can move a task between
+        counters without a query.
+        """
+        touched = self.env.cr.precommit.data.pop('api.task.bus', None)
+        if not touched:
+            return
+        self.env.flush_all()
+        tasks = self.browse(list(touched)).exists()
+        # Savepoint rollbacks may have left rolled back values in the cache
+        tasks.invalidate_recordset()
+        current = tasks._bus_state()
+
+        Bus = self.env['bus.bus'].sudo()
+        for task_id, before in touched.items():
+            after = current.get(task_id)
+            if after is None:
+                if before is None:
+                    continue
+                payload = {'event': 'deleted', 'id': task_id, 'status': before['status']}
+                state = before
+            else:
+                changed = [] if before is None else sorted(
+                    name for name in BUS_EVENT_FIELDS if after[name] != before[name]
+                )
+                if before is not None and not changed:
+                    continue
+                payload = {
+                    'event': 'created' if before is None else 'updated',
+                    'id': task_id,
+                    'name': after['name'],
+                    'status': after['status'],
+                    'priority': after['priority'],
+                    'progress': after['progress'],
+                    'assigned_to': after['assigned_to'] or None,
+                    'project_name': after['project_name'] or None,
+                    'due_date': fields.Date.to_string(after['due_date']) or None,
+                    'changed': changed,
+                }
+                if before is not None and before['status'] != after['status']:
+                    payload['previous_status'] = before['status']
+                state = after
+
+            channels = task_events.task_channels(state['assigned_to'], state['project_name'])
+            if before is not None:
+                channels += [
+                    channel
+                    for channel in task_events.task_channels(before['assigned_to'], before['project_name'])
+                    if channel not in channels
+                ]
+            for channel in channels:
+                Bus._sendone(channel, task_events.NOTIFICATION_TYPE, payload)
+
     # ========== Computed Methods ==========
 
     @api.depends('due_date', 'status')
@@ -125,17 +277,17 @@ class ApiTask(models.Model):
             record.is_overdue = (
                 record.due_date and
                 record.due_date < today and
-                record.status not in ['done', 'cancelled']
+                record.status in OPEN_TASK_STATUSES
             )
 
     def _search_is_overdue(self, operator, value):
         """Enable searching by overdue status"""
         today = fields.Date.today()
         if (operator == '=' and value) or (operator == '!=' and not value):
-            # Search for overdue tasks
+            # Search for overdue tasks (served by api_task_open_due_date_idx)
             return [
                 ('due_date', '<', today),
-                ('status', 'not in', ['done', 'cancelled'])
+                ('status', 'in', list(OPEN_TASK_STATUSES))
             ]
         else:
             # Search for not overdue tasks
@@ -214,24 +366,58 @@ class ApiTask(models.Model):
 
     # ========== CRUD Override Examples ==========
 
-    @api.model
-    def create(self, vals):
+    @api.model_create_multi
+    def create(self, vals_list):
         """Override create to set default due date if not provided"""
-        if not vals.get('due_date'):
-            # Default to 7 days from now
-            vals['due_date'] = fields.Date.today() + timedelta(days=7)
-
-        return super(ApiTask, self).create(vals)
+        default_due_date = fields.Date.today() + timedelta(days=7)
+        for vals in vals_list:
+            if not vals.get('due_date'):
+                # Default to 7 days from now
+                vals['due_date'] = default_due_date
+
+        tasks = super(ApiTask, self).create(vals_list)
+        self.env['api.user.profile'].sudo()._adjust_counts(
+            'tasks_count', Counter(task.assigned_to.id for task in tasks)
+        )
+        tasks._bus_track(created=True)
+        return tasks
 
     def write(self, vals):
-        """Override write to auto-update progress based on status"""
+        """
+        Override write to auto-update progress based on status
+
+        Also tracks the change for the bus (see _bus_publish);
+        action_start, action_complete and action_cancel go through here.
+        """
         if vals.get('status') == 'done' and 'progress' not in vals:
             vals['progress'] = 100
             vals['completed_date'] = fields.Datetime.now()
         elif vals.get('status') == 'todo' and 'progress' not in vals:
             vals['progress'] = 0
 
-        return super(ApiTask, self).write(vals)
+        # Keep assignee profile task counters in sync on reassignment
+        deltas = Counter()
+        if 'assigned_to' in vals:
+            deltas.subtract(task.assigned_to.id for task in self)
+        if BUS_EVENT_FIELDS.intersection(vals):
+            self._bus_track()
+
+        result = super(ApiTask, self).write(vals)
+
+        if 'assigned_to' in vals:
+            deltas.update(task.assigned_to.id for task in self)
+            self.env['api.user.profile'].sudo()._adjust_counts('tasks_count', deltas)
+        return result
+
+    def unlink(self):
+        """Override unlink to keep assignee task counters in sync"""
+        deltas = Counter()
+        deltas.subtract(task.assigned_to.id for task in self)
+        self._bus_track()
+
+        result = super(ApiTask, self).unlink()
+        self.env['api.user.profile'].sudo()._adjust_counts('tasks_count', deltas)
+        return result
 
     # ========== Search/Filter Helper Methods ==========
 
@@ -249,3 +435,65 @@ class ApiTask(models.Model):
     def get_tasks_by_priority(self, priority):
         """Get tasks by priority level"""
         return self.search([('priority', '=', str(priority))])
+
+    @api.model
+    def get_stats(self, domain=None, breakdowns=()):
+        """
+        Compute task statistics with a single aggregate query
+
+        Every bucket (status, priority, overdue, my tasks) is a domain that
+        the ORM compiles to SQL; all of them become COUNT(*) FILTER (...)
+        columns of one SELECT over the rows matching ``domain``.
+
+        Optional breakdowns ('project', 'assignee') add one grouped query
+        each.
+        """
+        domain = domain or []
+        buckets = [('total', None)]
+        for status, _label in self._fields['status'].selection:
+            buckets.append((('by_status', status), [('status', '=', status)]))
+        for priority, key in PRIORITY_STAT_KEYS.items():
+            buckets.append((('by_priority', key), [('priority', '=', priority)]))
+        buckets.append(('overdue', [('is_overdue', '=', True)]))
+        buckets.append(('my_tasks', [('assigned_to', '=', self.env.user.id)]))
+
+        aggregates = []
+        for _key, bucket_domain in buckets:
+            if bucket_domain is None:
+                aggregates.append(SQL("COUNT(*)"))
+            else:
+                condition = self._where_calc(bucket_domain).where_clause
+                aggregates.append(SQL("COUNT(*) FILTER (WHERE %s)", condition))
+
+        self.flush_model(['status', 'priority', 'due_date', 'assigned_to', 'project_name'])
+        query = self._search(domain)
+        self.env.cr.execute(query.select(*aggregates))
+        counts = self.env.cr.fetchone()
+
+        stats = {}
+        for (key, _bucket_domain), count in zip(buckets, counts):
+            if isinstance(key, tuple):
+                stats.setdefault(key[0], {})[key[1]] = count
+            else:
+                stats[key] = count
+
+        if 'project' in breakdowns:
+            stats['by_project'] = [
+                {'project_name': project_name or None, 'count': count}
+                for project_name, count in self._read_group(
+                    domain, ['project_name'], ['__count'], order='__count desc'
+                )
+            ]
+
+        if 'assignee' in breakdowns:
+            stats['by_assignee'] = [
+                {
+                    'assigned_to': {'id': user.id, 'name': user.name} if user else None,
+                    'count': count,
+                }
+                for user, count in self._read_group(
+                    domain, ['assigned_to'], ['__count'], order='__count desc'
+                )
+            ]
+
+        return stats
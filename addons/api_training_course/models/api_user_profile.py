@@ -5,21 +5,70 @@ User Profile Model - Training Example
 This model demonstrates:
 - One2one relationship (extending res.users)
 - Binary fields (for images/files)
+- Thumbnail variants derived once, when the avatar changes
 - JSON fields
 - Email validation
 - Complex data structures
+- Tracking-free writes of counters and system fields (fast-write mixin)
+- Delta sync with tombstones (api.sync.mixin)
 """
 
+import base64
+import logging
+
 from odoo import models, fields, api
-from odoo.exceptions import ValidationError
+from odoo.exceptions import MissingError, ValidationError
+from odoo.tools import SQL
 import re
 import json
 
+from .. import avatar_images
+
+_logger = logging.getLogger(__name__)
+
+
+def split_list(text):
+    """Parse a comma-separated string (skills, interests) into a list"""
+    if text:
+        return [item.strip() for item in text.split(',') if item.strip()]
+    return []
+
+
+def social_links(values):
+    """Social media links from a mapping of the profile's link fields"""
+    links = {}
+    if values['linkedin_url']:
+        links['linkedin'] = values['linkedin_url']
+    if values['github_username']:
+        links['github'] = f'https://github.com/{values["github_username"]}'
+    if values['twitter_handle']:
+        handle = values['twitter_handle'].lstrip('@')
+        links['twitter'] = f'https://twitter.com/{handle}'
+    if values['website']:
+        links['website'] = values['website']
+    return links
+
+
+# Fields social_links() reads
+SOCIAL_LINK_FIELDS = ['linkedin_url', 'github_username', 'twitter_handle', 'website']
+
+# Avatar variant size (px) -> field storing it
+AVATAR_FIELDS = {512: 'avatar', 128: 'avatar_128', 64: 'avatar_64'}
+
+# Per-worker user -> profile id cache: {(dbname, user id): profile id}.
+# Only existing profiles are cached, and entries are checked on use (see
+# ApiUserProfile._profile_for_user), so no invalidation across workers is
+# needed. Cleared when it outgrows PROFILE_ID_CACHE_SIZE.
+PROFILE_ID_CACHE_SIZE = 100000
+_profile_ids = {}
+
 
 class ApiUserProfile(models.Model):
     _name = 'api.user.profile'
     _description = 'Extended User Profile for API Training'
     _order = 'user_id'
+    _inherit = ['api.fast.write.mixin', 'api.sync.mixin']
+    _fast_write_fields = ('posts_count', 'tasks_count', 'profile_views', 'last_login')
 
     # Link to system user (one-to-one relationship)
     user_id = fields.Many2one(
@@ -45,7 +94,25 @@ class ApiUserProfile(models.Model):
     avatar = fields.Binary(
         string='Avatar',
         attachment=True,
-        help='Profile picture'
+        help='Profile picture (square WebP, at most 512 px)'
+    )
+
+    avatar_128 = fields.Binary(
+        string='Avatar 128',
+        attachment=True,
+        readonly=True
+    )
+
+    avatar_64 = fields.Binary(
+        string='Avatar 64',
+        attachment=True,
+        readonly=True
+    )
+
+    avatar_hash = fields.Char(
+        string='Avatar Hash',
+        readonly=True,
+        help='Content hash of the uploaded avatar, part of its immutable URLs'
     )
 
     avatar_url = fields.Char(
@@ -178,14 +245,19 @@ class ApiUserProfile(models.Model):
         readonly=True
     )
 
+    # Stored counters, kept up to date by api.blog.post / api.task CRUD
+    # through _adjust_counts(); recompute_counts() repairs them.
     posts_count = fields.Integer(
         string='Blog Posts',
-        compute='_compute_posts_count'
+        default=0,
+        readonly=True,
+        index=True
     )
 
     tasks_count = fields.Integer(
         string='Tasks',
-        compute='_compute_tasks_count'
+        default=0,
+        readonly=True
     )
 
     # Metadata
@@ -212,32 +284,226 @@ class ApiUserProfile(models.Model):
         help='Is the profile active?'
     )
 
-    # ========== Computed Methods ==========
+    _sql_constraints = [
+        ('user_uniq', 'unique(user_id)', 'Each user can only have one profile'),
+    ]
 
-    @api.depends('user_id')
-    def _compute_posts_count(self):
-        """Count blog posts by this user"""
-        for record in self:
-            record.posts_count = self.env['api.blog.post'].search_count([
-                ('author_id', '=', record.user_id.id)
-            ])
+    # ========== Database Setup ==========
 
-    @api.depends('user_id')
-    def _compute_tasks_count(self):
-        """Count tasks assigned to this user"""
-        for record in self:
-            record.tasks_count = self.env['api.task'].search_count([
-                ('assigned_to', '=', record.user_id.id)
-            ])
+    def init(self):
+        """Initialize the stored counters and avatar variants on install/upgrade"""
+        self.env.cr.execute(f"""
+            CREATE INDEX IF NOT EXISTS api_user_profile_sync_idx
+                ON {self._table} (write_date, id)
+        """)
+        self.recompute_counts()
+        self._backfill_avatar_variants()
 
-    # ========== Constraints ==========
+    # ========== Counter Maintenance ==========
 
-    @api.constrains('user_id')
-    def _check_unique_user(self):
-        """Ensure one profile per user"""
-        for record in self:
-            if self.search_count([('user_id', '=', record.user_id.id)]) > 1:
-                raise ValidationError('Each user can only have one profile')
+    # counter field -> (source model, user field on that model)
+    _count_sources = {
+        'posts_count': ('api.blog.post', 'author_id'),
+        'tasks_count': ('api.task', 'assigned_to'),
+    }
+
+    @api.model
+    def _adjust_counts(self, field_name, deltas):
+        """
+        Apply counter deltas in one UPDATE
+
+        deltas: mapping {user_id: delta}, e.g. a Counter built from the
+        author/assignee ids before and after a change. Falsy user ids and
+        zero deltas are ignored.
+        """
+        self._fast_add(field_name, deltas, key='user_id')
+
+    @api.model
+    def recompute_counts(self, profile_ids=None):
+        """
+        Recompute posts_count and tasks_count from scratch (repair command)
+
+        One UPDATE ... FROM per counter, over all profiles or only
+        profile_ids. Usable from a shell:
+            env['api.user.profile'].recompute_counts()
+        """
+        self.flush_model(['user_id'])
+        profile_filter = SQL('WHERE p.id = ANY(%s)', list(profile_ids)) if profile_ids is not None else SQL()
+
+        for field_name, (model_name, user_field) in self._count_sources.items():
+            Source = self.env[model_name]
+            Source.flush_model([user_field])
+            self.env.cr.execute(SQL(
+                """
+                UPDATE %(table)s AS t
+                   SET %(column)s = counts.total
+                  FROM (
+                        SELECT p.id, COUNT(s.id) AS total
+                          FROM %(table)s AS p
+                     LEFT JOIN %(source)s AS s ON s.%(user_field)s = p.user_id
+                          %(profile_filter)s
+                      GROUP BY p.id
+                       ) AS counts
+                 WHERE t.id = counts.id
+                   AND t.%(column)s IS DISTINCT FROM counts.total
+                """,
+                table=SQL.identifier(self._table),
+                column=SQL.identifier(field_name),
+                source=SQL.identifier(Source._table),
+                user_field=SQL.identifier(user_field),
+                profile_filter=profile_filter,
+            ))
+
+        self.invalidate_model(list(self._count_sources))
+        return True
+
+    # ========== User -> Profile Lookup ==========
+
+    @api.model
+    def _remember_profile_ids(self, profiles):
+        if len(_profile_ids) >= PROFILE_ID_CACHE_SIZE:
+            _profile_ids.clear()
+        dbname = self.env.cr.dbname
+        for profile in profiles:
+            _profile_ids[(dbname, profile.user_id.id)] = profile.id
+
+    @api.model
+    def _forget_profile_ids(self, profiles):
+        dbname = self.env.cr.dbname
+        for profile in profiles:
+            key = (dbname, profile.user_id.id)
+            if _profile_ids.get(key) == profile.id:
+                del _profile_ids[key]
+
+    @api.model
+    def _profile_for_user(self, user_id):
+        """
+        Profile of a user (empty recordset if none)
+
+        A cached id is checked against the profile's user_id. Reading it
+        prefetches the row the caller is about to serialize anyway, so a
+        hit costs no extra query; an entry made stale by an unlink or a
+        reassignment in another worker is dropped and looked up again.
+
+        Read-only (replica) transactions neither use nor fill the cache:
+        the replica may lag behind the primary.
+        """
+        use_cache = not self.env.cr.readonly
+        key = (self.env.cr.dbname, user_id)
+        profile_id = _profile_ids.get(key) if use_cache else None
+        if profile_id:
+            profile = self.browse(profile_id)
+            try:
+                if profile.user_id.id == user_id:
+                    return profile
+            except MissingError:
+                pass
+            _profile_ids.pop(key, None)
+
+        self.env.cr.execute(SQL(
+            'SELECT id FROM %s WHERE user_id = %s',
+            SQL.identifier(self._table), user_id,
+        ))
+        row = self.env.cr.fetchone()
+        if not row:
+            return self.browse()
+        profile = self.browse(row[0])
+        if use_cache:
+            self._remember_profile_ids(profile)
+        return profile
+
+    @api.model
+    def _insert_profile(self, user_id):
+        """
+        INSERT ... ON CONFLICT (user_id) DO NOTHING a profile with the field defaults
+
+        Returns the new profile, or an empty recordset if user_id already
+        has a profile visible to this transaction. If a concurrent request
+        committed one after this transaction's snapshot, PostgreSQL raises
+        SerializationFailure (REPEATABLE READ) and Odoo replays the request
+        on a fresh snapshot, which sees that profile.
+        """
+        vals = self._add_missing_default_values({'user_id': user_id})
+        columns = {
+            name: self._fields[name].convert_to_column_insert(value, self)
+            for name, value in vals.items()
+            if self._fields[name].store and self._fields[name].column_type
+        }
+        now = self.env.cr.now()
+        columns.update(create_uid=self.env.uid, create_date=now, write_uid=self.env.uid, write_date=now)
+
+        self.env.cr.execute(SQL(
+            'INSERT INTO %s (%s) VALUES %s ON CONFLICT (user_id) DO NOTHING RETURNING id',
+            SQL.identifier(self._table),
+            SQL(', ').join(SQL.identifier(name) for name in columns),
+            tuple(columns.values()),
+        ))
+        row = self.env.cr.fetchone()
+        return self.browse(row[0]) if row else self.browse()
+
+    @api.model
+    def get_or_create_for_user(self, user_id):
+        """
+        Profile of a user, created on first access
+
+        A cached lookup costs no extra query. A missing profile is inserted
+        with ON CONFLICT (user_id) DO NOTHING (see _insert_profile), so two
+        requests racing to create it both end up with the same profile.
+        """
+        profile = self._profile_for_user(user_id)
+        if profile:
+            return profile
+
+        profile = self._insert_profile(user_id)
+        if profile:
+            profile.recompute_counts(profile.ids)
+            self._remember_profile_ids(profile)
+            return profile
+        return self._profile_for_user(user_id)
+
+    # ========== Avatar Variants ==========
+
+    @api.model
+    def _avatar_values(self, data):
+        """
+        Field values storing an avatar: its size variants and content hash
+
+        data: the uploaded image bytes (falsy to remove the avatar).
+        Raises ValidationError for unsupported or corrupt images.
+        """
+        if not data:
+            return dict.fromkeys([*AVATAR_FIELDS.values(), 'avatar_hash'], False)
+        try:
+            variants = avatar_images.make_variants(data)
+        except ValueError as e:
+            raise ValidationError(str(e))
+        values = {AVATAR_FIELDS[size]: base64.b64encode(content) for size, content in variants.items()}
+        values['avatar_hash'] = avatar_images.content_hash(data)
+        return values
+
+    def _with_avatar_values(self, vals):
+        """vals with the avatar variants, when a raw avatar is written"""
+        if 'avatar' in vals and 'avatar_hash' not in vals:
+            data = base64.b64decode(vals['avatar']) if vals['avatar'] else b''
+            vals = dict(vals, **self._avatar_values(data))
+        return vals
+
+    def set_avatar(self, data):
+        """Store an uploaded image (bytes) as the avatar of these profiles"""
+        return self.write(self._avatar_values(data))
+
+    @api.model
+    def _backfill_avatar_variants(self):
+        """Derive the variants of avatars stored before they existed"""
+        profiles = self.search([('avatar', '!=', False), ('avatar_hash', '=', False)])
+        for profile in profiles:
+            try:
+                with self.env.cr.savepoint():
+                    profile.set_avatar(base64.b64decode(profile.avatar))
+            except ValidationError as e:
+                _logger.warning(f'Cannot derive avatar variants of profile {profile.id}: {str(e)}')
+
+    # ========== Constraints ==========
 
     @api.constrains('phone')
     def _check_phone_format(self):
@@ -280,10 +546,8 @@ class ApiUserProfile(models.Model):
     # ========== Business Methods ==========
 
     def action_increment_views(self):
-        """Increment profile view count"""
-        for record in self:
-            record.profile_views += 1
-        return True
+        """Increment profile view count (buffered, see api.view.hit)"""
+        return self.env['api.view.hit'].sudo().record_hit(self)
 
     def action_verify_account(self):
         """Mark account as verified"""
@@ -291,38 +555,23 @@ class ApiUserProfile(models.Model):
         return True
 
     def action_update_last_login(self):
-        """Update last login timestamp"""
-        self.write({'last_login': fields.Datetime.now()})
-        return True
+        """Update last login timestamp (system field: no write() overhead)"""
+        return self._fast_write({'last_login': fields.Datetime.now()})
 
     def get_skills_list(self):
         """Parse skills string into list"""
         self.ensure_one()
-        if self.skills:
-            return [s.strip() for s in self.skills.split(',') if s.strip()]
-        return []
+        return split_list(self.skills)
 
     def get_interests_list(self):
         """Parse interests string into list"""
         self.ensure_one()
-        if self.interests:
-            return [i.strip() for i in self.interests.split(',') if i.strip()]
-        return []
+        return split_list(self.interests)
 
     def get_social_links(self):
         """Get all social media links"""
         self.ensure_one()
-        links = {}
-        if self.linkedin_url:
-            links['linkedin'] = self.linkedin_url
-        if self.github_username:
-            links['github'] = f'https://github.com/{self.github_username}'
-        if self.twitter_handle:
-            handle = self.twitter_handle.lstrip('@')
-            links['twitter'] = f'https://twitter.com/{handle}'
-        if self.website:
-            links['website'] = self.website
-        return links
+        return social_links(self)
 
     # ========== CRUD Override Examples ==========
 
@@ -331,13 +580,28 @@ class ApiUserProfile(models.Model):
         """Override create to set defaults"""
         if 'account_created' not in vals:
             vals['account_created'] = fields.Datetime.now()
+        vals = self._with_avatar_values(vals)
 
-        return super(ApiUserProfile, self).create(vals)
+        profile = super(ApiUserProfile, self).create(vals)
+        profile.recompute_counts(profile.ids)
+        return profile
 
     def write(self, vals):
         """Override write for additional logic"""
         # Strip @ from Twitter handle if provided
         if 'twitter_handle' in vals and vals['twitter_handle']:
             vals['twitter_handle'] = vals['twitter_handle'].lstrip('@')
-
-        return super(ApiUserProfile, self).write(vals)
+        # Avatar set from the back office: derive the variants too
+        vals = self._with_avatar_values(vals)
+
+        if 'user_id' in vals:
+            self._forget_profile_ids(self)
+        result = super(ApiUserProfile, self).write(vals)
+        if 'user_id' in vals:
+            self.recompute_counts(self.ids)
+        return result
+
+    def unlink(self):
+        """Override unlink to drop the cached user -> profile mapping"""
+        self._forget_profile_ids(self)
+        return super(ApiUserProfile, self).unlink()
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Buffered View Hit Model - Training Example
+
+This model demonstrates:
+- Write-behind counters (buffer now, aggregate later)
+- Append-only side tables instead of hot-row updates
+- Raw SQL with odoo.tools.SQL for bulk operations
+- Scheduled actions (cron) doing batch work
+
+How it works:
+1. GET endpoints call record_hit(); hits are added to an in-memory,
+   per-process buffer. The request transaction never touches the post or
+   profile row, so it takes no row lock and writes no tracking values.
+2. The buffer is spilled to the api_view_hit table with one multi-row
+   INSERT on a separate cursor: by record_hit() once it holds
+   SPILL_MAX_HITS hits, by a timer thread SPILL_MAX_AGE seconds after its
+   first hit (so an idle worker spills too), and when the worker exits
+   (recycled after its request or memory limits).
+3. A cron folds the side table into the counters with one
+   UPDATE ... SET view_count = view_count + delta per model (_fast_add).
+
+Hits buffered in a worker that is killed (SIGKILL, hard memory limit)
+before spilling are lost; view counters are statistics, so that
+trade-off is acceptable.
+"""
+
+import atexit
+import logging
+import threading
+from collections import Counter
+
+from odoo import models, fields, api
+from odoo.modules.registry import Registry
+from odoo.tools import SQL
+
+_logger = logging.getLogger(__name__)
+
+# Spill the in-memory buffer after this many hits or this many seconds
+SPILL_MAX_HITS = 100
+SPILL_MAX_AGE = 10.0
+
+# Per-process buffer: {dbname: Counter({(res_model, res_id): hits})}
+_hit_buffer = {}
+_hit_buffer_lock = threading.Lock()
+
+
+def spill_buffer(dbname):
+    """Move buffered hits of a database to the side table; returns the rows inserted"""
+    with _hit_buffer_lock:
+        buffer = _hit_buffer.pop(dbname, None)
+
+    if not buffer:
+        return 0
+
+    values = SQL(', ').join(
+        SQL('(%s, %s, %s)', res_model, res_id, hits)
+        for (res_model, res_id), hits in buffer.items()
+    )
+    try:
+        # Separate cursor: the calling (read-only) transaction stays clean
+        with Registry(dbname).cursor() as cr:
+            cr.execute(SQL(
+                'INSERT INTO %s (res_model, res_id, hits) VALUES %s',
+                SQL.identifier(ApiViewHit._table), values,
+            ))
+    except Exception as e:
+        _logger.warning(f'Could not spill {len(buffer)} buffered view hits of {dbname}: {str(e)}')
+        return 0
+    return len(buffer)
+
+
+@atexit.register
+def spill_all_buffers():
+    """Spill every database's buffer (worker exit)"""
+    for dbname in list(_hit_buffer):
+        spill_buffer(dbname)
+
+
+class ApiViewHit(models.Model):
+    _name = 'api.view.hit'
+    _description = 'Buffered View Hit'
+    _log_access = False
+
+    res_model = fields.Char(
+        string='Model',
+        required=True,
+        index=True
+    )
+
+    res_id = fields.Integer(
+        string='Record ID',
+        required=True
+    )
+
+    hits = fields.Integer(
+        string='Hits',
+        default=1
+    )
+
+    # Counter column updated for each supported model
+    _counter_fields = {
+        'api.blog.post': 'view_count',
+        'api.user.profile': 'profile_views',
+    }
+
+    # ========== Buffering ==========
+
+    @api.model
+    def record_hit(self, records):
+        """Buffer one view hit for each record (no database write)"""
+        if records._name not in self._counter_fields:
+            raise ValueError(f'View counting is not enabled for {records._name}')
+
+        dbname = self.env.cr.dbname
+        with _hit_buffer_lock:
+            buffer = _hit_buffer.get(dbname)
+            if buffer is None:
+                buffer = _hit_buffer[dbname] = Counter()
+                # Spill a new buffer once it is SPILL_MAX_AGE old, even if
+                # this worker serves no other request by then
+                timer = threading.Timer(SPILL_MAX_AGE, spill_buffer, args=(dbname,))
+                timer.daemon = True
+                timer.start()
+            for res_id in records.ids:
+                buffer[(records._name, res_id)] += 1
+            size = sum(buffer.values())
+
+        if size >= SPILL_MAX_HITS:
+            self._spill_buffer()
+        return True
+
+    @api.model
+    def _spill_buffer(self):
+        """Move buffered hits of this database to the side table"""
+        return spill_buffer(self.env.cr.dbname)
+
+    # ========== Flushing ==========
+
+    @api.model
+    def _flush_hits(self):
+        """
+        Fold the side table into the counters
+
+        For each model, one statement deletes the pending hits; they are
+        summed per record and applied as view_count = view_count + delta
+        with one bulk UPDATE.
+        Hits inserted concurrently stay in the table for the next run.
+        """
+        self._spill_buffer()
+
+        updated = 0
+        for res_model, field_name in self._counter_fields.items():
+            self.env.cr.execute(SQL(
+                'DELETE FROM %s WHERE res_model = %s RETURNING res_id, hits',
+                SQL.identifier(self._table), res_model,
+            ))
+            deltas = Counter()
+            for res_id, hits in self.env.cr.fetchall():
+                deltas[res_id] += hits
+            # Counter columns are fast-write fields (see api.fast.write.mixin)
+            updated += self.env[res_model]._fast_add(field_name, deltas)
+
+        return updated
+
+    @api.model
+    def _cron_flush_view_hits(self):
+        """Scheduled action: apply buffered view hits to the counters"""
+        updated = self._flush_hits()
+        if updated:
+            _logger.info(f'Flushed buffered view hits into {updated} records')
+        return True
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP Dispatch Hooks - Training Example
+
+This model demonstrates:
+- Extending ir.http to run code around every controller call
+- Measuring latency, response size and SQL usage per route
+- Debug timing headers (Server-Timing, X-Query-Count)
+- Structured slow-request logging
+- Warming precomputed documentation responses at registry load
+- Rejecting oversize uploads from Content-Length, before the body is read
+
+Only /api/training/* routes are measured. Routes are labelled with their
+template (e.g. /api/training/tasks/<int:task_id>), so label cardinality
+stays bounded by the number of endpoints.
+"""
+
+import json
+import logging
+import threading
+import time
+
+from werkzeug.exceptions import RequestEntityTooLarge
+
+from odoo import models
+from odoo.http import request
+
+from .. import avatar_images
+from .. import metrics
+from .. import profiling
+from ..controllers import api_docs
+from ..controllers import responses
+
+_slow_logger = logging.getLogger('odoo.addons.api_training_course.slow_requests')
+
+# Per-thread state of the request being measured
+_current = threading.local()
+
+
+def _query_totals():
+    """SQL statement count and time of this thread, as tracked by Odoo"""
+    thread = threading.current_thread()
+    return getattr(thread, 'query_count', 0), getattr(thread, 'query_time', 0.0)
+
+
+class IrHttp(models.AbstractModel):
+    _inherit = 'ir.http'
+
+    # Route -> largest accepted request body, checked before it is parsed
+    _api_upload_limits = {
+        '/api/training/users/profile/avatar': avatar_images.MAX_UPLOAD_SIZE,
+    }
+
+    def _register_hook(self):
+        super()._register_hook()
+        # Build the static documentation responses once, at registry load
+        api_docs.get_document('welcome')
+
+    @classmethod
+    def _pre_dispatch(cls, rule, args):
+        super()._pre_dispatch(rule, args)
+        cls._check_upload_size(rule)
+        if rule.rule.startswith('/api/training'):
+            query_count, query_time = _query_totals()
+            _current.state = (rule.rule, request.httprequest.method, time.perf_counter(), query_count, query_time)
+            profiling.start()
+        else:
+            _current.state = None
+            profiling.stop()
+
+    @classmethod
+    def _check_upload_size(cls, rule):
+        """413 for a declared body size over the route's limit (chunked bodies are spooled, then checked while read)"""
+        limit = cls._api_upload_limits.get(rule.rule)
+        content_length = request.httprequest.content_length
+        if limit and content_length and content_length > limit:
+            raise RequestEntityTooLarge(response=responses.error_response(
+                f'Request body too large. Maximum size: {limit} bytes', status=413,
+            ))
+
+    @classmethod
+    def _dispatch(cls, endpoint):
+        try:
+            return super()._dispatch(endpoint)
+        except Exception:
+            state = getattr(_current, 'state', None)
+            cls._observe_api_request(500, None)
+            profile = profiling.stop()
+            if state is not None and profile is not None:
+                try:
+                    cls._log_slow_request(state[0], 500, profile)
+                except Exception:
+                    # The transaction may be aborted; never mask the real error
+                    pass
+            raise
+
+    @classmethod
+    def _post_dispatch(cls, response):
+        super()._post_dispatch(response)
+        state = getattr(_current, 'state', None)
+        profile = profiling.stop()
+        if state is not None and profile is not None:
+            if cls._wants_profile_headers():
+                response.headers['Server-Timing'] = profile.server_timing()
+                response.headers['X-Query-Count'] = str(profile.query_count)
+            cls._log_slow_request(state[0], response.status_code, profile)
+
+        response_size = None
+        if not response.is_streamed:
+            response_size = response.content_length
+            if response_size is None:
+                response_size = len(response.get_data())
+        cls._observe_api_request(response.status_code, response_size)
+
+    @classmethod
+    def _observe_api_request(cls, status, response_size):
+        """Record metrics for the measured request, once"""
+        state = getattr(_current, 'state', None)
+        if state is None:
+            return
+        _current.state = None
+
+        route, method, started, query_count, query_time = state
+        total_count, total_time = _query_totals()
+        metrics.observe_request(
+            route, method, status,
+            duration=time.perf_counter() - started,
+            response_size=response_size,
+            query_count=total_count - query_count,
+            query_time=total_time - query_time,
+        )
+
+    @classmethod
+    def _wants_profile_headers(cls):
+        """
+        Timing headers for internal users in debug mode, or for admins
+        sending X-Api-Profile: 1
+
+        Anyone, the public user included, can turn debug mode on with
+        ?debug=1: it alone must not expose SQL counts and timings.
+        """
+        user = request.env.user
+        if not user:
+            return False
+        if request.session.debug:
+            return user._is_internal()
+        if request.httprequest.headers.get('X-Api-Profile') == '1':
+            return user._is_admin()
+        return False
+
+    @classmethod
+    def _log_slow_request(cls, route, status, profile):
+        """Write requests over the threshold to the slow-request log"""
+        params = request.env['ir.config_parameter'].sudo()
+        threshold_ms = float(params.get_param('api_training_course.slow_request_ms', '1000'))
+        timings = profile.timings()
+        if timings['total'] * 1000 < threshold_ms:
+            return
+
+        top_n = int(params.get_param('api_training_course.slow_request_top_n', '5'))
+        entry = {
+            'route': route,
+            'path': request.httprequest.path,
+            'method': request.httprequest.method,
+            'status': status,
+            'duration_ms': round(timings['total'] * 1000, 2),
+            'db_ms': round(timings['db'] * 1000, 2),
+            'orm_ms': round(timings['orm'] * 1000, 2),
+            'serialize_ms': round(timings['serialize'] * 1000, 2),
+            'query_count': profile.query_count,
+            'top_statements': profile.top_statements(top_n),
+        }
+        _slow_logger.warning('slow request %s', json.dumps(entry))
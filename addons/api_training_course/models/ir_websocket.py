@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+"""
+Websocket Subscriptions - Training Example
+
+This model demonstrates:
+- Extending ir.websocket to filter the channels a client subscribes to
+
+Any websocket client may ask for any named channel; task channels (see
+task_events) are dropped from the subscription of users who may not read
+tasks.
+"""
+
+from odoo import models
+
+from .. import task_events
+
+
+class IrWebsocket(models.AbstractModel):
+    _inherit = 'ir.websocket'
+
+    def _build_bus_channel_list(self, channels):
+        channels = [
+            channel for channel in channels
+            if task_events.can_subscribe(self.env.user, channel)
+        ]
+        return super()._build_bus_channel_list(channels)
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+Per-Request Profiling - Training Example
+
+This module demonstrates:
+- Hooking into Odoo's SQL execution (thread query_hooks)
+- Splitting request time into DB, ORM/application and serialization time
+- Server-Timing response headers
+- Structured slow-request logging
+
+A RequestProfile is started by the ir.http dispatch hooks for every
+/api/training/* request. Odoo's cursor calls each function in
+threading.current_thread().query_hooks after every statement; the
+profile registers one to count statements, sum their time and keep
+per-statement totals for the slow-request log.
+"""
+
+import contextlib
+import threading
+import time
+
+_current = threading.local()
+
+# Longest statement text kept in the slow-request log
+MAX_STATEMENT_LENGTH = 500
+
+
+class RequestProfile:
+    """SQL and timing statistics of one request"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.query_count = 0
+        self.db_time = 0.0
+        self.serialize_time = 0.0
+        self.statements = {}
+
+    def query_hook(self, cr, query, params, start, delay):
+        """Called by Odoo's cursor after each executed statement"""
+        self.query_count += 1
+        self.db_time += delay
+        text = str(getattr(query, 'code', query))
+        count, total = self.statements.get(text, (0, 0.0))
+        self.statements[text] = (count + 1, total + delay)
+
+    def total_time(self):
+        return time.perf_counter() - self.started
+
+    def timings(self):
+        """Split of the request time in seconds: db, serialize, orm, total"""
+        total = self.total_time()
+        return {
+            'db': self.db_time,
+            'serialize': self.serialize_time,
+            'orm': max(total - self.db_time - self.serialize_time, 0.0),
+            'total': total,
+        }
+
+    def top_statements(self, limit):
+        """The limit statements with the highest total time"""
+        ranked = sorted(self.statements.items(), key=lambda item: item[1][1], reverse=True)
+        return [
+            {
+                'query': text[:MAX_STATEMENT_LENGTH],
+                'count': count,
+                'total_ms': round(total * 1000, 2),
+            }
+            for text, (count, total) in ranked[:limit]
+        ]
+
+    def server_timing(self):
+        """Value of the Server-Timing header"""
+        timings = self.timings()
+        return ', '.join([
+            f'db;dur={timings["db"] * 1000:.2f};desc="{self.query_count} queries"',
+            f'orm;dur={timings["orm"] * 1000:.2f}',
+            f'serialize;dur={timings["serialize"] * 1000:.2f}',
+            f'total;dur={timings["total"] * 1000:.2f}',
+        ])
+
+
+def start():
+    """Start profiling the current request on this thread"""
+    stop()
+    profile = RequestProfile()
+    thread = threading.current_thread()
+    hooks = getattr(thread, 'query_hooks', None)
+    if hooks is None:
+        hooks = thread.query_hooks = []
+    hooks.append(profile.query_hook)
+    _current.profile = profile
+    return profile
+
+
+def stop():
+    """Stop profiling and return the finished profile (or None)"""
+    profile = getattr(_current, 'profile', None)
+    if profile is None:
+        return None
+    _current.profile = None
+    hooks = getattr(threading.current_thread(), 'query_hooks', [])
+    if profile.query_hook in hooks:
+        hooks.remove(profile.query_hook)
+    return profile
+
+
+def current():
+    return getattr(_current, 'profile', None)
+
+
+class timed(contextlib.ContextDecorator):
+    """
+    Count the wrapped code as serialization time of the current request
+
+    Usable as a decorator or a context manager. SQL executed inside is
+    still counted as DB time, not serialization time.
+    """
+
+    def _recreate_cm(self):
+        # Fresh state per decorated call (thread-safe, re-entrant)
+        return self.__class__()
+
+    def __enter__(self):
+        profile = current()
+        if profile is not None:
+            self._start = (profile, time.perf_counter(), profile.db_time)
+        else:
+            self._start = None
+        return self
+
+    def __exit__(self, *exc):
+        if self._start is not None:
+            profile, started, db_time = self._start
+            elapsed = time.perf_counter() - started
+            profile.serialize_time += max(elapsed - (profile.db_time - db_time), 0.0)
+        return False
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Read Replica Routing - Training Example
+
+This module demonstrates:
+- Serving read-only routes from a PostgreSQL streaming replica
+- Falling back to the primary when the replica lags behind
+- Keeping side effects (view counters) off the read-only transaction
+
+Odoo 18 opens the cursor of a route declared with readonly=... on the
+replica configured in the Odoo configuration file (db_replica_host,
+db_replica_port); without one, it opens a read-only transaction on the
+primary. Public GET routes of the API pass use_replica, which answers
+False, i.e. "use the primary", while the replica's replay lag exceeds
+api_training_replica_max_lag seconds (default 5) or cannot be measured.
+
+The lag is measured at most once every LAG_CHECK_INTERVAL seconds per
+worker. A replica whose WAL receiver is not streaming (disconnected from
+the primary, restarting) has no measurable lag: its data may be
+arbitrarily old, so it is not used until it streams again. The database
+user needs pg_read_all_stats to see the receiver's status; without it,
+only the presence of a WAL receiver process is checked. A handler that writes anyway makes PostgreSQL raise
+ReadOnlySqlTransaction, and Odoo replays the request on the primary, so
+a missed write is slow but never lost. View hits are buffered in memory
+and spilled through a separate primary cursor (see api.view.hit).
+
+Try it with a second local PostgreSQL streaming from the first one:
+    db_replica_host = localhost
+    db_replica_port = 5433
+    api_training_replica_max_lag = 5
+"""
+
+import logging
+import threading
+import time
+
+from odoo import sql_db
+from odoo.http import request
+from odoo.tools import config
+
+from . import metrics
+
+_logger = logging.getLogger(__name__)
+
+LAG_CHECK_INTERVAL = 2.0
+DEFAULT_MAX_LAG = 5.0
+
+# Seconds the replica is behind: 0 when it replayed everything it received
+# from a streaming WAL receiver (an idle primary must not look like a
+# lagging replica), NULL (unknown) without one, no lag at all when the
+# "replica" is the primary itself. status is NULL for users without
+# pg_read_all_stats.
+LAG_QUERY = """
+    SELECT CASE
+               WHEN NOT pg_is_in_recovery() THEN 0
+               WHEN NOT EXISTS (
+                   SELECT 1 FROM pg_stat_wal_receiver
+                    WHERE status = 'streaming' OR status IS NULL
+               ) THEN NULL
+               WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+               ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+           END
+"""
+
+# {dbname: (checked at, lag in seconds or None)}
+_lag_cache = {}
+_lag_lock = threading.Lock()
+
+ROUTING = metrics.registry.counter(
+    'api_training_replica_routing_total',
+    'Read-only requests per database target (replica, or primary and why)',
+    ('target',),
+)
+
+
+def max_lag():
+    return float(config.get('api_training_replica_max_lag') or DEFAULT_MAX_LAG)
+
+
+def measure_lag(dbname):
+    """Replay lag of the read-only database in seconds, None if unknown (raises on failure)"""
+    with sql_db.db_connect(dbname, readonly=True).cursor() as cr:
+        cr.execute(LAG_QUERY)
+        lag = cr.fetchone()[0]
+        return None if lag is None else float(lag)
+
+
+def replica_lag(dbname):
+    """Lag of the read-only database, cached per worker; None if unknown"""
+    now = time.monotonic()
+    with _lag_lock:
+        checked, lag = _lag_cache.get(dbname, (None, None))
+        if checked is not None and now - checked < LAG_CHECK_INTERVAL:
+            return lag
+        # Other threads keep the previous value while this one measures
+        _lag_cache[dbname] = (now, lag)
+
+    try:
+        lag = measure_lag(dbname)
+    except Exception as e:
+        _logger.warning(f'Cannot measure the replica lag of {dbname}: {str(e)}')
+        lag = None
+    with _lag_lock:
+        _lag_cache[dbname] = (now, lag)
+    return lag
+
+
+def use_replica(*_args):
+    """
+    readonly= value of the routes that may run on the replica
+
+    Odoo calls it when dispatching the request (with the controller).
+    """
+    lag = replica_lag(request.db)
+    if lag is None:
+        target = 'primary_unavailable'
+    elif lag > max_lag():
+        target = 'primary_lag'
+    else:
+        target = 'replica'
+    with metrics.registry.lock:
+        ROUTING.inc((target,))
+    return target == 'replica'
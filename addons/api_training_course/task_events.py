@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""
+Task Change Events - Training Example
+
+This module demonstrates:
+- Pushing changes to clients over the Odoo bus instead of client polling
+- Named bus channels per assignee and per project
+- Checking channel subscriptions server-side
+
+api.task publishes a compact event on the bus for every task it creates,
+writes (including action_start / action_complete / action_cancel) or
+deletes. The event goes to the channel of the task's assignee and to the
+channel of its project, plus the previous ones when a task is reassigned
+or moved, so both sides see it leave. Events are built right before the
+commit, from the net change of the transaction as the database holds it:
+changes rolled back, by the transaction or by one of its savepoints (e.g.
+a failed row of a bulk request), are never pushed. The bus notifies
+subscribers after the commit.
+
+Clients open the Odoo websocket (/websocket) with their session cookie
+and subscribe to the channels returned by GET /api/training/tasks/subscribe.
+Only internal users may subscribe to task channels (see ir.websocket).
+"""
+
+NOTIFICATION_TYPE = 'api_training/task'
+
+CHANNEL_PREFIX = 'api_training.tasks'
+ASSIGNEE = 'assignee'
+PROJECT = 'project'
+
+
+def assignee_channel(user_id):
+    return f'{CHANNEL_PREFIX}:{ASSIGNEE}:{user_id}'
+
+
+def project_channel(project_name):
+    return f'{CHANNEL_PREFIX}:{PROJECT}:{project_name}'
+
+
+def task_channels(user_id, project_name):
+    """Channels of a task with this assignee and project"""
+    channels = []
+    if user_id:
+        channels.append(assignee_channel(user_id))
+    if project_name:
+        channels.append(project_channel(project_name))
+    return channels
+
+
+def is_task_channel(channel):
+    return isinstance(channel, str) and channel.startswith(f'{CHANNEL_PREFIX}:')
+
+
+def can_subscribe(user, channel):
+    """
+    Whether user may listen to a channel
+
+    Channels of other addons are not ours to check. Task channels carry
+    what GET /api/training/tasks shows to every internal user.
+    """
+    return not is_task_channel(channel) or user._is_internal()
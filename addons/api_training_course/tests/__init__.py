@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+from . import test_user_profile
+from . import test_sync_api
+from . import test_keyset
+from . import test_task_events
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Keyset Pagination Tests - Training Example
+
+Covers api.keyset.mixin: walking every page must return each record once,
+in ORDER BY order, including rows whose sort key is NULL, for ascending
+and descending keys; malformed cursor values must raise ValueError.
+"""
+
+import base64
+import json
+
+from odoo.tests import TransactionCase, tagged
+
+
+def _cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip('=')
+
+
+@tagged('post_install', '-at_install')
+class TestKeysetPagination(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Task = cls.env['api.task']
+        cls.Post = cls.env['api.blog.post']
+        cls.project = 'Keyset Test'
+        # priority DESC, due_date ASC (NULLs last), id DESC: ties and NULLs
+        # at every level
+        cls.tasks = cls.Task.create([
+            {'name': f'Keyset task {i}', 'project_name': cls.project, 'priority': priority, 'due_date': due_date}
+            for i, (priority, due_date) in enumerate([
+                ('2', '2026-03-01'), ('2', '2026-03-01'), ('2', '2026-01-15'),
+                ('1', '2026-02-01'), ('1', '2026-02-01'), ('0', '2026-01-01'),
+            ])
+        ])
+        # create() defaults an empty due date: clear some afterwards
+        cls.null_tasks = cls.Task.create([
+            {'name': f'Keyset undated {i}', 'project_name': cls.project, 'priority': priority}
+            for i, priority in enumerate(['2', '2', '1'])
+        ])
+        cls.null_tasks.write({'due_date': False})
+
+        # published_date DESC (NULLs first), id DESC
+        cls.tag = 'keyset-test'
+        for i, published in enumerate([
+            '2026-01-01 10:00:00', '2026-01-01 10:00:00', '2026-02-01 10:00:00', False, False,
+        ]):
+            cls.Post.create({'title': f'Keyset post {i}', 'content': 'Body', 'tags': cls.tag, 'published_date': published})
+
+    def _walk(self, Model, domain, limit):
+        """Ids of every page, following next_cursor until the last page"""
+        ids, cursor = [], None
+        while True:
+            records, cursor = Model._keyset_search(domain, limit, cursor=cursor)
+            ids.extend(records.ids)
+            if cursor is None:
+                return ids
+
+    def test_walk_tasks(self):
+        domain = [('project_name', '=', self.project)]
+        expected = self.Task.search(domain, order=self.Task._keyset_order_by()).ids
+        self.assertEqual(len(expected), 9)
+        for limit in (1, 2, 4, 9, 10):
+            self.assertEqual(self._walk(self.Task, domain, limit), expected, f'limit={limit}')
+
+    def test_walk_posts(self):
+        domain = [('tags', '=', self.tag)]
+        expected = self.Post.search(domain, order=self.Post._keyset_order_by()).ids
+        self.assertEqual(len(expected), 5)
+        # NULL dates sort first in DESC order
+        self.assertFalse(self.Post.browse(expected[0]).published_date)
+        for limit in (1, 2, 3, 5):
+            self.assertEqual(self._walk(self.Post, domain, limit), expected, f'limit={limit}')
+
+    def test_cursor_roundtrip(self):
+        task = self.null_tasks[0]
+        self.assertEqual(self.Task._keyset_decode(task._keyset_encode()), ['2', None, task.id])
+
+    def test_invalid_cursor_values(self):
+        invalid = [
+            ['2', '2026-01-01', 'abc'],      # id must be an integer
+            ['2', '2026-01-01', True],       # booleans are not integers
+            ['2', '2026-01-01', None],       # ids are never NULL
+            ['9', '2026-01-01', 1],          # not a priority
+            [2, '2026-01-01', 1],            # selection values are strings
+            ['2', '2026-13-01', 1],          # not a date
+            ['2', 20260101, 1],
+            ['2', '2026-01-01'],             # missing key
+        ]
+        for values in invalid:
+            with self.assertRaises(ValueError, msg=values):
+                self.Task._keyset_search([], 10, cursor=_cursor(values))
+
+        with self.assertRaises(ValueError):
+            self.Post._keyset_search([], 10, cursor=_cursor(['yesterday', 1]))
+        with self.assertRaises(ValueError):
+            self.Post._keyset_search([], 10, cursor='not base64 json')
+
+    def test_invalid_limit(self):
+        for limit in (0, -1):
+            with self.assertRaises(ValueError, msg=limit):
+                self.Task._keyset_search([], limit)
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Task Bus Event Tests - Training Example
+
+Covers the task change events of task_events: they are built at commit
+from the net change of the transaction, so work rolled back to a
+savepoint (as by a failed bulk row) is never pushed.
+"""
+
+import json
+
+from odoo.exceptions import ValidationError
+from odoo.tests import TransactionCase, tagged
+
+from .. import task_events
+
+
+@tagged('post_install', '-at_install')
+class TestTaskBusEvents(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Task = cls.env['api.task']
+        cls.user = cls.env['res.users'].create({'name': 'Bus Test', 'login': 'bus.test@example.com'})
+        cls.channel = task_events.assignee_channel(cls.user.id)
+
+    def _commit_events(self):
+        """Run the precommit hooks, as a commit would; return the payloads sent on the channel"""
+        last_id = self.env['bus.bus'].sudo().search([], order='id desc', limit=1).id or 0
+        self.env.cr.precommit.run()
+        notifications = self.env['bus.bus'].sudo().search([('id', '>', last_id)], order='id')
+        return [
+            json.loads(notification.message)['payload']
+            for notification in notifications
+            if json.loads(notification.channel)[-1] == self.channel
+        ]
+
+    def _rolled_back(self, func):
+        with self.assertRaises(ValidationError):
+            with self.env.cr.savepoint():
+                func()
+                raise ValidationError('Rolled back')
+
+    def test_rolled_back_create(self):
+        kept = self.Task.create({'name': 'Kept', 'assigned_to': self.user.id})
+        self._rolled_back(lambda: self.Task.create({'name': 'Phantom', 'assigned_to': self.user.id}))
+
+        events = self._commit_events()
+        self.assertEqual([(event['event'], event['id']) for event in events], [('created', kept.id)])
+
+    def test_net_change(self):
+        task = self.Task.create({'name': 'Tracked', 'assigned_to': self.user.id})
+        self._commit_events()
+
+        # Rolled back: nothing to publish
+        self._rolled_back(lambda: task.write({'status': 'done'}))
+        self.assertEqual(self._commit_events(), [])
+
+        # Written twice, published once with the net change
+        task.write({'status': 'in_progress'})
+        task.write({'name': 'Renamed'})
+        self._rolled_back(lambda: task.write({'priority': '3'}))
+        events = self._commit_events()
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]['event'], 'updated')
+        self.assertEqual(events[0]['changed'], ['name', 'status'])
+        self.assertEqual(events[0]['previous_status'], 'todo')
+        self.assertEqual(events[0]['priority'], task.priority)
+
+        # A rolled back deletion is no deletion
+        self._rolled_back(task.unlink)
+        self.assertEqual(self._commit_events(), [])
+
+        task_id = task.id
+        task.unlink()
+        events = self._commit_events()
+        self.assertEqual([(event['event'], event['id']) for event in events], [('deleted', task_id)])
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+User Profile Tests - Training Example
+
+Covers get_or_create_for_user(), including the race of two requests
+creating the same profile: the second one must be replayed by Odoo, never
+see an empty profile.
+"""
+
+import psycopg2
+
+from odoo import api, SUPERUSER_ID
+from odoo.tests import TransactionCase, tagged
+from odoo.tools import mute_logger
+
+
+@tagged('post_install', '-at_install')
+class TestProfileGetOrCreate(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Profile = cls.env['api.user.profile']
+        cls.user = cls.env['res.users'].create({'name': 'Profile Test', 'login': 'profile.test@example.com'})
+
+    def test_creates_once(self):
+        profile = self.Profile.get_or_create_for_user(self.user.id)
+        self.assertTrue(profile)
+        self.assertEqual(profile.user_id, self.user)
+        self.assertEqual(self.Profile.get_or_create_for_user(self.user.id), profile)
+        self.assertEqual(self.Profile.search_count([('user_id', '=', self.user.id)]), 1)
+
+    def test_stale_cache_entry(self):
+        profile = self.Profile.get_or_create_for_user(self.user.id)
+        # Deleted behind the ORM, as by another worker: the cached id is stale
+        self.env.cr.execute('DELETE FROM api_user_profile WHERE id = %s', [profile.id])
+        self.env.invalidate_all()
+
+        recreated = self.Profile.get_or_create_for_user(self.user.id)
+        self.assertTrue(recreated)
+        self.assertNotEqual(recreated.id, profile.id)
+        self.assertEqual(recreated.user_id, self.user)
+
+    def test_concurrent_create(self):
+        # A user both transactions can see: committed before this test's snapshot
+        user = self.env.ref('base.public_user')
+        if self.Profile.search_count([('user_id', '=', user.id)]):
+            self.skipTest('The public user already has a profile')
+
+        # Another request creates and commits the profile after this
+        # transaction's snapshot was taken
+        with self.registry.cursor() as cr:
+            other = api.Environment(cr, SUPERUSER_ID, {})['api.user.profile'].get_or_create_for_user(user.id)
+            other_id = other.id
+        self.addCleanup(self._delete_committed_profile, other_id)
+
+        # This transaction cannot see it: the request must be replayed
+        with self.assertRaises(psycopg2.errors.SerializationFailure), mute_logger('odoo.sql_db'):
+            with self.env.cr.savepoint():
+                self.Profile.get_or_create_for_user(user.id)
+
+        # The replayed request runs on a fresh snapshot and finds it
+        with self.registry.cursor() as cr:
+            replayed = api.Environment(cr, SUPERUSER_ID, {})['api.user.profile'].get_or_create_for_user(user.id)
+            self.assertEqual(replayed.id, other_id)
+
+    def _delete_committed_profile(self, profile_id):
+        with self.registry.cursor() as cr:
+            cr.execute('DELETE FROM api_user_profile WHERE id = %s', [profile_id])